@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from agent_smeder.core import PolicyError, execute_operation
-
 
 @dataclass(frozen=True)
 class FrontdoorResult:
@@ -106,6 +104,8 @@ def build_parser() -> argparse.ArgumentParser:
 def run_frontdoor(*, workspace_root: Path, argv: list[str] | None = None) -> FrontdoorResult:
     parser = build_parser()
     args = parser.parse_args(argv)
+    # Core pas na het parsen laden: --help en parse-fouten blijven snel
+    from agent_smeder.core import PolicyError, execute_operation
 
     try:
         result = execute_operation(
@@ -14,6 +14,7 @@ Usage:
     python scripts/canon-curator.py onderhoud-overzicht --opdracht "inventariseer doctrines"
     python scripts/canon-curator.py stel-voor-canonwijziging --aanleiding "lacune X" --gebied "doctrines" --type-voorstel "toevoeging"
     python scripts/canon-curator.py valideer-handoff --handoff-bestand "handoff.md"
+    python scripts/canon-curator.py valideer-handoffs --glob "docs/**/handoff*.md" --jobs 8 --formaat junit --output rapport.xml
     python scripts/canon-curator.py publiceer-normatieve-wijziging --handoff-id "handoff-x-y-20260114-001" --handoff-bestand "handoff.md"
 
 De runner leest charter en prompts voor betekenis/regels, en voert deterministische stappen uit.
@@ -28,6 +29,12 @@ from pathlib import Path
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
 RESULTS_DIR = WORKSPACE_ROOT / "docs" / "resultaten" / "canon-curator"
+INDEX_FILE = WORKSPACE_ROOT / ".canon-curator" / "index.sqlite"
+GRAPH_FILE = WORKSPACE_ROOT / ".canon-curator" / "graph.json"
+RULES_FILE = WORKSPACE_ROOT / ".canon-curator" / "rules.json"
+HANDOFF_CACHE_FILE = WORKSPACE_ROOT / ".canon-curator" / "handoffs.json"
+STAGING_DIR = WORKSPACE_ROOT / ".canon-curator" / "staging"
+PUBLISH_DIR = WORKSPACE_ROOT / ".canon-curator" / "publicaties"
 
 
 def _timestamp_for_filename(now: datetime | None = None) -> str:
@@ -36,6 +43,15 @@ def _timestamp_for_filename(now: datetime | None = None) -> str:
     return now.strftime("%y%m%d-%H%M%S")
 
 
+def _artifact_index():
+    """Artefact-index van de workspace, bijgewerkt met het corpus op disk."""
+    from canon_curator.index import ArtifactIndex
+
+    index = ArtifactIndex(INDEX_FILE, WORKSPACE_ROOT)
+    index.refresh()
+    return index
+
+
 def op_onderhoud_overzicht(
     *,
     opdracht: str,
@@ -53,51 +69,68 @@ def op_onderhoud_overzicht(
     timestamp = _timestamp_for_filename()
     rapport_path = RESULTS_DIR / f"rapport-{timestamp}.md"
     
-    # Placeholder implementatie - in productie zou dit artefacten scannen en analyseren
-    scope_desc = f" (scope: {scope})" if scope else " (scope: all)"
-    
-    rapport_content = f"""# Canon Curator Rapport — {output_formaat.capitalize()}
+    if output_formaat == "lacunes":
+        from canon_curator.lacunes import build_matrix
+        from canon_curator.rapport import render_lacunes
 
-**Timestamp**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Opdracht**: {opdracht}  
-**Scope**: {scope or 'all'}  
-**Output formaat**: {output_formaat}
+        matrix = build_matrix(WORKSPACE_ROOT)
+        rapport_path.write_text(render_lacunes(matrix, opdracht=opdracht, scope=scope), encoding="utf-8")
+        print(f"OK: Rapport gegenereerd ({len(matrix.boundaries)} agent(s), {len(matrix.missing)} lacune(s))")
+        print(f"Output: {rapport_path.relative_to(WORKSPACE_ROOT).as_posix()}")
+        return 0
 
----
+    from canon_curator.scanner import SCOPE_ROOTS
 
-## Samenvatting
+    index = _artifact_index()
+    catalogue = index.catalogue(SCOPE_ROOTS[scope or "all"])
+    if output_formaat == "overzicht":
+        from canon_curator.rapport import render_overzicht
 
-Dit is een placeholder rapport. In productie zou de canon-curator:
-- Alle normatieve artefacten scannen in de workspace
-- Metadata extraheren (versie, datum, status)
-- Relaties analyseren
-- Inconsistenties detecteren
-- Lacunes identificeren
+        rapport_content = render_overzicht(catalogue, opdracht=opdracht, scope=scope)
+    elif output_formaat == "inconsistenties":
+        from canon_curator.graph import load_graph
+        from canon_curator.rapport import render_inconsistenties
+        from canon_curator.rules import RuleContext, evaluate
 
-## Geraadpleegde artefacten
+        context = RuleContext(WORKSPACE_ROOT, index.catalogue(SCOPE_ROOTS["all"]), load_graph(index, GRAPH_FILE))
+        outcomes = evaluate(context, index.digests(), RULES_FILE)
+        rapport_content = render_inconsistenties(catalogue, outcomes, opdracht=opdracht, scope=scope)
+    else:
+        from canon_curator.graph import load_graph
+        from canon_curator.rapport import render_relaties
 
-(Placeholder - zou lijst van gescande bestanden bevatten)
+        graph = load_graph(index, GRAPH_FILE)
+        rapport_content = render_relaties(catalogue, graph, opdracht=opdracht, scope=scope)
+    rapport_path.write_text(rapport_content, encoding="utf-8")
+    print(f"OK: Rapport gegenereerd ({len(catalogue)} artefact(en))")
+    print(f"Output: {rapport_path.relative_to(WORKSPACE_ROOT).as_posix()}")
+    return 0
 
-## Bevindingen
 
-(Placeholder - zou concrete bevindingen bevatten op basis van {output_formaat})
+def _betrokken_artefacten(index, gebied: str) -> list:
+    """Artefacten voor een gebied: een scope, of anders een zoekopdracht in de index."""
+    from canon_curator.scanner import SCOPE_ROOTS
 
-## Aanbevelingen
+    roots = SCOPE_ROOTS.get(gebied.strip().lower())
+    if roots is not None:
+        return list(index.catalogue(roots))
+    return [a for a in map(index.get, index.search(gebied, limit=10)) if a is not None]
 
-(Placeholder - zou concrete aanbevelingen bevatten)
 
----
+def _huidige_situatie(artifacts: list, gebied: str) -> str:
+    """Sectie ``Huidige situatie``: de betrokken artefacten met versie en status."""
+    if not artifacts:
+        return f"Geen artefacten gevonden voor gebied '{gebied}'."
 
-**Let op**: Dit rapport is gegenereerd als placeholder. Implementeer volledige functionaliteit volgens:
-- governance/charters-agents/charter.canon-curator.md
-- .github/prompts/canon-curator-onderhoud-overzicht.prompt.md
-"""
-    
-    rapport_path.write_text(rapport_content, encoding="utf-8")
-    
-    print(f"OK: Rapport gegenereerd")
-    print(f"Output: {rapport_path.relative_to(WORKSPACE_ROOT).as_posix()}")
-    return 0
+    lines = ["Betrokken artefacten (uit de artefact-index):", ""]
+    for artifact in artifacts:
+        details = ", ".join(
+            f"{label} {value}"
+            for label, value in (("versie", artifact.version), ("status", artifact.status))
+            if value
+        )
+        lines.append(f"- `{artifact.path}`" + (f" ({details})" if details else ""))
+    return "\n".join(lines)
 
 
 def op_stel_voor_canonwijziging(
@@ -110,7 +143,12 @@ def op_stel_voor_canonwijziging(
     """Operatie: stel-voor-canonwijziging
     
     Stelt wijzigingen voor aan canon op basis van lacunes/inconsistenties.
+    De impact wordt berekend over de verwijzingsgraaf van het corpus.
     """
+    from canon_curator.graph import load_graph
+    from canon_curator.impact import analyse_impact
+    from canon_curator.rapport import render_impact
+
     # Ensure results directory exists
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -119,8 +157,11 @@ def op_stel_voor_canonwijziging(
     onderwerp = gebied.replace(" ", "-").lower()
     voorstel_path = RESULTS_DIR / f"voorstel-{onderwerp}-{timestamp}.md"
     
-    # Placeholder implementatie - in productie zou dit analyse doen en gestructureerd voorstel maken
     context_sectie = f"\n\n## Context\n\n{context}" if context else ""
+    index = _artifact_index()
+    artifacts = _betrokken_artefacten(index, gebied)
+    huidige_situatie = _huidige_situatie(artifacts, gebied)
+    impact = analyse_impact(load_graph(index, GRAPH_FILE), (artifact.path for artifact in artifacts))
     
     voorstel_content = f"""# Canon Wijzigingsvoorstel — {gebied.capitalize()}
 
@@ -136,7 +177,7 @@ def op_stel_voor_canonwijziging(
 
 ## Huidige situatie
 
-(Placeholder - zou beschrijving van huidige toestand bevatten)
+{huidige_situatie}
 
 ## Voorgestelde wijziging
 
@@ -144,7 +185,7 @@ def op_stel_voor_canonwijziging(
 
 ## Impact
 
-(Placeholder - zou impactanalyse bevatten op andere artefacten)
+{render_impact(impact)}
 
 ## Aanbeveling
 
@@ -176,11 +217,13 @@ def op_valideer_handoff(
     
     Valideert een handoff voor normatieve wijzigingen conform charter v1.1 clausule.
     
-    Controleert:
+    Controleert (zie canon_curator.handoff):
     1. Handoff bestaat en is leesbaar
-    2. Bevat geldige tijdreferentie
-    3. Verplichte leesbronnen zijn gespecificeerd
-    4. Betrekking op juiste workspace-domein
+    2. Handoff ID, status en geldige tijdreferentie
+    3. Routing (from/to)
+    4. Verplichte leesbronnen zijn gespecificeerd (inclusief workspace state)
+       en bestaan in de workspace; hun digests worden gerapporteerd
+    5. Acceptance criteria aanwezig
     """
     handoff_path = WORKSPACE_ROOT / handoff_bestand
     
@@ -188,69 +231,112 @@ def op_valideer_handoff(
         print(f"ERROR: Handoff bestand niet gevonden: {handoff_bestand}", file=sys.stderr)
         return 1
     
-    # Lees handoff content
+    from canon_curator.handoff import SEVERITY_ERROR, read_handoff, resolve_reads, validate_handoff
+    from canon_curator.paths import PathIndex
+
+    # Lees en parse handoff (één doorgang, met regelnummers)
     try:
-        handoff_content = handoff_path.read_text(encoding="utf-8")
-    except Exception as exc:
+        handoff = read_handoff(handoff_path)
+    except (OSError, UnicodeDecodeError) as exc:
         print(f"ERROR: Kan handoff niet lezen: {exc}", file=sys.stderr)
         return 1
-    
-    # Validatie checks (placeholder - in productie zou dit gestructureerde parsing zijn)
-    validatie_errors = []
-    validatie_warnings = []
-    
-    # Check 1: Handoff ID aanwezig
-    if "## Handoff ID" not in handoff_content:
-        validatie_errors.append("Handoff ID sectie ontbreekt")
-    
-    # Check 2: Tijdreferentie aanwezig
-    if "## Timestamp + Status" not in handoff_content:
-        validatie_errors.append("Timestamp + Status sectie ontbreekt")
-    elif "exacte tijd niet beschikbaar" not in handoff_content and "CET" not in handoff_content:
-        validatie_warnings.append("Tijdreferentie mogelijk onvolledig (geen CET of toelichting)")
-    
-    # Check 3: Required reads gespecificeerd
-    if "## Required Reads" not in handoff_content:
-        validatie_errors.append("Required Reads sectie ontbreekt")
-    
-    # Check 4: Workspace state in required reads
-    if "state-" not in handoff_content:
-        validatie_warnings.append("Workspace state mogelijk niet in required reads")
-    
-    # Check 5: Acceptance criteria aanwezig
-    if "## Acceptance Criteria" not in handoff_content:
-        validatie_errors.append("Acceptance Criteria sectie ontbreekt")
-    
+
+    reads, read_issues = resolve_reads(handoff.read_targets(), PathIndex.build(WORKSPACE_ROOT))
+    issues = sorted(validate_handoff(handoff) + read_issues, key=lambda issue: (issue.line is not None, issue.line or 0))
+    validatie_errors = [issue for issue in issues if issue.severity == SEVERITY_ERROR]
+    validatie_warnings = [issue for issue in issues if issue.severity != SEVERITY_ERROR]
+
+    def _locatie(issue) -> str:
+        return f"{handoff_bestand}:{issue.line}: " if issue.line else ""
+
     # Rapportage
     if validatie_errors:
         print(f"ERROR: Handoff validatie gefaald voor {handoff_bestand}", file=sys.stderr)
         for error in validatie_errors:
-            print(f"  ❌ {error}", file=sys.stderr)
-        if validatie_warnings:
-            for warning in validatie_warnings:
-                print(f"  ⚠️  {warning}", file=sys.stderr)
+            print(f"  ❌ {_locatie(error)}{error.message}", file=sys.stderr)
+        for warning in validatie_warnings:
+            print(f"  ⚠️  {_locatie(warning)}{warning.message}", file=sys.stderr)
         return 1
-    
+
+    def _print_reads() -> None:
+        # Vastgepinde versies van de required reads
+        for read in reads:
+            if read.digest:
+                print(f"  📖 {read.path} (sha256:{read.digest[:12]}, regel {read.line})")
+
     if validatie_warnings:
         print(f"OK: Handoff geldig met waarschuwingen voor {handoff_bestand}")
         for warning in validatie_warnings:
-            print(f"  ⚠️  {warning}")
+            print(f"  ⚠️  {_locatie(warning)}{warning.message}")
+        _print_reads()
         return 0
-    
+
     print(f"OK: Handoff volledig geldig voor {handoff_bestand}")
-    print(f"  ✅ Handoff ID aanwezig")
-    print(f"  ✅ Tijdreferentie correct")
-    print(f"  ✅ Required reads gespecificeerd")
-    print(f"  ✅ Acceptance criteria aanwezig")
+    print(f"  ✅ Handoff ID aanwezig ({handoff.id.value}, regel {handoff.id.line})")
+    print(f"  ✅ Tijdreferentie correct ({handoff.created.value}, regel {handoff.created.line})")
+    print(f"  ✅ Required reads gespecificeerd ({len(handoff.required_reads)})")
+    print(f"  ✅ Acceptance criteria aanwezig ({len(handoff.acceptance_criteria)})")
+    _print_reads()
     return 0
 
 
+def op_valideer_handoffs(
+    *,
+    patronen: list[str],
+    jobs: int | None,
+    formaat: str,
+    output: str | None,
+) -> int:
+    """Operatie: valideer-handoffs
+
+    Valideert alle handoffs die op de glob-patronen passen, parallel en met
+    een cache op content-hash (ongewijzigde handoffs worden overgeslagen).
+    Uitvoer als tekst, JSON of JUnit XML; exitcode 1 als een handoff fouten heeft.
+    """
+    from canon_curator.sweep import find_handoffs, to_json, to_junit, validate_handoffs
+
+    paths = find_handoffs(WORKSPACE_ROOT, patronen)
+    if not paths:
+        print(f"ERROR: Geen handoffs gevonden voor {', '.join(patronen)}", file=sys.stderr)
+        return 1
+
+    summary = validate_handoffs(WORKSPACE_ROOT, paths, HANDOFF_CACHE_FILE, jobs=jobs)
+    if formaat == "tekst":
+        lines = []
+        for result in summary.results:
+            for issue in result.issues:
+                locatie = f"{result.path}:{issue.line}" if issue.line else result.path
+                lines.append(f"  {'❌' if issue.severity == 'fout' else '⚠️ '} {locatie}: {issue.message}")
+        rapport = "\n".join(lines)
+    else:
+        rapport = to_json(summary) if formaat == "json" else to_junit(summary)
+
+    if output:
+        output_path = WORKSPACE_ROOT / output
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(rapport + "\n", encoding="utf-8")
+    elif rapport:
+        print(rapport)
+
+    status = "ERROR" if summary.invalid else "OK"
+    stream = sys.stderr if summary.invalid else sys.stdout
+    print(
+        f"{status}: {len(summary.results)} handoff(s), {len(summary.invalid)} ongeldig, "
+        f"{summary.cached} uit cache ({summary.duration_ms:.0f} ms)",
+        file=stream,
+    )
+    if output:
+        print(f"Output: {output}", file=stream)
+    return 1 if summary.invalid else 0
+
+
 def op_publiceer_normatieve_wijziging(
     *,
     handoff_id: str,
     handoff_bestand: str,
     validatie_mode: str,
     dry_run: bool,
+    terugdraaien: bool = False,
 ) -> int:
     """Operatie: publiceer-normatieve-wijziging
     
@@ -264,87 +350,156 @@ def op_publiceer_normatieve_wijziging(
     5. Actualiseer normatief-stelsel-ping (indien nodig)
     6. Archiveer handoff
     7. Rapporteer publicatie
+    
+    Stap 3-6 vormen één transactie (zie canon_curator.publish): ze slagen
+    samen of worden samen teruggedraaid. Een onderbroken publicatie wordt
+    bij een nieuwe aanroep met dezelfde handoff-id hervat; met
+    ``terugdraaien`` wordt hij ongedaan gemaakt.
     """
+    import shutil
+
+    from canon_curator.publish import PublishError, Transaction, handoff_dir
+    from kernel.timing import format_timestamp
+
+    try:
+        tx_dir = handoff_dir(PUBLISH_DIR, handoff_id)
+        staging_dir = handoff_dir(STAGING_DIR, handoff_id)
+    except PublishError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
     # Ensure results directory exists
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
     handoff_path = WORKSPACE_ROOT / handoff_bestand
-    
-    # Stap 1: Valideer handoff
-    if validatie_mode != "skip":
-        print(f"Stap 1/7: Valideer handoff-structuur...")
-        validatie_result = op_valideer_handoff(handoff_bestand=handoff_bestand)
-        if validatie_result != 0 and validatie_mode == "volledig":
-            print(f"ERROR: Handoff-validatie gefaald, publicatie afgebroken", file=sys.stderr)
+    transaction = Transaction(WORKSPACE_ROOT, tx_dir)
+
+    if terugdraaien:
+        try:
+            aborted = transaction.abort()
+        except PublishError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 1
+        if not aborted:
+            print(f"ERROR: Geen onderbroken publicatie voor {handoff_id}", file=sys.stderr)
             return 1
-        elif validatie_result != 0:
-            print(f"WARNING: Handoff-validatie had waarschuwingen, maar publicatie gaat door (alleen-structuur mode)")
+        print(f"OK: Onderbroken publicatie {handoff_id} teruggedraaid")
+        return 0
+
+    resume = transaction.load() is not None and not dry_run
+    operations = meta = None
+    if resume:
+        print(f"Hervat onderbroken publicatie {handoff_id} (stap 1-2 al uitgevoerd)")
     else:
-        print(f"Stap 1/7: Validatie overgeslagen (skip mode)")
-    
-    # Stap 2: Accepteer handoff (placeholder)
-    print(f"Stap 2/7: Accepteer handoff {handoff_id}")
-    if dry_run:
-        print(f"  [DRY RUN] Zou handoff accepteren")
-    
-    # Stap 3: Publiceer wijzigingen (placeholder)
-    print(f"Stap 3/7: Publiceer normatieve wijzigingen")
-    if dry_run:
-        print(f"  [DRY RUN] Zou artefacten bijwerken conform handoff payload")
-    
-    # Stap 4: Registreer in workspace state (placeholder)
-    print(f"Stap 4/7: Registreer wijzigingen in workspace state")
-    if dry_run:
-        print(f"  [DRY RUN] Zou change log entry toevoegen")
-    
-    # Stap 5: Actualiseer ping (placeholder)
-    print(f"Stap 5/7: Beoordeel normatief-stelsel-ping")
-    if dry_run:
-        print(f"  [DRY RUN] Zou ping actualiseren indien aannames geïnvalideerd")
-    
-    # Stap 6: Archiveer handoff (placeholder)
-    print(f"Stap 6/7: Archiveer handoff")
-    if dry_run:
-        print(f"  [DRY RUN] Zou handoff status op 'accepted' zetten")
+        from canon_curator.handoff import read_handoff
+        from canon_curator.publish import plan_publication
+
+        # Stap 1: Valideer handoff
+        if validatie_mode != "skip":
+            print(f"Stap 1/7: Valideer handoff-structuur...")
+            validatie_result = op_valideer_handoff(handoff_bestand=handoff_bestand)
+            if validatie_result != 0 and validatie_mode == "volledig":
+                print(f"ERROR: Handoff-validatie gefaald, publicatie afgebroken", file=sys.stderr)
+                return 1
+            elif validatie_result != 0:
+                print(f"WARNING: Handoff-validatie had waarschuwingen, maar publicatie gaat door (alleen-structuur mode)")
+        else:
+            print(f"Stap 1/7: Validatie overgeslagen (skip mode)")
+        
+        # Stap 2: Accepteer handoff (ID moet overeenkomen met het bestand)
+        print(f"Stap 2/7: Accepteer handoff {handoff_id}")
+        try:
+            handoff = read_handoff(handoff_path)
+        except (OSError, UnicodeDecodeError) as exc:
+            print(f"ERROR: Kan handoff niet lezen: {exc}", file=sys.stderr)
+            return 1
+        if handoff.id is None or handoff.id.value != handoff_id:
+            gevonden = handoff.id.value if handoff.id else "geen"
+            print(f"ERROR: Handoff ID komt niet overeen (bestand: {gevonden})", file=sys.stderr)
+            return 1
+
+        # Stap 3-6: Plan de transactie
+        try:
+            plan = plan_publication(WORKSPACE_ROOT, handoff, handoff_bestand, staging_dir)
+        except (PublishError, OSError) as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 1
+        operations = plan.operations
+        meta = {
+            "handoff_id": handoff_id,
+            "handoff_bestand": handoff_bestand,
+            "validatie_mode": validatie_mode,
+            "timestamp": format_timestamp(),
+            "artifacts": [list(artifact) for artifact in plan.artifacts],
+            "state_path": plan.state_path,
+            "change_log": plan.change_log,
+            "pinged": plan.pinged,
+            "archive_path": plan.archive_path,
+        }
+        print(f"Stap 3/7: Publiceer normatieve wijzigingen ({len(plan.artifacts)} artefact(en))")
+        print(f"Stap 4/7: Registreer wijzigingen in {plan.state_path}")
+        print(f"Stap 5/7: Normatief-stelsel-ping {'actualiseren' if plan.pinged else 'ongewijzigd'}")
+        print(f"Stap 6/7: Archiveer handoff naar {plan.archive_path}")
+        if dry_run:
+            for operation in operations:
+                print(f"  [DRY RUN] {operation.action} {operation.target} ({operation.kind})")
+
+    if not dry_run:
+        try:
+            manifest, applied, _ = transaction.run(operations, meta)
+        except (PublishError, OSError) as exc:
+            print(f"ERROR: Publicatie teruggedraaid: {exc}", file=sys.stderr)
+            return 1
+        meta = manifest["meta"]
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        print(f"  {applied} bestandsoperatie(s) uitgevoerd")
     
     # Stap 7: Rapporteer publicatie
     print(f"Stap 7/7: Genereer publicatierapport")
     timestamp = _timestamp_for_filename()
     rapport_path = RESULTS_DIR / f"publicatie-{handoff_id}-{timestamp}.md"
     
+    artefact_regels = "\n".join(
+        f"| `{path}` | {version or '-'} | `{digest[:12]}` | {'gestaged' if staged else 'al op doelpad'} |"
+        for path, version, digest, staged in meta["artifacts"]
+    )
     rapport_content = f"""# Publicatierapport — {handoff_id}
 
-**Timestamp**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S CET')}  
+**Timestamp**: {meta['timestamp']}  
 **Handoff ID**: {handoff_id}  
-**Handoff bestand**: {handoff_bestand}  
-**Validatie mode**: {validatie_mode}  
+**Handoff bestand**: {meta['handoff_bestand']}  
+**Validatie mode**: {meta['validatie_mode']}  
 **Dry run**: {dry_run}
 
 ---
 
 ## Handoff-validatie
 
-{'Validatie succesvol (structuur en tijdreferentie correct)' if validatie_mode != 'skip' else 'Validatie overgeslagen'}
+{'Validatie succesvol (structuur en tijdreferentie correct)' if meta['validatie_mode'] != 'skip' else 'Validatie overgeslagen'}
 
 ## Gepubliceerde artefacten
 
-(Placeholder - zou lijst van bijgewerkte artefacten met versienummers bevatten)
+| Artefact | Versie | Digest | Bron |
+|---|---|---|---|
+{artefact_regels}
 
 ## Workspace state wijzigingen
 
-(Placeholder - zou change log entry bevatten)
+Change log entry in `{meta['state_path']}`:
+
+{meta['change_log']}
 
 ## Normatief-stelsel-ping
 
-(Placeholder - zou ping-wijziging bevatten indien van toepassing)
+{'normatief-stelsel.ping geactualiseerd (doctrine of beleid gewijzigd)' if meta['pinged'] else 'Ongewijzigd (geen doctrine of beleid gewijzigd)'}
 
 ## Status
 
-{'[DRY RUN] Geen wijzigingen doorgevoerd' if dry_run else 'Publicatie voltooid, handoff geaccepteerd'}
+{'[DRY RUN] Geen wijzigingen doorgevoerd' if dry_run else f"Publicatie voltooid, handoff geaccepteerd en gearchiveerd in `{meta['archive_path']}`"}
 
 ---
 
-**Let op**: Dit rapport is gegenereerd als placeholder. Implementeer volledige functionaliteit volgens:
+Gegenereerd volgens:
 - governance/charters-agents/charter.canon-curator.md (v1.2, Kerntaak 7)
 - .github/prompts/canon-curator-publiceer-normatieve-wijziging.prompt.md
 """
@@ -436,6 +591,38 @@ def build_parser() -> argparse.ArgumentParser:
         help="Pad naar handoff bestand (relatief aan workspace root, bijv. 'handoff.md')"
     )
     
+    # Subcommand: valideer-handoffs
+    parser_handoffs = subparsers.add_parser(
+        "valideer-handoffs",
+        help="Valideer alle handoffs die op een glob-patroon passen"
+    )
+    parser_handoffs.add_argument(
+        "--glob",
+        dest="patronen",
+        action="append",
+        required=True,
+        help="Glob-patroon relatief aan workspace root (herhaalbaar, bijv. 'docs/**/handoff*.md')"
+    )
+    parser_handoffs.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Aantal parallelle workers (default: aantal CPU's)"
+    )
+    parser_handoffs.add_argument(
+        "--formaat",
+        type=str,
+        choices=["tekst", "json", "junit"],
+        default="tekst",
+        help="Uitvoerformaat (default: tekst)"
+    )
+    parser_handoffs.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Schrijf uitvoer naar bestand (relatief aan workspace root) in plaats van stdout"
+    )
+    
     # Subcommand: publiceer-normatieve-wijziging
     parser_publiceer = subparsers.add_parser(
         "publiceer-normatieve-wijziging",
@@ -465,14 +652,19 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Simuleer publicatie zonder wijzigingen door te voeren"
     )
+    parser_publiceer.add_argument(
+        "--terugdraaien",
+        action="store_true",
+        help="Draai een onderbroken publicatie met deze handoff-id terug in plaats van te hervatten"
+    )
     
     return parser
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         if args.operatie == "onderhoud-overzicht":
@@ -492,12 +684,20 @@ def main() -> int:
             return op_valideer_handoff(
                 handoff_bestand=args.handoff_bestand,
             )
+        elif args.operatie == "valideer-handoffs":
+            return op_valideer_handoffs(
+                patronen=args.patronen,
+                jobs=args.jobs,
+                formaat=args.formaat,
+                output=args.output,
+            )
         elif args.operatie == "publiceer-normatieve-wijziging":
             return op_publiceer_normatieve_wijziging(
                 handoff_id=args.handoff_id,
                 handoff_bestand=args.handoff_bestand,
                 validatie_mode=args.validatie_mode,
                 dry_run=args.dry_run,
+                terugdraaien=args.terugdraaien,
             )
         else:
             print(f"ERROR: Onbekende operatie: {args.operatie}", file=sys.stderr)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Canon Dispatcher
+
+Eén ingang voor alle runners van deze workspace. In plaats van per
+operatie een nieuw Python-proces te starten (interpreter, imports,
+argument parsing), voert de dispatcher één of meer operaties uit binnen
+één proces. Runners staan in een plugin-registry (``dispatch.registry``)
+en worden pas geladen als een operatie ze nodig heeft.
+
+Usage:
+    python scripts/canon.py --list
+    python scripts/canon.py moeder valideer-governance --opdracht "controle"
+    python scripts/canon.py --batch operaties.txt
+    producer | python scripts/canon.py --batch -
+
+Een batch bevat één operatie per regel (``<runner> <argumenten...>``);
+zie ``dispatch.stream`` voor het formaat. Elke operatie levert zijn eigen
+OK/ERROR-uitvoer; de dispatcher sluit af met een samenvatting en exit
+code 1 als een operatie gefaald is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+from dispatch.registry import dispatch, register_builtin, runners
+from dispatch.stream import Operation, parse_operations
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="canon",
+        description="Canon dispatcher — voert runner-operaties uit binnen één proces",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Toon de geregistreerde runners",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="BESTAND",
+        help="Bestand met één operatie per regel ('-' voor stdin)",
+    )
+    parser.add_argument(
+        "--stop-on-error",
+        action="store_true",
+        help="Stop de batch bij de eerste gefaalde operatie",
+    )
+    parser.add_argument("runner", nargs="?", help="Runner voor een enkele operatie")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Argumenten voor de runner")
+    return parser.parse_args(argv)
+
+
+def run_batch(operations: Iterable[Operation], *, stop_on_error: bool = False) -> int:
+    """Voer operaties na elkaar uit en rapporteer het totaal.
+
+    Returns
+    -------
+    int
+        0 als alle operaties slaagden, anders 1
+    """
+    done = 0
+    failed: list[Operation] = []
+    start = time.perf_counter()
+    try:
+        for operation in operations:
+            print(f"== [{operation.line}] {operation.describe()}", flush=True)
+            code = dispatch(operation.runner, operation.argv)
+            sys.stdout.flush()
+            done += 1
+            if code != 0:
+                failed.append(operation)
+                if stop_on_error:
+                    break
+    except ValueError as exc:
+        print(f"ERROR: Batch afgebroken: {exc}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    if failed:
+        lines = ", ".join(str(operation.line) for operation in failed)
+        print(
+            f"ERROR: {len(failed)} van {done} operatie(s) gefaald (regel {lines})",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"OK: {done} operatie(s) uitgevoerd in {elapsed:.2f}s")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    register_builtin()
+
+    if args.list:
+        for runner in runners():
+            print(f"{runner.name:<24} {runner.description}")
+        return 0
+
+    if args.batch is not None:
+        if args.runner is not None:
+            print("ERROR: --batch en een losse operatie sluiten elkaar uit", file=sys.stderr)
+            return 2
+        if args.batch == "-":
+            return run_batch(parse_operations(sys.stdin), stop_on_error=args.stop_on_error)
+        try:
+            with open(Path(args.batch), encoding="utf-8") as f:
+                return run_batch(parse_operations(f), stop_on_error=args.stop_on_error)
+        except OSError as exc:
+            print(f"ERROR: Kan batch niet lezen: {exc}", file=sys.stderr)
+            return 1
+
+    if args.runner is None:
+        print("ERROR: Geef een runner, --batch of --list (zie --help)", file=sys.stderr)
+        return 2
+    return dispatch(args.runner, args.args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+"""Canon Curator package - inventarisatie en analyse van het normatieve stelsel (canon-curator.py)"""
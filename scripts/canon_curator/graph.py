@@ -0,0 +1,258 @@
+"""Verwijzingsgraaf van het normatieve stelsel.
+
+De graaf wordt opgebouwd uit de uitgaande verwijzingen in de artefact-index
+(Markdown-links en padvermeldingen). Elke ruwe verwijzing wordt opgelost
+naar een artefact:
+
+1. relatief aan de map van de bron (``../doctrine-x.md``);
+2. relatief aan de workspace root (``grondslagen/globaal/constitutie.md``);
+3. op bestandsnaam (``doctrine-it-development.md``, ook onder een
+   verouderd pad zoals ``governance/...``); bij meerdere kandidaten wint
+   de langste overeenkomende padstaart;
+4. een bestaand bestand buiten het corpus (``scripts/moeder.py``) wordt
+   een externe knoop.
+
+Verwijzingen met een placeholder (``state-<workspace-naam>.md``,
+``agent-boundary-{agent-naam}.md``) worden als patroon tegen de
+bestandsnamen in het corpus gematcht. Wat niet op te lossen is, staat in
+``unresolved``.
+
+Bereikbaarheid (wat gebruikt X, transitief) en impact (wat hangt van X
+af, transitief) zijn breadth-first zoektochten: lineair in het aantal
+knopen en kanten. De graaf wordt gecachet (``.canon-curator/graph.json``)
+onder een vingerafdruk van alle digests in de index; zolang het corpus
+niet wijzigt, wordt hij niet opnieuw opgebouwd. (Het bestaan van externe
+bestanden wordt dus alleen bij een corpus-wijziging opnieuw gecontroleerd.)
+Binnen één proces (bijv. een batch via ``canon.py``) blijft de laatst
+geladen graaf in het geheugen, zodat volgende aanroepen ook het inlezen
+van de cache overslaan.
+"""
+from __future__ import annotations
+
+import json
+import os
+import posixpath
+import re
+from collections import deque
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from canon_curator.index import ArtifactIndex
+from kernel.hashing import hash_bytes
+from kernel.locking import atomic_write_text
+
+
+GRAPH_VERSION = 1
+
+UNRESOLVED_MISSING = "ontbreekt"
+UNRESOLVED_PATTERN = "patroon"
+
+_PLACEHOLDER = re.compile(r"<[^<>/]*>|\{[^{}/]*\}")
+
+# Per cache-bestand: (vingerafdruk, graaf) van de laatste load_graph in dit proces
+_SESSION: dict[Path, tuple[str, ReferenceGraph]] = {}
+
+
+class Edge(NamedTuple):
+    """Opgeloste verwijzing van ``source`` naar ``target``."""
+    source: str
+    target: str
+    line: int
+    raw: str
+
+
+class Unresolved(NamedTuple):
+    """Verwijzing zonder doel in de workspace."""
+    source: str
+    line: int
+    raw: str
+    reason: str
+
+
+class ReferenceGraph:
+    """Gerichte graaf van artefacten (bron verwijst naar doel)."""
+
+    def __init__(
+        self,
+        nodes: Iterable[str],
+        edges: Iterable[Edge],
+        unresolved: Iterable[Unresolved] = (),
+        external: Iterable[str] = (),
+    ) -> None:
+        self.nodes = set(nodes)
+        self.external = set(external)
+        self.edges = list(edges)
+        self.unresolved = list(unresolved)
+        self.forward: dict[str, list[str]] = {}
+        self.reverse: dict[str, list[str]] = {}
+        for edge in self.edges:
+            self.forward.setdefault(edge.source, []).append(edge.target)
+            self.reverse.setdefault(edge.target, []).append(edge.source)
+
+    @staticmethod
+    def _walk(adjacency: dict[str, list[str]], start: Iterable[str]) -> dict[str, int]:
+        distance: dict[str, int] = {}
+        queue = deque()
+        for node in start:
+            if node not in distance:
+                distance[node] = 0
+                queue.append(node)
+        while queue:
+            node = queue.popleft()
+            step = distance[node] + 1
+            for neighbour in adjacency.get(node, ()):
+                if neighbour not in distance:
+                    distance[neighbour] = step
+                    queue.append(neighbour)
+        return distance
+
+    def reachable(self, start: Iterable[str]) -> dict[str, int]:
+        """Alles waar ``start`` (transitief) naar verwijst, met afstand."""
+        start = list(start)
+        distance = self._walk(self.forward, start)
+        for node in start:
+            distance.pop(node, None)
+        return distance
+
+    def impacted(self, changed: Iterable[str]) -> dict[str, int]:
+        """Alles dat (transitief) naar ``changed`` verwijst, met afstand.
+
+        Afstand 1 is een directe verwijzing; hogere afstanden zijn
+        transitief geraakt.
+        """
+        changed = list(changed)
+        distance = self._walk(self.reverse, changed)
+        for node in changed:
+            distance.pop(node, None)
+        return distance
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "nodes": sorted(self.nodes),
+            "external": sorted(self.external),
+            "edges": [list(edge) for edge in self.edges],
+            "unresolved": [list(item) for item in self.unresolved],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> ReferenceGraph:
+        return cls(
+            nodes=data["nodes"],
+            edges=(Edge(*edge) for edge in data["edges"]),
+            unresolved=(Unresolved(*item) for item in data["unresolved"]),
+            external=data.get("external", ()),
+        )
+
+
+class _Resolver:
+    """Lost ruwe verwijzingen op tegen de paden in het corpus."""
+
+    def __init__(self, base: Path, paths: Iterable[str]) -> None:
+        self.base = base
+        self.paths = set(paths)
+        self.by_name: dict[str, list[str]] = {}
+        for path in sorted(self.paths):
+            self.by_name.setdefault(path.rpartition("/")[2], []).append(path)
+        self._external: dict[str, bool] = {}
+
+    def _exists(self, rel: str) -> bool:
+        known = self._external.get(rel)
+        if known is None:
+            known = self._external[rel] = os.path.isfile(os.path.join(self.base, rel))
+        return known
+
+    def resolve(self, source: str, raw: str) -> tuple[list[str], str | None]:
+        """Doelen voor een verwijzing, plus reden als er geen doel is."""
+        if _PLACEHOLDER.search(raw):
+            name = _PLACEHOLDER.sub("*", raw.rpartition("/")[2])
+            matches = [
+                path for candidate, paths in self.by_name.items()
+                if fnmatchcase(candidate, name) for path in paths
+            ]
+            return sorted(matches), None if matches else UNRESOLVED_PATTERN
+
+        relative = posixpath.normpath(posixpath.join(posixpath.dirname(source), raw))
+        if relative in self.paths:
+            return [relative], None
+        rooted = posixpath.normpath(raw.lstrip("/"))
+        if rooted in self.paths:
+            return [rooted], None
+
+        candidates = self.by_name.get(rooted.rpartition("/")[2])
+        if candidates:
+            if len(candidates) == 1:
+                return candidates, None
+            # Langste overeenkomende padstaart wint
+            wanted = rooted.split("/")
+
+            def overlap(path: str) -> int:
+                parts = path.split("/")
+                count = 0
+                while count < min(len(parts), len(wanted)) and parts[-1 - count] == wanted[-1 - count]:
+                    count += 1
+                return count
+
+            best = max(overlap(path) for path in candidates)
+            return [path for path in candidates if overlap(path) == best], None
+
+        for rel in (relative, rooted):
+            if not rel.startswith("..") and self._exists(rel):
+                return [rel], None
+        return [], UNRESOLVED_MISSING
+
+
+def build_graph(index: ArtifactIndex) -> ReferenceGraph:
+    """Bouw de verwijzingsgraaf uit de (bijgewerkte) artefact-index."""
+    nodes = set(index.digests())
+    resolver = _Resolver(index.base, nodes)
+    edges: list[Edge] = []
+    unresolved: list[Unresolved] = []
+    external: set[str] = set()
+    for source, line, raw in index.references():
+        targets, reason = resolver.resolve(source, raw)
+        if reason is not None:
+            unresolved.append(Unresolved(source, line, raw, reason))
+            continue
+        for target in targets:
+            if target == source:
+                continue
+            if target not in nodes:
+                external.add(target)
+            edges.append(Edge(source, target, line, raw))
+    return ReferenceGraph(nodes, edges, unresolved, external)
+
+
+def corpus_fingerprint(index: ArtifactIndex) -> str:
+    """Vingerafdruk van de index-inhoud (alle paden en digests)."""
+    digests = index.digests()
+    return hash_bytes("".join(f"{path}\0{digests[path]}\n" for path in sorted(digests)).encode("utf-8"))
+
+
+def load_graph(index: ArtifactIndex, cache_file: Path) -> ReferenceGraph:
+    """Verwijzingsgraaf uit de cache, of opnieuw opgebouwd als het corpus wijzigde."""
+    fingerprint = corpus_fingerprint(index)
+    session = _SESSION.get(cache_file)
+    if session is not None and session[0] == fingerprint:
+        return session[1]
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if cached.get("version") == GRAPH_VERSION and cached.get("fingerprint") == fingerprint:
+            graph = ReferenceGraph.from_json(cached["graph"])
+            _SESSION[cache_file] = (fingerprint, graph)
+            return graph
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    graph = build_graph(index)
+    _SESSION[cache_file] = (fingerprint, graph)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(
+        cache_file,
+        json.dumps(
+            {"version": GRAPH_VERSION, "fingerprint": fingerprint, "graph": graph.to_json()},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+    )
+    return graph
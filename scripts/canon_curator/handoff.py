@@ -0,0 +1,371 @@
+"""Gestructureerde handoffs: parser en validatie.
+
+``parse_handoff`` leest een handoff in één doorgang, regel voor regel, en
+bouwt een ``Handoff``-model op met regelnummers: ID, tijdreferentie,
+status, routing, required reads en acceptance criteria. Alleen ``##``-
+koppen sturen de parser; regels in andere secties (payload) en in
+code-blokken worden alleen op koppen en fences gecontroleerd, zodat grote
+ingebedde payloads goedkoop blijven.
+
+Zowel het runner-formaat (``## Handoff ID``, ``## Timestamp + Status``)
+als het template (``# Handoff — <id>``, ``## Status``, ``## Verplichte
+leesbronnen (Required Reads)``) wordt herkend.
+
+Uit de payload worden alleen de doelbestanden (``**Doelbestand**: ...``)
+gelezen; die gebruikt de publicatie.
+
+``validate_handoff`` toetst alle regels tegen het model en levert
+bevindingen met de regel waar ze betrekking op hebben. ``resolve_reads``
+lost de required reads op tegen een ``PathIndex`` van de workspace en
+legt de digest vast van elke gevonden bron.
+"""
+from __future__ import annotations
+
+import posixpath
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    from canon_curator.paths import PathIndex
+
+
+# Verhogen bij wijziging van de validatieregels (maakt gecachte resultaten ongeldig)
+VALIDATION_VERSION = 2
+
+SEVERITY_ERROR = "fout"
+SEVERITY_WARNING = "waarschuwing"
+
+SECTION_ID = "id"
+SECTION_STATUS = "status"
+SECTION_TIME = "tijdreferentie"
+SECTION_ROUTING = "routing"
+SECTION_READS = "required-reads"
+SECTION_CRITERIA = "acceptance-criteria"
+SECTION_PAYLOAD = "payload"
+
+VALID_STATUSES = ("open", "accepted", "completed", "cancelled")
+
+READ_FOUND = "gevonden"
+READ_MOVED = "verplaatst"
+READ_PATTERN = "patroon"
+READ_AMBIGUOUS = "meerduidig"
+READ_MISSING = "ontbreekt"
+
+_TIME_UNKNOWN = "exacte tijd niet beschikbaar"
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}")
+_TIMEZONE = re.compile(r"\b(?:CET|CEST|UTC|Z)\b|[+-]\d{2}:?\d{2}\s*$")
+_LIST_ITEM = re.compile(r"(?:[-*+]|\d+[.)])\s+(.*)")
+_FIELD = re.compile(r"\*{0,2}([^:*]+?)\*{0,2}:\*{0,2}\s*(.*)")
+_READ_TARGET = re.compile(r"[\w./<>{}-]+\.(?:md|py|ya?ml|json|ping|txt)\b|[\w.<>{}-]+/[\w./<>{}-]+")
+
+
+class Located(NamedTuple):
+    """Waarde met de regel (1-based) waar hij staat."""
+    value: str
+    line: int
+
+
+class RequiredRead(NamedTuple):
+    """Eén verplichte leesbron."""
+    label: str | None
+    target: str | None
+    text: str
+    line: int
+
+
+class ResolvedRead(NamedTuple):
+    """Required read, opgelost tegen de workspace (met digest van de bron)."""
+    target: str
+    line: int
+    status: str
+    path: str | None
+    digest: str | None
+
+
+class Section(NamedTuple):
+    """Een ``##``-sectie met begin- en eindregel."""
+    title: str
+    line: int
+    end: int
+
+
+class Handoff(NamedTuple):
+    """Getypeerd model van een handoff."""
+    title: Located | None
+    sections: dict[str, Section]
+    id: Located | None
+    created: Located | None
+    status: Located | None
+    routing: dict[str, Located]
+    required_reads: list[RequiredRead]
+    acceptance_criteria: list[Located]
+    targets: list[Located]
+    lines: int
+
+    def read_targets(self) -> list[tuple[str, int, bool]]:
+        """``(doel, regel, optioneel)`` per required read met een pad."""
+        return [
+            (read.target, read.line, "indien bestaand" in read.text.lower())
+            for read in self.required_reads if read.target
+        ]
+
+
+class Issue(NamedTuple):
+    """Validatiebevinding, met regel als die aan te wijzen is."""
+    severity: str
+    line: int | None
+    message: str
+
+
+def _section_key(title: str) -> str | None:
+    lowered = title.lower()
+    if "required reads" in lowered or "leesbronnen" in lowered:
+        return SECTION_READS
+    if "acceptance criteria" in lowered or "acceptatiecriteria" in lowered:
+        return SECTION_CRITERIA
+    if lowered == "handoff id":
+        return SECTION_ID
+    if "routing" in lowered:
+        return SECTION_ROUTING
+    if "status" in lowered:
+        return SECTION_STATUS
+    if "tijdreferentie" in lowered or "timestamp" in lowered:
+        return SECTION_TIME
+    if lowered == "payload":
+        return SECTION_PAYLOAD
+    return None
+
+
+def _field_key(name: str) -> str:
+    # "From (rol / agent)" -> "from", "Handoff type" -> "type", "Created at" -> "created"
+    name = name.split("(", 1)[0].strip().lower()
+    if name.endswith("type"):
+        return "type"
+    if name in ("created at", "time reference", "tijdreferentie"):
+        return "created"
+    return name
+
+
+def parse_handoff(lines: Iterable[str]) -> Handoff:
+    """Parse een handoff in één doorgang.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        Regels van de handoff (bijv. een open bestand)
+
+    Returns
+    -------
+    Handoff
+        Model met regelnummers
+    """
+    title: Located | None = None
+    sections: dict[str, Section] = {}
+    handoff_id: Located | None = None
+    fields: dict[str, Located] = {}
+    routing: dict[str, Located] = {}
+    reads: list[RequiredRead] = []
+    criteria: list[Located] = []
+    targets: list[Located] = []
+
+    current: str | None = None
+    current_title = ""
+    current_start = 0
+    fenced = False
+    number = 0
+
+    def close(end: int) -> None:
+        if current is not None and current not in sections:
+            sections[current] = Section(current_title, current_start, end)
+
+    for number, raw in enumerate(lines, start=1):
+        line = raw.strip()
+        if line.startswith("```") or line.startswith("~~~"):
+            fenced = not fenced
+            continue
+        if fenced or not line:
+            continue
+        if line[0] == "#":
+            if line.startswith("## "):
+                close(number - 1)
+                current_title = line[3:].strip()
+                current = _section_key(current_title)
+                current_start = number
+            elif line.startswith("# ") and title is None:
+                title = Located(line[2:].strip(), number)
+            continue
+        if current is None:
+            continue
+        if current == SECTION_PAYLOAD:
+            # Alleen doelbestanden; de rest van de payload wordt niet geparst
+            if line.startswith("**Doelbestand"):
+                field = _FIELD.match(line)
+                if field and field.group(2).strip():
+                    targets.append(Located(field.group(2).strip().strip("`"), number))
+            continue
+
+        if current == SECTION_ID:
+            if handoff_id is None:
+                handoff_id = Located(line.strip("`*"), number)
+            continue
+
+        item = _LIST_ITEM.match(line)
+        if current in (SECTION_STATUS, SECTION_TIME, SECTION_ROUTING):
+            field = _FIELD.match(item.group(1) if item else line)
+            if field:
+                key = _field_key(field.group(1))
+                target = routing if current == SECTION_ROUTING else fields
+                target.setdefault(key, Located(field.group(2).strip(), number))
+        elif item and current == SECTION_READS:
+            text = item.group(1).strip()
+            label, rest = None, text
+            if text.startswith("**"):
+                end = text.find("**", 2)
+                if end > 2:
+                    label, rest = text[2:end].strip().rstrip(":"), text[end + 2:]
+            target = _READ_TARGET.search(rest.replace("`", ""))
+            reads.append(RequiredRead(label, target.group(0) if target else None, text, number))
+        elif item and current == SECTION_CRITERIA:
+            criteria.append(Located(item.group(1).strip(), number))
+    close(number)
+
+    if handoff_id is None and title is not None:
+        # Template-vorm: "# Handoff — <handoff-id>"
+        suffix = title.value.rpartition("—")[2].strip()
+        if suffix.startswith("handoff-"):
+            handoff_id = Located(suffix, title.line)
+
+    return Handoff(
+        title=title,
+        sections=sections,
+        id=handoff_id,
+        created=fields.get("created"),
+        status=fields.get("status"),
+        routing=routing,
+        required_reads=reads,
+        acceptance_criteria=criteria,
+        targets=targets,
+        lines=number,
+    )
+
+
+def read_handoff(path: Path) -> Handoff:
+    """Parse een handoff-bestand zonder het in zijn geheel in te lezen."""
+    with path.open(encoding="utf-8") as handle:
+        return parse_handoff(handle)
+
+
+def validate_handoff(handoff: Handoff) -> list[Issue]:
+    """Toets een handoff tegen de verplichte elementen.
+
+    Returns
+    -------
+    list[Issue]
+        Fouten en waarschuwingen, in volgorde van de regels
+    """
+    issues: list[Issue] = []
+    sections = handoff.sections
+
+    if handoff.id is None:
+        line = sections[SECTION_ID].line if SECTION_ID in sections else None
+        issues.append(Issue(SEVERITY_ERROR, line, "Handoff ID ontbreekt"))
+
+    if handoff.created is None:
+        anchor = sections.get(SECTION_STATUS) or sections.get(SECTION_TIME)
+        issues.append(Issue(
+            SEVERITY_ERROR, anchor.line if anchor else None,
+            "Tijdreferentie ontbreekt (Created / Time reference)",
+        ))
+    else:
+        created = handoff.created
+        if not _TIMESTAMP.search(created.value) and _TIME_UNKNOWN not in created.value:
+            issues.append(Issue(SEVERITY_ERROR, created.line, f"Tijdreferentie niet herkend: {created.value}"))
+        elif not _TIMEZONE.search(created.value) and _TIME_UNKNOWN not in created.value:
+            issues.append(Issue(
+                SEVERITY_WARNING, created.line,
+                "Tijdreferentie mogelijk onvolledig (geen tijdzone of toelichting)",
+            ))
+
+    if handoff.status is None:
+        anchor = sections.get(SECTION_STATUS)
+        issues.append(Issue(SEVERITY_ERROR, anchor.line if anchor else None, "Status ontbreekt"))
+    elif handoff.status.value.lower() not in VALID_STATUSES:
+        issues.append(Issue(
+            SEVERITY_WARNING, handoff.status.line,
+            f"Onbekende status '{handoff.status.value}' (verwacht: {', '.join(VALID_STATUSES)})",
+        ))
+
+    if SECTION_ROUTING not in sections:
+        issues.append(Issue(SEVERITY_WARNING, None, "Routing sectie ontbreekt"))
+    else:
+        for key in ("from", "to"):
+            if key not in handoff.routing:
+                issues.append(Issue(SEVERITY_WARNING, sections[SECTION_ROUTING].line, f"Routing mist '{key}'"))
+
+    if SECTION_READS not in sections:
+        issues.append(Issue(SEVERITY_ERROR, None, "Required Reads sectie ontbreekt"))
+    elif not handoff.required_reads:
+        issues.append(Issue(SEVERITY_ERROR, sections[SECTION_READS].line, "Required Reads sectie is leeg"))
+    elif not any(read.target and read.target.rpartition("/")[2].startswith("state-") for read in handoff.required_reads):
+        issues.append(Issue(
+            SEVERITY_WARNING, sections[SECTION_READS].line,
+            "Workspace state ontbreekt in required reads",
+        ))
+
+    if SECTION_CRITERIA not in sections:
+        issues.append(Issue(SEVERITY_ERROR, None, "Acceptance Criteria sectie ontbreekt"))
+    elif not handoff.acceptance_criteria:
+        issues.append(Issue(SEVERITY_ERROR, sections[SECTION_CRITERIA].line, "Acceptance Criteria sectie is leeg"))
+
+    return sorted(issues, key=lambda issue: (issue.line is not None, issue.line or 0))
+
+
+def resolve_reads(
+    targets: Iterable[tuple[str, int, bool]],
+    index: PathIndex,
+) -> tuple[list[ResolvedRead], list[Issue]]:
+    """Los required reads op tegen de padindex van de workspace.
+
+    Volgorde: exact pad, placeholder-patroon (``state-{workspace}.md``),
+    bestandsnaam (verouderd pad, met waarschuwing). Een read die niet
+    gevonden wordt is een fout, tenzij hij optioneel is ("indien bestaand").
+
+    Parameters
+    ----------
+    targets : Iterable[tuple[str, int, bool]]
+        ``(doel, regel, optioneel)``, zie ``Handoff.read_targets``
+    index : PathIndex
+        Padindex van de workspace
+
+    Returns
+    -------
+    tuple[list[ResolvedRead], list[Issue]]
+        Opgeloste reads (met digest) en bevindingen
+    """
+    resolved: list[ResolvedRead] = []
+    issues: list[Issue] = []
+    for target, line, optional in targets:
+        path = posixpath.normpath(target).lstrip("/")
+        found: str | None = None
+        if path in index:
+            status, found = READ_FOUND, path
+        elif index.has_placeholder(path):
+            matches = index.matching(path)
+            # Voorkeur voor de map van het patroon (state-{workspace}.md staat in de root)
+            matches = [m for m in matches if posixpath.dirname(m) == posixpath.dirname(path)] or matches
+            status = READ_PATTERN if len(matches) == 1 else READ_AMBIGUOUS if matches else READ_MISSING
+            found = matches[0] if len(matches) == 1 else None
+        else:
+            matches = index.named(path.rpartition("/")[2])
+            status = READ_MOVED if len(matches) == 1 else READ_AMBIGUOUS if matches else READ_MISSING
+            found = matches[0] if len(matches) == 1 else None
+
+        if status == READ_MOVED:
+            issues.append(Issue(SEVERITY_WARNING, line, f"Required read {target} heeft een verouderd pad; gevonden als {found}"))
+        elif status == READ_AMBIGUOUS:
+            issues.append(Issue(SEVERITY_WARNING, line, f"Required read {target} is meerduidig: {', '.join(matches)}"))
+        elif status == READ_MISSING and not optional:
+            issues.append(Issue(SEVERITY_ERROR, line, f"Required read niet gevonden: {target}"))
+        resolved.append(ResolvedRead(target, line, status, found, index.digest(found) if found else None))
+    return resolved, issues
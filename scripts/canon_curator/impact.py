@@ -0,0 +1,98 @@
+"""Impactanalyse voor canon-wijzigingen.
+
+Gegeven de artefacten die een voorstel raakt, levert ``analyse_impact``
+alles wat er (transitief) naar verwijst, via een breadth-first zoektocht
+over de omgekeerde verwijzingsgraaf (``ReferenceGraph.impacted``). Direct
+geraakt (afstand 1) gaat voor transitief; binnen dezelfde afstand wegen
+artefacten zwaarder naarmate er meer naar ze verwezen wordt, omdat een
+wijziging daar verder doorwerkt. De indeling per value stream volgt uit
+het pad (``grondslagen/value-streams/{stream}/...``); overige artefacten
+vallen onder ``globaal`` of hun corpus-map.
+"""
+from __future__ import annotations
+
+import time
+from typing import Iterable, NamedTuple
+
+from canon_curator.graph import ReferenceGraph
+from canon_curator.scanner import CORPUS_ROOTS
+
+
+VALUE_STREAM_ROOT = "grondslagen/value-streams/"
+GLOBAL_STREAM = "globaal"
+
+
+class ImpactEntry(NamedTuple):
+    """Eén geraakt artefact."""
+    path: str
+    distance: int
+    referrers: int
+    value_stream: str
+
+    @property
+    def direct(self) -> bool:
+        return self.distance == 1
+
+
+class ImpactReport(NamedTuple):
+    """Gerangschikte impact van een wijziging."""
+    changed: list[str]
+    entries: list[ImpactEntry]
+    duration_ms: float
+
+    @property
+    def direct(self) -> list[ImpactEntry]:
+        return [entry for entry in self.entries if entry.direct]
+
+    @property
+    def transitive(self) -> list[ImpactEntry]:
+        return [entry for entry in self.entries if not entry.direct]
+
+    def by_stream(self) -> dict[str, list[ImpactEntry]]:
+        """Geraakte artefacten per value stream (in rangorde)."""
+        streams: dict[str, list[ImpactEntry]] = {}
+        for entry in self.entries:
+            streams.setdefault(entry.value_stream, []).append(entry)
+        return streams
+
+
+def value_stream_of(path: str) -> str:
+    """Value stream van een artefact, afgeleid uit het pad."""
+    if path.startswith(VALUE_STREAM_ROOT):
+        stream, _, rest = path[len(VALUE_STREAM_ROOT):].partition("/")
+        if rest:
+            return stream
+    if path.startswith("grondslagen/"):
+        return GLOBAL_STREAM
+    for root in CORPUS_ROOTS:
+        if path.startswith(root + "/"):
+            return root
+    return GLOBAL_STREAM
+
+
+def analyse_impact(graph: ReferenceGraph, changed: Iterable[str]) -> ImpactReport:
+    """Bepaal en rangschik de artefacten die door ``changed`` geraakt worden.
+
+    Parameters
+    ----------
+    graph : ReferenceGraph
+        Verwijzingsgraaf van het corpus
+    changed : Iterable[str]
+        Paden van de gewijzigde artefacten
+
+    Returns
+    -------
+    ImpactReport
+        Direct geraakt eerst, dan transitief; binnen een afstand op aantal
+        verwijzers (aflopend) en pad
+    """
+    start = time.perf_counter()
+    changed = sorted(set(changed))
+    distances = graph.impacted(changed)
+    entries = [
+        ImpactEntry(path, distance, len(set(graph.reverse.get(path, ()))), value_stream_of(path))
+        for path, distance in distances.items()
+    ]
+    entries.sort(key=lambda entry: (entry.distance, -entry.referrers, entry.path))
+    duration_ms = round((time.perf_counter() - start) * 1000, 3)
+    return ImpactReport(changed, entries, duration_ms)
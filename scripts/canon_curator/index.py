@@ -0,0 +1,399 @@
+"""Persistente, incrementele index van het normatieve stelsel (SQLite).
+
+De index (``.canon-curator/index.sqlite``) legt per artefact vast: pad,
+corpus-map, type, kopmetadata, digest, koppen en uitgaande verwijzingen,
+plus een FTS5-tabel over titel, koppen en tekst. Curator-operaties
+vragen het corpus op via de index in plaats van elk bestand te lezen.
+
+``refresh`` houdt de index bij. Net als bij de corpus-snapshot van de
+kernel wordt het corpus alleen ge-stat; alleen artefacten waarvan mtime
+of grootte afwijkt worden gelezen. Is de inhoud (digest) ongewijzigd,
+dan wordt alleen de signatuur bijgewerkt. Artefacten die binnen
+RACY_WINDOW_NS gewijzigd zijn krijgen geen signatuur en worden bij de
+volgende refresh opnieuw gelezen.
+
+De index is afgeleid, niet normatief: bij twijfel kan hij verwijderd
+worden en bouwt de volgende refresh hem opnieuw op. Zonder FTS5 in de
+SQLite-build valt ``search`` terug op LIKE.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+from canon_curator.scanner import (
+    CORPUS_ROOTS,
+    ArtifactMeta,
+    Catalogue,
+    build_meta,
+    extract_outline,
+    iter_corpus,
+    map_chunks,
+    parse_header,
+)
+from kernel.hashing import hash_bytes
+from kernel.locking import file_lock
+from kernel.statecache import RACY_WINDOW_NS
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+INDEX_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       TEXT
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    path        TEXT PRIMARY KEY,
+    root        TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    title       TEXT,
+    version     TEXT,
+    date        TEXT,
+    status      TEXT,
+    identifier  TEXT,
+    fields      TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER,
+    digest      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_root ON artifacts (root);
+CREATE INDEX IF NOT EXISTS artifacts_kind ON artifacts (kind);
+CREATE TABLE IF NOT EXISTS headings (
+    path        TEXT NOT NULL,
+    line        INTEGER NOT NULL,
+    level       INTEGER NOT NULL,
+    text        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS headings_path ON headings (path);
+CREATE TABLE IF NOT EXISTS refs (
+    source      TEXT NOT NULL,
+    line        INTEGER NOT NULL,
+    target      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS refs_source ON refs (source);
+CREATE INDEX IF NOT EXISTS refs_target ON refs (target);
+"""
+
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS artifacts_fts"
+    " USING fts5(path UNINDEXED, title, headings, body)"
+)
+
+_COLUMNS = "path, root, kind, title, version, date, status, identifier, fields, size, mtime_ns, digest"
+
+
+class IndexedDocument(NamedTuple):
+    """Volledig geparst artefact, klaar om te indexeren."""
+    meta: ArtifactMeta
+    digest: str
+    headings: list[tuple[int, int, str]]
+    references: list[tuple[int, str]]
+    body: str
+
+
+class IndexUpdate(NamedTuple):
+    """Resultaat van een refresh (relatieve POSIX-paden)."""
+    added: tuple[str, ...]
+    modified: tuple[str, ...]
+    removed: tuple[str, ...]
+    reread: int
+    total: int
+
+    @property
+    def changed(self) -> tuple[str, ...]:
+        return tuple(sorted(self.added + self.modified + self.removed))
+
+
+def read_document(path: str, rel: str, root: str) -> IndexedDocument:
+    """Lees en parse één artefact volledig.
+
+    Raises
+    ------
+    OSError
+        Als het bestand niet gelezen kan worden
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        data = f.read()
+    text = data.decode("utf-8", errors="replace")
+    title, fields = parse_header(text.splitlines())
+    headings, references = extract_outline(text)
+    return IndexedDocument(
+        meta=build_meta(rel, root, title, fields, st.st_size, st.st_mtime_ns),
+        digest=hash_bytes(data),
+        headings=headings,
+        references=references,
+        body=text,
+    )
+
+
+def _read_documents(
+    chunk: list[tuple[str, str, str]],
+) -> tuple[list[IndexedDocument], list[tuple[str, str]]]:
+    """Worker: lees een brok artefacten (ook in een apart proces)."""
+    found: list[IndexedDocument] = []
+    errors: list[tuple[str, str]] = []
+    for path, rel, root in chunk:
+        try:
+            found.append(read_document(path, rel, root))
+        except OSError as exc:
+            errors.append((rel, str(exc)))
+    return found, errors
+
+
+def _meta_from_row(row: tuple) -> ArtifactMeta:
+    path, root, kind, title, version, date, status, identifier, fields, size, mtime_ns, _ = row
+    return ArtifactMeta(
+        path=path,
+        root=root,
+        kind=kind,
+        title=title,
+        version=version,
+        date=date,
+        status=status,
+        identifier=identifier,
+        fields=json.loads(fields),
+        size=size,
+        mtime_ns=mtime_ns or 0,
+    )
+
+
+class ArtifactIndex:
+    """Thread-safe toegang tot de artefact-index."""
+
+    def __init__(self, db_path: Path, base: Path, roots: Iterable[str] = CORPUS_ROOTS) -> None:
+        self.db_path = db_path
+        self.base = base
+        self.roots = tuple(roots)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._fts = False
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            import sqlite3
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            try:
+                conn.execute(_FTS_SCHEMA)
+                self._fts = True
+            except sqlite3.OperationalError:
+                self._fts = False
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != str(INDEX_VERSION):
+                # Ander formaat: leeg, de volgende refresh bouwt opnieuw op
+                with conn:
+                    for table in ("artifacts", "headings", "refs"):
+                        conn.execute(f"DELETE FROM {table}")
+                    if self._fts:
+                        conn.execute("DELETE FROM artifacts_fts")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                        (str(INDEX_VERSION),),
+                    )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def refresh(self, jobs: int | None = None) -> IndexUpdate:
+        """Breng de index in lijn met het corpus op disk.
+
+        Parameters
+        ----------
+        jobs : int, optional
+            Aantal processen bij veel gewijzigde artefacten
+
+        Returns
+        -------
+        IndexUpdate
+            Toegevoegde, gewijzigde en verwijderde artefacten
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.db_path), self._lock:
+            conn = self._connection()
+            known = {
+                path: (mtime_ns, size, digest)
+                for path, mtime_ns, size, digest in conn.execute(
+                    "SELECT path, mtime_ns, size, digest FROM artifacts"
+                )
+            }
+
+            current: dict[str, tuple[str, str]] = {}
+            stale: list[tuple[str, str, str]] = []
+            for path, rel, root in iter_corpus(self.base, self.roots):
+                current[rel] = (path, root)
+                previous = known.get(rel)
+                if previous is not None:
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    if previous[0] == st.st_mtime_ns and previous[1] == st.st_size:
+                        continue
+                stale.append((path, rel, root))
+
+            documents: list[IndexedDocument] = []
+            for found, _errors in map_chunks(_read_documents, stale, jobs):
+                documents.extend(found)
+
+            racy_after = time.time_ns() - RACY_WINDOW_NS
+            added: list[str] = []
+            modified: list[str] = []
+            touched: list[tuple[int | None, int, str]] = []
+            rewritten: list[IndexedDocument] = []
+            for document in documents:
+                meta = document.meta
+                previous = known.get(meta.path)
+                if previous is not None and previous[2] == document.digest:
+                    touched.append((self._signature(meta, racy_after), meta.size, meta.path))
+                    continue
+                (modified if previous is not None else added).append(meta.path)
+                rewritten.append(document)
+            removed = sorted(set(known) - set(current))
+
+            with conn:
+                conn.executemany(
+                    "UPDATE artifacts SET mtime_ns = ?, size = ? WHERE path = ?", touched
+                )
+                self._delete(conn, removed + modified)
+                self._insert(conn, rewritten, racy_after)
+
+        return IndexUpdate(
+            added=tuple(sorted(added)),
+            modified=tuple(sorted(modified)),
+            removed=tuple(removed),
+            reread=len(documents),
+            total=len(current),
+        )
+
+    @staticmethod
+    def _signature(meta: ArtifactMeta, racy_after: int) -> int | None:
+        # Racy: geen signatuur, zodat de volgende refresh opnieuw leest
+        return meta.mtime_ns if meta.mtime_ns < racy_after else None
+
+    def _delete(self, conn: sqlite3.Connection, paths: list[str]) -> None:
+        rows = [(path,) for path in paths]
+        if self._fts:
+            # FTS-rijen delen hun rowid met het artefact (geen scan over de FTS-tabel)
+            conn.executemany(
+                "DELETE FROM artifacts_fts WHERE rowid = (SELECT rowid FROM artifacts WHERE path = ?)",
+                rows,
+            )
+        conn.executemany("DELETE FROM artifacts WHERE path = ?", rows)
+        conn.executemany("DELETE FROM headings WHERE path = ?", rows)
+        conn.executemany("DELETE FROM refs WHERE source = ?", rows)
+
+    def _insert(self, conn: sqlite3.Connection, documents: list[IndexedDocument], racy_after: int) -> None:
+        conn.executemany(
+            "INSERT INTO artifacts (" + _COLUMNS + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    d.meta.path, d.meta.root, d.meta.kind, d.meta.title, d.meta.version,
+                    d.meta.date, d.meta.status, d.meta.identifier,
+                    json.dumps(d.meta.fields, ensure_ascii=False), d.meta.size,
+                    self._signature(d.meta, racy_after), d.digest,
+                )
+                for d in documents
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO headings (path, line, level, text) VALUES (?, ?, ?, ?)",
+            ((d.meta.path, line, level, text) for d in documents for line, level, text in d.headings),
+        )
+        conn.executemany(
+            "INSERT INTO refs (source, line, target) VALUES (?, ?, ?)",
+            ((d.meta.path, line, target) for d in documents for line, target in d.references),
+        )
+        if self._fts:
+            conn.executemany(
+                "INSERT INTO artifacts_fts (rowid, path, title, headings, body)"
+                " SELECT rowid, path, ?, ?, ? FROM artifacts WHERE path = ?",
+                (
+                    (d.meta.title or "", "\n".join(h[2] for h in d.headings), d.body, d.meta.path)
+                    for d in documents
+                ),
+            )
+
+    def catalogue(self, roots: Iterable[str] | None = None) -> Catalogue:
+        """Catalogus uit de index, optioneel beperkt tot corpus-mappen."""
+        selected = tuple(roots) if roots is not None else self.roots
+        marks = ", ".join("?" * len(selected))
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT " + _COLUMNS + " FROM artifacts WHERE root IN (" + marks + ")",
+                selected,
+            ).fetchall()
+        return Catalogue((_meta_from_row(row) for row in rows), selected)
+
+    def get(self, path: str) -> ArtifactMeta | None:
+        """Eén artefact op relatief pad, of None."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT " + _COLUMNS + " FROM artifacts WHERE path = ?", (path,)
+            ).fetchone()
+        return _meta_from_row(row) if row else None
+
+    def digests(self) -> dict[str, str]:
+        """Digest per artefact."""
+        with self._lock:
+            return dict(self._connection().execute("SELECT path, digest FROM artifacts"))
+
+    def headings(self, path: str) -> list[tuple[int, int, str]]:
+        """(regel, niveau, tekst) van de koppen van een artefact."""
+        with self._lock:
+            return [
+                tuple(row) for row in self._connection().execute(
+                    "SELECT line, level, text FROM headings WHERE path = ? ORDER BY line", (path,)
+                )
+            ]
+
+    def references(self) -> list[tuple[str, int, str]]:
+        """Alle uitgaande verwijzingen als (bron, regel, doel)."""
+        with self._lock:
+            return [
+                tuple(row) for row in self._connection().execute(
+                    "SELECT source, line, target FROM refs ORDER BY source, line"
+                )
+            ]
+
+    def search(self, query: str, limit: int = 20) -> list[str]:
+        """Paden van artefacten met een of meer woorden uit ``query``, beste eerst."""
+        with self._lock:
+            conn = self._connection()
+            if self._fts:
+                import sqlite3
+                # Elk woord als letterlijke term; leestekens breken FTS-syntax niet
+                terms = " OR ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+                if not terms:
+                    return []
+                try:
+                    rows = conn.execute(
+                        "SELECT path FROM artifacts_fts WHERE artifacts_fts MATCH ?"
+                        " ORDER BY bm25(artifacts_fts, 0.0, 10.0, 5.0, 1.0) LIMIT ?",
+                        (terms, limit),
+                    ).fetchall()
+                    return [row[0] for row in rows]
+                except sqlite3.OperationalError:
+                    pass
+            pattern = f"%{query}%"
+            rows = conn.execute(
+                "SELECT path FROM artifacts WHERE title LIKE ? OR path LIKE ? ORDER BY path LIMIT ?",
+                (pattern, pattern, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
@@ -0,0 +1,160 @@
+"""Lacunes: verwachte agent-artefacten die in de workspace ontbreken.
+
+Elke agent met een boundary in ``docs/resultaten/moeder/agent-boundary-*.md``
+hoort een charter, minstens één prompt en een runner te hebben. Die
+verwachting wordt vooraf als matrix van ``(soort, agent)``-paren opgebouwd.
+De workspace wordt één keer gescand (één ``os.scandir`` per map); de
+aanwezige paren volgen uit de bestandsnamen. Lacunes zijn dan een
+verschil van twee verzamelingen, ongeacht het aantal agents.
+
+Prompts heten ``{agent}-{operatie}.prompt.md`` en agent-namen bevatten zelf
+streepjes. Daarom telt elke prompt voor alle streepjes-prefixen van zijn
+naam; de doorsnede met de agent-namen levert de agents met prompts op.
+"""
+from __future__ import annotations
+
+import os
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+
+BOUNDARY_DIR = "docs/resultaten/moeder"
+BOUNDARY_PREFIX = "agent-boundary-"
+
+CHARTER_DIR = "charters-agents"
+PROMPT_DIR = ".github/prompts"
+RUNNER_DIR = "scripts"
+
+KIND_CHARTER = "charter"
+KIND_PROMPT = "prompt"
+KIND_RUNNER = "runner"
+ARTIFACT_KINDS = (KIND_CHARTER, KIND_PROMPT, KIND_RUNNER)
+
+# Welke soorten artefacten een scope omvat
+SCOPE_KINDS = {
+    "charters": (KIND_CHARTER,),
+    "prompts": (KIND_PROMPT,),
+}
+
+
+class AgentBoundary(NamedTuple):
+    """Agent zoals vastgelegd in een boundary deliverable."""
+    name: str
+    domein: str | None
+    value_stream: str | None
+    path: str
+
+
+class GapMatrix(NamedTuple):
+    """Verwachte en aanwezige ``(soort, agent)``-paren."""
+    boundaries: dict[str, AgentBoundary]
+    expected: set[tuple[str, str]]
+    present: set[tuple[str, str]]
+    prompt_counts: Counter
+    charters: dict[str, str]    # agent -> charterpad
+
+    @property
+    def missing(self) -> set[tuple[str, str]]:
+        """Verwacht maar niet aanwezig."""
+        return self.expected - self.present
+
+    @property
+    def unclaimed_charters(self) -> set[str]:
+        """Agents met een charter maar zonder boundary."""
+        return set(self.charters) - set(self.boundaries)
+
+
+def _entries(directory: Path) -> list[str]:
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+    except OSError:
+        return []
+
+
+def parse_boundary(text: str, path: str) -> AgentBoundary | None:
+    """Lees ``agent-naam``/``domein``/``value-stream`` uit een boundary.
+
+    Alleen de eerste waarde van elk veld telt; ontbreekt ``agent-naam``,
+    dan is het geen geldige boundary.
+    """
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition(":")
+        key = key.strip().lower()
+        if sep and key in ("agent-naam", "domein", "value-stream", "valuestream") and key not in fields:
+            fields[key] = value.strip()
+    name = fields.get("agent-naam")
+    if not name:
+        return None
+    return AgentBoundary(
+        name=name,
+        domein=fields.get("domein") or None,
+        value_stream=fields.get("value-stream") or fields.get("valuestream") or None,
+        path=path,
+    )
+
+
+def load_boundaries(base: Path) -> dict[str, AgentBoundary]:
+    """Alle geldige boundaries, per agent-naam."""
+    boundaries: dict[str, AgentBoundary] = {}
+    for name in sorted(_entries(base / BOUNDARY_DIR)):
+        if not (name.startswith(BOUNDARY_PREFIX) and name.endswith(".md")):
+            continue
+        rel = f"{BOUNDARY_DIR}/{name}"
+        try:
+            text = (base / rel).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        boundary = parse_boundary(text, rel)
+        if boundary is not None:
+            boundaries.setdefault(boundary.name, boundary)
+    return boundaries
+
+
+def _charter_agent(name: str) -> str | None:
+    # charter.{agent}.md (canoniek) of charter-{agent}.md
+    if name.endswith(".md") and name[:8] in ("charter.", "charter-"):
+        return name[8:-3] or None
+    return None
+
+
+def _prefixes(stem: str) -> set[str]:
+    parts = stem.split("-")
+    return {"-".join(parts[:count]) for count in range(1, len(parts) + 1)}
+
+
+def build_matrix(base: Path) -> GapMatrix:
+    """Verwachte matrix uit de boundaries, aanwezige paren uit één scan."""
+    boundaries = load_boundaries(base)
+    agents = set(boundaries)
+    expected = {(kind, agent) for agent in agents for kind in ARTIFACT_KINDS}
+
+    charters: dict[str, str] = {}
+    # De canonieke vorm (charter.{agent}.md) gaat voor
+    for name in sorted(_entries(base / CHARTER_DIR), key=lambda name: (not name.startswith("charter."), name)):
+        agent = _charter_agent(name)
+        if agent:
+            charters.setdefault(agent, f"{CHARTER_DIR}/{name}")
+
+    prompt_counts: Counter = Counter()
+    for name in _entries(base / PROMPT_DIR):
+        if name.endswith(".prompt.md"):
+            prompt_counts.update(_prefixes(name[:-len(".prompt.md")]) & agents)
+
+    runners = {name[:-3] for name in _entries(base / RUNNER_DIR) if name.endswith(".py")}
+
+    present = {(KIND_CHARTER, agent) for agent in charters.keys() & agents}
+    present |= {(KIND_PROMPT, agent) for agent in prompt_counts}
+    present |= {(KIND_RUNNER, agent) for agent in runners & agents}
+    return GapMatrix(boundaries, expected, present, prompt_counts, charters)
+
+
+def expected_path(kind: str, agent: str) -> str:
+    """Waar een ontbrekend artefact verwacht wordt."""
+    if kind == KIND_CHARTER:
+        return f"{CHARTER_DIR}/charter.{agent}.md"
+    if kind == KIND_PROMPT:
+        return f"{PROMPT_DIR}/{agent}-*.prompt.md"
+    return f"{RUNNER_DIR}/{agent}.py"
@@ -0,0 +1,77 @@
+"""Padindex van de workspace: één directory-walk, daarna O(1) opzoekingen.
+
+Gebruikt om verwijzingen buiten het corpus (zoals required reads in een
+handoff) op te lossen: exact pad, bestandsnaam (voor verouderde paden
+zoals ``normatief-stelsel/globaal/...``) of een patroon met placeholder
+(``state-{workspace}.md``). Digests worden per pad hooguit één keer
+berekend, zodat veel handoffs die naar dezelfde bronnen verwijzen die
+bronnen niet steeds opnieuw hashen.
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from kernel.hashing import IGNORED_NAMES, hash_file
+
+
+SKIPPED_NAMES = IGNORED_NAMES | {".canon-curator"}
+
+_PLACEHOLDER = re.compile(r"<[^<>/]*>|\{[^{}/]*\}")
+
+
+class PathIndex:
+    """Alle bestandspaden in de workspace (relatief, POSIX)."""
+
+    def __init__(self, base: Path, paths: set[str]) -> None:
+        self.base = base
+        self.paths = paths
+        self.by_name: dict[str, list[str]] = {}
+        for path in sorted(paths):
+            self.by_name.setdefault(path.rpartition("/")[2], []).append(path)
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, base: Path) -> PathIndex:
+        """Loop de workspace één keer af."""
+        paths: set[str] = set()
+        root = str(base)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [name for name in dirnames if name not in SKIPPED_NAMES]
+            rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            paths.update(prefix + name for name in filenames if name not in SKIPPED_NAMES)
+        return cls(base, paths)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.paths
+
+    def named(self, name: str) -> list[str]:
+        """Paden met deze bestandsnaam."""
+        return self.by_name.get(name, [])
+
+    def matching(self, pattern: str) -> list[str]:
+        """Paden waarvan de bestandsnaam op een placeholder-patroon past."""
+        name = _PLACEHOLDER.sub("*", pattern.rpartition("/")[2])
+        return [
+            path for candidate, paths in self.by_name.items()
+            if fnmatchcase(candidate, name) for path in paths
+        ]
+
+    @staticmethod
+    def has_placeholder(path: str) -> bool:
+        return _PLACEHOLDER.search(path) is not None
+
+    def digest(self, path: str) -> str:
+        """SHA-256 van een bestand in de index (gecachet)."""
+        with self._lock:
+            known = self._digests.get(path)
+        if known is None:
+            known = hash_file(self.base / path)
+            with self._lock:
+                self._digests[path] = known
+        return known
@@ -0,0 +1,445 @@
+"""Transactionele publicatie van normatieve wijzigingen.
+
+Een publicatie bestaat uit bestandsoperaties die samen slagen of samen
+worden teruggedraaid:
+
+- bijgewerkte artefacten (gestaged door de agent in
+  ``.canon-curator/staging/{handoff-id}/``, met dezelfde paden als in de
+  workspace);
+- een change log entry in de workspace state;
+- de normatief-stelsel ping (als een doctrine of beleid wijzigt);
+- archivering van de handoff (status ``accepted``, verplaatst naar
+  ``docs/resultaten/canon-curator/handoffs/``).
+
+``Transaction`` voert die operaties uit via een write-ahead manifest in
+``.canon-curator/publicaties/{handoff-id}/``:
+
+1. *prepare*: nieuwe inhoud naar ``data/``, originelen als hard link (of
+   kopie) naar ``backup/``; daarna één gebundelde sync en pas dan het
+   manifest (``prepared``). Een crash vóór het manifest laat de workspace
+   ongemoeid.
+2. *commit*: manifest op ``committing``, dan per operatie een atomische
+   rename (``data/N`` naar het doel) of verwijdering; de mappen worden aan
+   het eind in één ronde gesynct. Daarna ``committed`` en opruimen.
+3. *rollback*: bij een fout tijdens commit worden de backups teruggezet
+   en nieuw aangemaakte bestanden verwijderd.
+
+Een onderbroken publicatie wordt hervat: operaties waarvan ``data/N`` al
+verdwenen is, zijn uitgevoerd en worden overgeslagen.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from canon_curator.handoff import Handoff, resolve_reads
+from canon_curator.paths import PathIndex
+from canon_curator.scanner import SCOPE_ROOTS, build_meta, parse_header
+from kernel.hashing import IGNORED_NAMES, hash_bytes, hash_file
+from kernel.locking import atomic_write_text, file_lock
+
+
+TX_VERSION = 1
+
+# Vanaf dit aantal bestanden één os.sync() in plaats van een fsync per bestand
+FSYNC_BATCH_MIN = 64
+
+STATE_PREPARED = "prepared"
+STATE_COMMITTING = "committing"
+STATE_COMMITTED = "committed"
+
+ACTION_WRITE = "write"
+ACTION_DELETE = "delete"
+
+KIND_ARTIFACT = "artefact"
+KIND_STATE = "state"
+KIND_PING = "ping"
+KIND_HANDOFF = "handoff"
+
+PING_FILE = "normatief-stelsel.ping"
+ARCHIVE_DIR = "docs/resultaten/canon-curator/handoffs"
+PROTECTED_ROOTS = (".canon-curator",) + tuple(IGNORED_NAMES)
+
+_PING_LINE = re.compile(r"^PING:[^\n]*", re.MULTILINE)
+_LAST_UPDATED = re.compile(r"^(- Last updated:)[^\n]*", re.MULTILINE)
+_STATE_PING = re.compile(r"(normatief-stelsel\.ping \(laatste wijziging: )[^)]*(\))")
+# Handoff-id's worden als mapnaam gebruikt: geen scheidingstekens, geen ``..``
+_HANDOFF_ID = re.compile(r"^handoff-[A-Za-z0-9._-]+$")
+
+
+class PublishError(Exception):
+    """Publicatie kan niet (verder) worden uitgevoerd."""
+
+
+def handoff_dir(parent: Path, handoff_id: str) -> Path:
+    """Map voor een handoff onder ``parent`` (staging of transactie).
+
+    Raises
+    ------
+    PublishError
+        Als de handoff-id geen geldige mapnaam is of buiten ``parent`` uitkomt
+    """
+    if not _HANDOFF_ID.match(handoff_id) or ".." in handoff_id:
+        raise PublishError(f"Ongeldige handoff-id: {handoff_id!r} (verwacht handoff-[A-Za-z0-9._-]+)")
+    path = parent / handoff_id
+    if path.resolve().parent != parent.resolve():
+        raise PublishError(f"Handoff-map valt buiten {parent}: {handoff_id!r}")
+    return path
+
+
+class Operation(NamedTuple):
+    """Eén bestandsoperatie van een publicatie."""
+    target: str
+    action: str
+    kind: str
+    content: bytes | None = None
+
+
+class PublishedArtifact(NamedTuple):
+    """Artefact in een publicatie, met versie en digest."""
+    path: str
+    version: str | None
+    digest: str
+    staged: bool
+
+
+class PublicationPlan(NamedTuple):
+    """Alle operaties plus wat het rapport nodig heeft."""
+    operations: list[Operation]
+    artifacts: list[PublishedArtifact]
+    state_path: str
+    change_log: str
+    pinged: bool
+    archive_path: str
+
+
+def _version_of(rel: str, content: bytes) -> str | None:
+    title, fields = parse_header(content.decode("utf-8", errors="replace").splitlines()[:60])
+    return build_meta(rel, "", title, fields, len(content), 0).version
+
+
+def _staged_files(staging: Path) -> list[str]:
+    if not staging.is_dir():
+        return []
+    found = []
+    for dirpath, dirnames, filenames in os.walk(staging):
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_NAMES]
+        for name in filenames:
+            found.append(Path(dirpath, name).relative_to(staging).as_posix())
+    return sorted(found)
+
+
+def _change_log_entry(handoff_id: str, now: datetime, artifacts: list[PublishedArtifact],
+                      archive_path: str, pinged: bool) -> str:
+    lines = [f"**{now.strftime('%H:%M %z')}** - Normatieve wijziging gepubliceerd ({handoff_id})"]
+    for artifact in artifacts:
+        version = f" (versie {artifact.version})" if artifact.version else ""
+        lines.append(f"- Gepubliceerd: {artifact.path}{version}")
+    lines.append("- Wijziging uitgevoerd door: Canon Curator")
+    lines.append(f"- Herkomst: handoff {handoff_id} (gearchiveerd: {archive_path})")
+    if pinged:
+        lines.append(f"- **Ping geactualiseerd**: {PING_FILE}")
+    return "\n".join(lines)
+
+
+def _update_state(text: str, entry: str, now: datetime, pinged: bool) -> str:
+    stamp = now.strftime("%Y-%m-%d %H:%M %z")
+    text = _LAST_UPDATED.sub(lambda m: f"{m.group(1)} {stamp}", text, count=1)
+    if pinged:
+        text = _STATE_PING.sub(lambda m: f"{m.group(1)}{now.strftime('%Y-%m-%d')}{m.group(2)}", text, count=1)
+
+    day = f"### {now.strftime('%Y-%m-%d')}"
+    marker = text.find("\n## Change Log")
+    if marker < 0:
+        return text.rstrip("\n") + f"\n\n---\n\n## Change Log\n\n{day}\n\n{entry}\n"
+    body = text.index("\n", marker + 1) + 1
+    rest = text[body:].lstrip("\n")
+    if rest.startswith(day + "\n"):
+        # Nieuwste dag staat bovenaan: entry direct onder de dagkop
+        head = len(text) - len(rest) + len(day) + 1
+        return text[:head] + f"\n{entry}\n" + text[head:]
+    return text[:body] + f"\n{day}\n\n{entry}\n\n" + rest
+
+
+def _accepted(text: str, handoff: Handoff) -> str:
+    if handoff.status is None:
+        return text
+    lines = text.splitlines(keepends=True)
+    index = handoff.status.line - 1
+    lines[index] = lines[index].replace(handoff.status.value, "accepted", 1)
+    return "".join(lines)
+
+
+def plan_publication(
+    base: Path,
+    handoff: Handoff,
+    handoff_rel: str,
+    staging: Path,
+    now: datetime | None = None,
+) -> PublicationPlan:
+    """Bepaal alle operaties van een publicatie (zonder iets te schrijven).
+
+    Raises
+    ------
+    PublishError
+        Bij een ontbrekend doelbestand, een ongeldig gestaged pad, een
+        onduidelijke workspace state of een al gearchiveerde handoff
+    """
+    # Met de werkelijke UTC-offset van de host (zie kernel.timing.format_timestamp)
+    now = (now or datetime.now()).astimezone()
+    if handoff.id is None:
+        raise PublishError("Handoff heeft geen ID")
+    handoff_id = handoff.id.value
+    operations: list[Operation] = []
+    artifacts: list[PublishedArtifact] = []
+
+    staged = _staged_files(staging)
+    for rel in staged:
+        if rel.split("/", 1)[0] in PROTECTED_ROOTS or rel == handoff_rel:
+            raise PublishError(f"Gestaged pad niet toegestaan: {rel}")
+        content = (staging / rel).read_bytes()
+        operations.append(Operation(rel, ACTION_WRITE, KIND_ARTIFACT, content))
+        artifacts.append(PublishedArtifact(rel, _version_of(rel, content), hash_bytes(content), True))
+
+    # Doelbestanden die de agent al op hun plek heeft gezet
+    index = PathIndex.build(base)
+    resolved, _ = resolve_reads(((t.value, t.line, True) for t in handoff.targets), index)
+    for read in resolved:
+        if read.path is None:
+            if not any(rel == read.target or rel.endswith("/" + read.target.rpartition("/")[2]) for rel in staged):
+                raise PublishError(f"Doelbestand ontbreekt en is niet gestaged: {read.target}")
+            continue
+        if read.path in staged:
+            continue
+        content = (base / read.path).read_bytes()
+        artifacts.append(PublishedArtifact(read.path, _version_of(read.path, content), read.digest, False))
+    if not artifacts:
+        raise PublishError("Niets te publiceren: geen gestagede bestanden en geen doelbestanden in de handoff")
+
+    states = sorted(name for name in index.paths if "/" not in name and name.startswith("state-") and name.endswith(".md"))
+    if len(states) != 1:
+        raise PublishError(f"Verwacht precies één workspace state in de root, gevonden: {len(states)}")
+    state_path = states[0]
+    if state_path in staged or PING_FILE in staged:
+        raise PublishError("Workspace state en ping worden door de publicatie zelf bijgewerkt, niet gestaged")
+
+    archive_path = f"{ARCHIVE_DIR}/{handoff_id}.md"
+    if archive_path in index:
+        raise PublishError(f"Handoff is al gearchiveerd: {archive_path}")
+
+    normative_roots = SCOPE_ROOTS["doctrines"]
+    pinged = any(a.path.split("/", 1)[0] in normative_roots for a in artifacts)
+
+    entry = _change_log_entry(handoff_id, now, artifacts, archive_path, pinged)
+    state_text = (base / state_path).read_text(encoding="utf-8")
+    operations.append(Operation(
+        state_path, ACTION_WRITE, KIND_STATE,
+        _update_state(state_text, entry, now, pinged).encode("utf-8"),
+    ))
+
+    if pinged:
+        ping_text = (base / PING_FILE).read_text(encoding="utf-8") if PING_FILE in index else ""
+        stamp = f"PING: {now.strftime('%Y-%m-%d %H:%M %z')}"
+        ping_text = _PING_LINE.sub(stamp, ping_text, count=1) if _PING_LINE.search(ping_text) else f"{stamp}\n\n{ping_text}"
+        operations.append(Operation(PING_FILE, ACTION_WRITE, KIND_PING, ping_text.encode("utf-8")))
+
+    handoff_text = (base / handoff_rel).read_text(encoding="utf-8")
+    operations.append(Operation(archive_path, ACTION_WRITE, KIND_HANDOFF, _accepted(handoff_text, handoff).encode("utf-8")))
+    operations.append(Operation(handoff_rel, ACTION_DELETE, KIND_HANDOFF))
+
+    return PublicationPlan(operations, artifacts, state_path, entry, pinged, archive_path)
+
+
+def _sync_files(paths: list[Path]) -> None:
+    """Maak bestanden duurzaam: gebundeld voor grote aantallen."""
+    if len(paths) >= FSYNC_BATCH_MIN and hasattr(os, "sync"):
+        os.sync()
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _sync_dirs(directories: Iterable[Path]) -> None:
+    """Maak renames/verwijderingen duurzaam (één fsync per map)."""
+    if os.name == "nt":  # pragma: no cover - mappen zijn niet te fsyncen
+        return
+    for directory in sorted(set(directories)):
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class Transaction:
+    """Write-ahead transactie over workspace-bestanden."""
+
+    def __init__(self, base: Path, tx_dir: Path) -> None:
+        self.base = base
+        self.tx_dir = tx_dir
+        self.manifest_path = tx_dir / "manifest.json"
+        self.data_dir = tx_dir / "data"
+        self.backup_dir = tx_dir / "backup"
+
+    def load(self) -> dict[str, Any] | None:
+        """Manifest van een eerdere (onderbroken) publicatie, of None."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != TX_VERSION:
+            raise PublishError(f"Onbekende manifestversie in {self.manifest_path}")
+        return manifest
+
+    def _write_manifest(self, manifest: dict[str, Any]) -> None:
+        atomic_write_text(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1))
+
+    def prepare(self, operations: list[Operation], meta: dict[str, Any]) -> dict[str, Any]:
+        """Zet nieuwe inhoud en backups klaar en schrijf het manifest."""
+        if self.tx_dir.exists():
+            # Onderbroken vóór het manifest: niets toegepast, opnieuw beginnen
+            shutil.rmtree(self.tx_dir)
+        self.data_dir.mkdir(parents=True)
+        self.backup_dir.mkdir()
+
+        written: list[Path] = []
+        entries = []
+        for number, operation in enumerate(operations):
+            name = f"{number:05d}"
+            target = self.base / operation.target
+            existed = target.is_file()
+            if existed:
+                backup = self.backup_dir / name
+                try:
+                    os.link(target, backup)
+                except OSError:
+                    shutil.copy2(target, backup)
+                    written.append(backup)
+            digest = None
+            if operation.action == ACTION_WRITE:
+                data = self.data_dir / name
+                with open(data, "wb") as handle:
+                    handle.write(operation.content or b"")
+                written.append(data)
+                digest = hash_bytes(operation.content or b"")
+            entries.append({
+                "target": operation.target,
+                "action": operation.action,
+                "kind": operation.kind,
+                "existed": existed,
+                "digest": digest,
+            })
+
+        _sync_files(written)
+        _sync_dirs([self.data_dir, self.backup_dir])
+        manifest = {"version": TX_VERSION, "state": STATE_PREPARED, "meta": meta, "operations": entries}
+        self._write_manifest(manifest)
+        return manifest
+
+    def commit(self, manifest: dict[str, Any]) -> int:
+        """Pas alle operaties toe (hervat waar nodig); aantal uitgevoerde operaties."""
+        manifest["state"] = STATE_COMMITTING
+        self._write_manifest(manifest)
+
+        applied = 0
+        touched: list[Path] = []
+        for number, entry in enumerate(manifest["operations"]):
+            name = f"{number:05d}"
+            target = self.base / entry["target"]
+            touched.append(target.parent)
+            if entry["action"] == ACTION_WRITE:
+                data = self.data_dir / name
+                if not data.exists():
+                    # Al toegepast in een eerdere poging
+                    if not target.is_file() or hash_file(target) != entry["digest"]:
+                        raise PublishError(f"Doel wijkt af van het manifest: {entry['target']}")
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(data, target)
+            elif target.exists():
+                target.unlink()
+            else:
+                continue
+            applied += 1
+
+        _sync_dirs(touched + [self.data_dir])
+        manifest["state"] = STATE_COMMITTED
+        self._write_manifest(manifest)
+        shutil.rmtree(self.tx_dir, ignore_errors=True)
+        return applied
+
+    def rollback(self, manifest: dict[str, Any]) -> None:
+        """Zet de workspace terug naar de toestand van vóór de publicatie."""
+        touched: list[Path] = []
+        for number in reversed(range(len(manifest["operations"]))):
+            entry = manifest["operations"][number]
+            name = f"{number:05d}"
+            target = self.base / entry["target"]
+            backup = self.backup_dir / name
+            if backup.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(backup, target)
+            elif not entry["existed"] and not (self.data_dir / name).exists() and target.exists():
+                target.unlink()
+            touched.append(target.parent)
+        _sync_dirs(touched)
+        shutil.rmtree(self.tx_dir, ignore_errors=True)
+
+    def run(self, operations: list[Operation] | None, meta: dict[str, Any] | None) -> tuple[dict[str, Any], int, bool]:
+        """Voer de transactie uit, of hervat een onderbroken exemplaar.
+
+        Returns
+        -------
+        tuple[dict, int, bool]
+            Manifest, aantal uitgevoerde operaties en of er hervat werd
+
+        Raises
+        ------
+        PublishError
+            Als er niets te hervatten is en geen operaties zijn opgegeven
+        """
+        self.tx_dir.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.tx_dir):
+            manifest = self.load()
+            resumed = manifest is not None
+            if manifest is None:
+                if operations is None or meta is None:
+                    raise PublishError("Geen onderbroken publicatie gevonden")
+                try:
+                    manifest = self.prepare(operations, meta)
+                except BaseException:
+                    shutil.rmtree(self.tx_dir, ignore_errors=True)
+                    raise
+            if manifest["state"] == STATE_COMMITTED:
+                shutil.rmtree(self.tx_dir, ignore_errors=True)
+                return manifest, 0, resumed
+            try:
+                applied = self.commit(manifest)
+            except BaseException:
+                self.rollback(manifest)
+                raise
+            return manifest, applied, resumed
+
+    def abort(self) -> bool:
+        """Draai een onderbroken publicatie terug; False als er geen is."""
+        self.tx_dir.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.tx_dir):
+            manifest = self.load()
+            if manifest is None:
+                return False
+            if manifest["state"] == STATE_COMMITTED:
+                raise PublishError("Publicatie is al voltooid en kan niet meer worden teruggedraaid")
+            self.rollback(manifest)
+            return True
@@ -0,0 +1,387 @@
+"""Markdown-rapporten van de canon-curator, opgebouwd uit de catalogus."""
+from __future__ import annotations
+
+from datetime import datetime
+
+from typing import TYPE_CHECKING
+
+from canon_curator.graph import ReferenceGraph
+from canon_curator.impact import ImpactReport
+from canon_curator.lacunes import ARTIFACT_KINDS, KIND_CHARTER, KIND_PROMPT, SCOPE_KINDS, GapMatrix, expected_path
+from canon_curator.scanner import ArtifactMeta, Catalogue
+
+if TYPE_CHECKING:
+    from canon_curator.rules import RuleOutcome
+
+
+def _cell(value: str | None) -> str:
+    if not value:
+        return "-"
+    return value.replace("|", "\\|")
+
+
+def _artifact_row(artifact: ArtifactMeta) -> str:
+    return (
+        f"| `{artifact.path}` | {_cell(artifact.title)} | {_cell(artifact.version)} "
+        f"| {_cell(artifact.status)} | {_cell(artifact.date)} |"
+    )
+
+
+def _count_table(heading: str, groups: dict[str, list[ArtifactMeta]]) -> list[str]:
+    lines = [f"| {heading} | Aantal |", "|---|---:|"]
+    for key in sorted(groups):
+        lines.append(f"| {_cell(key)} | {len(groups[key])} |")
+    return lines
+
+
+def render_header(title: str, *, opdracht: str, scope: str | None, output_formaat: str) -> list[str]:
+    """Kop van een rapport (titel, tijdstip en opdracht)."""
+    return [
+        f"# {title}",
+        "",
+        f"**Timestamp**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ",
+        f"**Opdracht**: {opdracht}  ",
+        f"**Scope**: {scope or 'all'}  ",
+        f"**Output formaat**: {output_formaat}",
+        "",
+        "---",
+        "",
+    ]
+
+
+def render_overzicht(catalogue: Catalogue, *, opdracht: str, scope: str | None) -> str:
+    """Rapport ``overzicht``: inventaris met metadata per artefact."""
+    lines = render_header(
+        "Canon Curator Rapport — Overzicht",
+        opdracht=opdracht,
+        scope=scope,
+        output_formaat="overzicht",
+    )
+
+    lines += [
+        "## Samenvatting",
+        "",
+        f"- Artefacten: {len(catalogue)}",
+        f"- Gescande mappen: {', '.join(f'`{root}/`' for root in catalogue.roots)}",
+        f"- Zonder versie: {len(catalogue.missing('version'))}",
+        f"- Zonder status: {len(catalogue.missing('status'))}",
+        f"- Zonder datum: {len(catalogue.missing('date'))}",
+    ]
+    if catalogue.errors:
+        lines.append(f"- Onleesbaar: {len(catalogue.errors)}")
+    lines.append("")
+
+    lines += ["### Per type", ""]
+    lines += _count_table("Type", catalogue.group_by("kind"))
+    lines += ["", "### Per status", ""]
+    lines += _count_table("Status", catalogue.group_by("status"))
+    lines.append("")
+
+    lines += ["## Geraadpleegde artefacten", ""]
+    for root, artifacts in sorted(catalogue.group_by("root").items()):
+        lines += [
+            f"### `{root}/` ({len(artifacts)})",
+            "",
+            "| Artefact | Titel | Versie | Status | Datum |",
+            "|---|---|---|---|---|",
+        ]
+        lines += [_artifact_row(artifact) for artifact in artifacts]
+        lines.append("")
+
+    lines += ["## Bevindingen", ""]
+    findings = 0
+    for attribute, label in (("version", "versie"), ("status", "status"), ("date", "datum")):
+        missing = [a for a in catalogue.missing(attribute) if a.kind != "prompt"]
+        if missing:
+            findings += 1
+            lines.append(f"- {len(missing)} artefact(en) zonder {label}:")
+            lines += [f"  - `{artifact.path}`" for artifact in missing]
+    for rel, error in catalogue.errors:
+        findings += 1
+        lines.append(f"- Onleesbaar: `{rel}` ({error})")
+    if not findings:
+        lines.append("- Alle artefacten hebben versie, status en datum")
+    lines.append("")
+
+    lines += [
+        "## Aanbevelingen",
+        "",
+        "- Vul ontbrekende metadata aan via de constitutioneel-auteur (zie Bevindingen)."
+        if findings else "- Geen",
+        "",
+        "---",
+        "",
+        "Gegenereerd volgens:",
+        "- governance/charters-agents/charter.canon-curator.md",
+        "- .github/prompts/canon-curator-onderhoud-overzicht.prompt.md",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_relaties(
+    catalogue: Catalogue,
+    graph: ReferenceGraph,
+    *,
+    opdracht: str,
+    scope: str | None,
+) -> str:
+    """Rapport ``relaties``: verwijzingen tussen artefacten binnen de scope."""
+    lines = render_header(
+        "Canon Curator Rapport — Relaties",
+        opdracht=opdracht,
+        scope=scope,
+        output_formaat="relaties",
+    )
+    in_scope = set(catalogue.by_path)
+    outgoing = [edge for edge in graph.edges if edge.source in in_scope]
+    unresolved = [item for item in graph.unresolved if item.source in in_scope]
+    external = sorted({edge.target for edge in outgoing if edge.target in graph.external})
+
+    lines += [
+        "## Samenvatting",
+        "",
+        f"- Artefacten: {len(catalogue)}",
+        f"- Verwijzingen: {len(outgoing)}",
+        f"- Externe doelen (buiten het corpus): {len(external)}",
+        f"- Onopgeloste verwijzingen: {len(unresolved)}",
+        "",
+    ]
+
+    incoming = {path: len(set(graph.reverse.get(path, ()))) for path in in_scope}
+    ranked = sorted((count, path) for path, count in incoming.items() if count)
+    lines += ["## Meest geraadpleegd", ""]
+    if ranked:
+        lines += ["| Artefact | Verwezen door |", "|---|---:|"]
+        for count, path in sorted(ranked, key=lambda item: (-item[0], item[1]))[:10]:
+            lines.append(f"| `{path}` | {count} |")
+    else:
+        lines.append("- Geen")
+    lines.append("")
+
+    lines += ["## Verwijzingen per artefact", ""]
+    for artifact in catalogue:
+        targets = sorted(set(graph.forward.get(artifact.path, ())))
+        sources = sorted(set(graph.reverse.get(artifact.path, ())))
+        if not targets and not sources:
+            continue
+        lines.append(f"### `{artifact.path}`")
+        lines.append("")
+        if targets:
+            lines.append("Verwijst naar: " + ", ".join(f"`{target}`" for target in targets))
+            lines.append("")
+        if sources:
+            lines.append("Verwezen door: " + ", ".join(f"`{source}`" for source in sources))
+            lines.append("")
+
+    orphans = [
+        artifact for artifact in catalogue
+        if not incoming.get(artifact.path) and artifact.kind not in ("prompt", "template")
+    ]
+    lines += ["## Niet verwezen", ""]
+    lines += [f"- `{artifact.path}` ({artifact.kind})" for artifact in orphans] or ["- Geen"]
+    lines.append("")
+
+    if external:
+        lines += ["## Externe doelen", ""]
+        lines += [f"- `{target}`" for target in external]
+        lines.append("")
+
+    lines += ["## Onopgeloste verwijzingen", ""]
+    if unresolved:
+        lines += ["| Bron | Regel | Verwijzing | Reden |", "|---|---:|---|---|"]
+        for item in unresolved:
+            lines.append(f"| `{item.source}` | {item.line} | `{_cell(item.raw)}` | {item.reason} |")
+    else:
+        lines.append("- Geen")
+    lines += [
+        "",
+        "---",
+        "",
+        "Gegenereerd volgens:",
+        "- governance/charters-agents/charter.canon-curator.md",
+        "- .github/prompts/canon-curator-onderhoud-overzicht.prompt.md",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_inconsistenties(
+    catalogue: Catalogue,
+    outcomes: list[RuleOutcome],
+    *,
+    opdracht: str,
+    scope: str | None,
+) -> str:
+    """Rapport ``inconsistenties``: bevindingen van de consistentieregels.
+
+    Regels lopen over het hele corpus; het rapport toont bevindingen over
+    artefacten binnen de scope. Bevindingen over workspace-bestanden buiten
+    het corpus (state, ping) staan alleen in het rapport zonder scope.
+    """
+    lines = render_header(
+        "Canon Curator Rapport — Inconsistenties",
+        opdracht=opdracht,
+        scope=scope,
+        output_formaat="inconsistenties",
+    )
+    in_scope = set(catalogue.by_path)
+    everything = scope in (None, "all")
+    findings = [
+        finding for outcome in outcomes for finding in outcome.findings
+        if finding.path in in_scope or everything
+    ]
+    errors = sum(1 for finding in findings if finding.severity == "fout")
+
+    lines += [
+        "## Samenvatting",
+        "",
+        f"- Artefacten: {len(catalogue)}",
+        f"- Regels: {len(outcomes)} ({sum(1 for o in outcomes if not o.cached)} geëvalueerd, "
+        f"{sum(1 for o in outcomes if o.cached)} uit cache)",
+        f"- Bevindingen: {len(findings)} ({errors} fout, {len(findings) - errors} waarschuwing)",
+        "",
+        "## Bevindingen",
+        "",
+    ]
+    if findings:
+        lines += ["| Regel | Ernst | Artefact | Regelnr | Bevinding |", "|---|---|---|---:|---|"]
+        for finding in findings:
+            lines.append(
+                f"| {finding.rule} | {finding.severity} | `{finding.path}` "
+                f"| {finding.line or '-'} | {_cell(finding.message)} |"
+            )
+    else:
+        lines.append("- Geen inconsistenties gevonden")
+    lines.append("")
+
+    lines += ["## Regels", "", "| Regel | Bevindingen | Duur (ms) | Bron |", "|---|---:|---:|---|"]
+    for outcome in outcomes:
+        source = "cache" if outcome.cached else "geëvalueerd"
+        lines.append(f"| {outcome.rule} | {len(outcome.findings)} | {outcome.duration_ms:.1f} | {source} |")
+    lines += [
+        "",
+        "## Aanbevelingen",
+        "",
+        "- Los fouten op via de constitutioneel-auteur; waarschuwingen bij de volgende wijziging."
+        if findings else "- Geen",
+        "",
+        "---",
+        "",
+        "Gegenereerd volgens:",
+        "- governance/charters-agents/charter.canon-curator.md",
+        "- .github/prompts/canon-curator-onderhoud-overzicht.prompt.md",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_lacunes(matrix: GapMatrix, *, opdracht: str, scope: str | None) -> str:
+    """Rapport ``lacunes``: ontbrekende charters, prompts en runners per agent."""
+    lines = render_header(
+        "Canon Curator Rapport — Lacunes",
+        opdracht=opdracht,
+        scope=scope,
+        output_formaat="lacunes",
+    )
+    kinds = SCOPE_KINDS.get(scope or "all", ARTIFACT_KINDS)
+    missing = sorted(
+        ((kind, agent) for kind, agent in matrix.missing if kind in kinds),
+        key=lambda pair: (pair[1], ARTIFACT_KINDS.index(pair[0])),
+    )
+    unclaimed = sorted(matrix.unclaimed_charters) if KIND_CHARTER in kinds else []
+
+    lines += [
+        "## Samenvatting",
+        "",
+        f"- Agents met boundary: {len(matrix.boundaries)}",
+        f"- Verwachte artefacten: {sum(1 for kind, _ in matrix.expected if kind in kinds)}",
+        f"- Ontbrekend: {len(missing)}",
+        f"- Charters zonder boundary: {len(unclaimed)}",
+        "",
+        "## Matrix",
+        "",
+    ]
+    if matrix.boundaries:
+        lines += [
+            "| Agent | Domein | " + " | ".join(kind.capitalize() for kind in kinds) + " |",
+            "|---|---|" + "---|" * len(kinds),
+        ]
+        for name, boundary in sorted(matrix.boundaries.items()):
+            cells = []
+            for kind in kinds:
+                if (kind, name) not in matrix.present:
+                    cells.append("ontbreekt")
+                elif kind == KIND_PROMPT:
+                    cells.append(str(matrix.prompt_counts[name]))
+                else:
+                    cells.append("ja")
+            domein = boundary.value_stream or boundary.domein
+            lines.append(f"| {name} | {_cell(domein)} | " + " | ".join(cells) + " |")
+    else:
+        lines.append("- Geen agent boundaries gevonden")
+    lines.append("")
+
+    lines += ["## Bevindingen", ""]
+    lines += [
+        f"- {agent}: {kind} ontbreekt (verwacht `{expected_path(kind, agent)}`)"
+        for kind, agent in missing
+    ] or ["- Geen lacunes"]
+    lines.append("")
+    if unclaimed:
+        lines += ["### Charters zonder boundary", ""]
+        lines += [f"- `{matrix.charters[agent]}`" for agent in unclaimed]
+        lines.append("")
+
+    lines += [
+        "## Aanbevelingen",
+        "",
+        "- Laat ontbrekende artefacten opstellen via de agent-smeder (zie Bevindingen)."
+        if missing else "- Geen",
+        "",
+        "---",
+        "",
+        "Gegenereerd volgens:",
+        "- governance/charters-agents/charter.canon-curator.md",
+        "- .github/prompts/canon-curator-onderhoud-overzicht.prompt.md",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_impact(report: ImpactReport, *, limit: int = 25) -> str:
+    """Sectie ``Impact`` van een wijzigingsvoorstel: direct en transitief, per value stream."""
+    if not report.changed:
+        return "Geen betrokken artefacten; impact niet te bepalen."
+    direct, transitive = report.direct, report.transitive
+    lines = [
+        f"- Gewijzigd: {len(report.changed)} artefact(en)",
+        f"- Direct geraakt: {len(direct)}",
+        f"- Transitief geraakt: {len(transitive)}",
+        f"- Berekend in {report.duration_ms:.1f} ms",
+        "",
+    ]
+    if not report.entries:
+        lines.append("Geen andere artefacten verwijzen naar de betrokken artefacten.")
+        return "\n".join(lines)
+
+    lines += ["### Per value stream", "", "| Value stream | Direct | Transitief |", "|---|---:|---:|"]
+    for stream, entries in sorted(report.by_stream().items()):
+        count = sum(1 for entry in entries if entry.direct)
+        lines.append(f"| {stream} | {count} | {len(entries) - count} |")
+    lines.append("")
+
+    lines += [
+        "### Geraakte artefacten (gerangschikt)",
+        "",
+        "| Artefact | Impact | Afstand | Verwezen door | Value stream |",
+        "|---|---|---:|---:|---|",
+    ]
+    for entry in report.entries[:limit]:
+        soort = "direct" if entry.direct else "transitief"
+        lines.append(
+            f"| `{entry.path}` | {soort} | {entry.distance} | {entry.referrers} | {entry.value_stream} |"
+        )
+    if len(report.entries) > limit:
+        lines.append(f"| … | {len(report.entries) - limit} meer | | | |")
+    return "\n".join(lines)
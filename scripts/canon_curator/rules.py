@@ -0,0 +1,357 @@
+"""Consistentieregels over het normatieve stelsel.
+
+Een regel (``Rule``) controleert één soort samenhang tussen documenten en
+levert bevindingen (``Finding``) op. Regels lezen de catalogus, de
+verwijzingsgraaf en waar nodig de tekst van documenten via een gedeelde
+``RuleContext``.
+
+Elke regel declareert zijn invoer: welke corpus-paden ertoe doen
+(``inputs``) en welke bestanden buiten het corpus (``workspace_files``,
+glob-patronen zoals ``state-*.md``). Over die invoer wordt per regel een
+vingerafdruk berekend, samen met de broncode van de module waarin de
+regel staat (berichten, patronen en hulpfuncties daar tellen dus mee).
+``evaluate`` voert alleen regels uit waarvan de vingerafdruk afwijkt van
+de vorige keer (``.canon-curator/rules.json``); voor de rest worden de
+bewaarde bevindingen hergebruikt. Wijzigt gedrag in een andere module
+waar een regel op leunt (bijv. ``scanner``), verhoog dan ``RULES_VERSION``. Regels lopen
+parallel in een thread pool en worden elk apart getimed.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple
+
+from canon_curator.graph import UNRESOLVED_PATTERN, ReferenceGraph
+from canon_curator.scanner import Catalogue
+from kernel.batch import default_jobs, run_pool
+from kernel.hashing import hash_bytes, hash_file
+from kernel.locking import atomic_write_text
+
+
+RULES_VERSION = 1
+
+SEVERITY_ERROR = "fout"
+SEVERITY_WARNING = "waarschuwing"
+
+PING_FILE = "normatief-stelsel.ping"
+RUNNER_DIR = "scripts"
+STATE_GLOB = "state-*.md"
+
+_CONSTITUTIE_MENTION = re.compile(
+    r"[Cc]onstitutie\b[^\n]{0,60}?\b(?:versie|version|v)\s*(\d+\.\d+(?:\.\d+)?)"
+)
+_PING_STAMP = re.compile(r"PING:\s*(\d{4}-\d{2}-\d{2})")
+_STATE_PING = re.compile(r"[Pp]ing[^\n]*?(\d{4}-\d{2}-\d{2})")
+
+
+class Finding(NamedTuple):
+    """Eén bevinding van een regel."""
+    rule: str
+    severity: str
+    path: str
+    line: int | None
+    message: str
+
+
+class RuleOutcome(NamedTuple):
+    """Resultaat van één regel: bevindingen, duur en of het uit de cache kwam."""
+    rule: str
+    findings: list[Finding]
+    duration_ms: float
+    cached: bool
+
+
+class RuleContext:
+    """Gedeelde invoer voor regels: catalogus, graaf en documenttekst."""
+
+    def __init__(self, base: Path, catalogue: Catalogue, graph: ReferenceGraph) -> None:
+        self.base = base
+        self.catalogue = catalogue
+        self.graph = graph
+        self._texts: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def read(self, path: str) -> str:
+        """Tekst van een bestand (relatief aan de workspace), gecachet."""
+        with self._lock:
+            text = self._texts.get(path)
+        if text is None:
+            try:
+                text = (self.base / path).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                text = ""
+            with self._lock:
+                self._texts[path] = text
+        return text
+
+    def workspace_files(self, pattern: str) -> list[str]:
+        """Workspace-paden die op een glob-patroon passen."""
+        return sorted(
+            path.relative_to(self.base).as_posix() for path in self.base.glob(pattern) if path.is_file()
+        )
+
+
+class Rule(NamedTuple):
+    """Een consistentieregel met zijn invoer."""
+    name: str
+    description: str
+    check: Callable[[RuleContext], list[Finding]]
+    inputs: Callable[[str], bool] = lambda path: False
+    workspace_files: tuple[str, ...] = ()
+    layout: bool = False        # hangt af van welke paden bestaan (niet alleen inhoud)
+
+
+def _line_of(text: str, offset: int) -> int:
+    return text.count("\n", 0, offset) + 1
+
+
+def check_constitutie_versie(context: RuleContext) -> list[Finding]:
+    """Eén constitutie-versie, en vermeldingen elders die ermee kloppen."""
+    rule = "constitutie-versie"
+    constituties = [a for a in context.catalogue if a.path.rpartition("/")[2] == "constitutie.md"]
+    findings: list[Finding] = []
+    versions = {a.version for a in constituties if a.version}
+    if len(versions) > 1:
+        for artifact in constituties:
+            findings.append(Finding(
+                rule, SEVERITY_ERROR, artifact.path, None,
+                f"Conflicterende constitutie-versies: {', '.join(sorted(versions))}",
+            ))
+        return findings
+    if not versions:
+        return findings
+    current = versions.pop()
+    own = {a.path for a in constituties}
+
+    documents = [a.path for a in context.catalogue if a.path not in own]
+    documents += context.workspace_files(STATE_GLOB)
+    for path in documents:
+        text = context.read(path)
+        for match in _CONSTITUTIE_MENTION.finditer(text):
+            if match.group(1) == current:
+                continue
+            line_end = text.find("\n", match.end())
+            line_text = text[text.rfind("\n", 0, match.start()) + 1:line_end if line_end >= 0 else None]
+            # Bronvermeldingen ("gelezen op ...") documenteren een eerdere versie
+            if "gelezen op" in line_text:
+                continue
+            findings.append(Finding(
+                rule, SEVERITY_WARNING, path, _line_of(text, match.start()),
+                f"Verwijst naar constitutie v{match.group(1)}; actueel is v{current}",
+            ))
+    return findings
+
+
+def check_charter_doctrines(context: RuleContext) -> list[Finding]:
+    """Charters die naar niet-bestaande doctrines verwijzen."""
+    charters = {a.path for a in context.catalogue if a.kind == "charter"}
+    return [
+        Finding(
+            "charter-doctrines", SEVERITY_ERROR, item.source, item.line,
+            f"Verwijst naar ontbrekende doctrine: {item.raw}",
+        )
+        for item in context.graph.unresolved
+        if item.source in charters
+        and "doctrine" in item.raw.rpartition("/")[2]
+        and item.reason != UNRESOLVED_PATTERN
+    ]
+
+
+def check_prompt_runners(context: RuleContext) -> list[Finding]:
+    """Prompts die naar niet-bestaande runner scripts verwijzen."""
+    prompts = {a.path for a in context.catalogue if a.kind == "prompt"}
+    runners = {path.rpartition("/")[2] for path in context.workspace_files(f"{RUNNER_DIR}/*.py")}
+    return [
+        Finding(
+            "prompt-runners", SEVERITY_ERROR, item.source, item.line,
+            f"Verwijst naar ontbrekende runner: {item.raw}",
+        )
+        for item in context.graph.unresolved
+        if item.source in prompts and item.raw.endswith(".py") and item.reason != UNRESOLVED_PATTERN
+        # Een kale scriptnaam ("kernelrunner.py") verwijst naar de runner in scripts/
+        and item.raw.rpartition("/")[2] not in runners
+    ]
+
+
+def check_state_ping(context: RuleContext) -> list[Finding]:
+    """Workspace state die een oudere ping vermeldt dan het pingbestand."""
+    rule = "state-ping"
+    states = context.workspace_files(STATE_GLOB)
+    if not states:
+        return []
+    ping = _PING_STAMP.search(context.read(PING_FILE))
+    if ping is None:
+        return [Finding(rule, SEVERITY_ERROR, PING_FILE, None, "Pingbestand ontbreekt of heeft geen PING-datum")]
+    ping_date = ping.group(1)
+
+    findings: list[Finding] = []
+    for path in states:
+        text = context.read(path)
+        mentions = [
+            (match.group(1), match.start()) for match in _STATE_PING.finditer(text)
+            if PING_FILE in text[text.rfind("\n", 0, match.start()) + 1:match.end()]
+        ]
+        if not mentions:
+            findings.append(Finding(rule, SEVERITY_WARNING, path, None, "State vermeldt geen normatief-stelsel ping"))
+            continue
+        for date, offset in mentions:
+            if date < ping_date:
+                findings.append(Finding(
+                    rule, SEVERITY_WARNING, path, _line_of(text, offset),
+                    f"State verwijst naar ping van {date}; actuele ping is van {ping_date}",
+                ))
+    return findings
+
+
+def check_dubbele_identifier(context: RuleContext) -> list[Finding]:
+    """Artefacten die dezelfde identifier claimen."""
+    findings: list[Finding] = []
+    for identifier, artifacts in context.catalogue.group_by("identifier").items():
+        if identifier == "-" or len(artifacts) < 2 or "<" in identifier:
+            continue
+        others = ", ".join(a.path for a in artifacts)
+        for artifact in artifacts:
+            findings.append(Finding(
+                "dubbele-identifier", SEVERITY_ERROR, artifact.path, None,
+                f"Identifier {identifier} komt meerdere keren voor: {others}",
+            ))
+    return findings
+
+
+def _is_charter(path: str) -> bool:
+    return path.startswith("charters-agents/") or "charter" in path.rpartition("/")[2]
+
+
+RULES: tuple[Rule, ...] = (
+    Rule(
+        "constitutie-versie",
+        "Constitutie-versie eenduidig en consistent vermeld",
+        check_constitutie_versie,
+        inputs=lambda path: True,
+        workspace_files=(STATE_GLOB,),
+    ),
+    Rule(
+        "charter-doctrines",
+        "Charters verwijzen naar bestaande doctrines",
+        check_charter_doctrines,
+        inputs=_is_charter,
+        layout=True,
+    ),
+    Rule(
+        "prompt-runners",
+        "Prompts verwijzen naar bestaande runners",
+        check_prompt_runners,
+        inputs=lambda path: path.startswith(".github/prompts/"),
+        workspace_files=(f"{RUNNER_DIR}/*.py",),
+        layout=True,
+    ),
+    Rule(
+        "state-ping",
+        "Workspace state vermeldt de actuele normatief-stelsel ping",
+        check_state_ping,
+        workspace_files=(STATE_GLOB, PING_FILE),
+    ),
+    Rule(
+        "dubbele-identifier",
+        "Identifiers zijn uniek",
+        check_dubbele_identifier,
+        inputs=lambda path: True,
+    ),
+)
+
+
+def _code_digest(check: Callable[..., Any]) -> str:
+    """Digest van de broncode van de module waarin ``check`` gedefinieerd is."""
+    module_file = getattr(sys.modules.get(check.__module__), "__file__", None)
+    if module_file:
+        try:
+            return hash_file(Path(module_file))
+        except OSError:
+            pass
+    code = check.__code__
+    return hash_bytes(code.co_code + repr(code.co_consts).encode("utf-8"))
+
+
+def rule_fingerprint(rule: Rule, digests: dict[str, str], base: Path) -> str:
+    """Vingerafdruk over de invoer en de code (hele module) van een regel."""
+    parts = [_code_digest(rule.check)]
+    parts += [f"{path}\0{digests[path]}" for path in sorted(digests) if rule.inputs(path)]
+    if rule.layout:
+        parts.append("\0".join(sorted(digests)))
+    for pattern in rule.workspace_files:
+        for path in sorted(base.glob(pattern)):
+            if path.is_file():
+                parts.append(f"{path.relative_to(base).as_posix()}\0{hash_file(path)}")
+    return hash_bytes("\n".join(parts).encode("utf-8"))
+
+
+def _load_cache(cache_file: Path) -> dict[str, Any]:
+    try:
+        raw = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != RULES_VERSION:
+        return {}
+    return dict(raw.get("rules") or {})
+
+
+def evaluate(
+    context: RuleContext,
+    digests: dict[str, str],
+    cache_file: Path,
+    rules: Iterable[Rule] = RULES,
+    jobs: int | None = None,
+) -> list[RuleOutcome]:
+    """Evalueer regels; alleen regels met gewijzigde invoer worden uitgevoerd.
+
+    Parameters
+    ----------
+    context : RuleContext
+        Gedeelde invoer (catalogus van het hele corpus en de graaf)
+    digests : dict[str, str]
+        Digest per corpus-pad (uit de artefact-index)
+    cache_file : Path
+        Bewaarde bevindingen en vingerafdrukken per regel
+    jobs : int, optional
+        Maximaal aantal gelijktijdige regels
+
+    Returns
+    -------
+    list[RuleOutcome]
+        Per regel, in de volgorde van ``rules``
+    """
+    rules = list(rules)
+    cache = _load_cache(cache_file)
+    fingerprints = {rule.name: rule_fingerprint(rule, digests, context.base) for rule in rules}
+
+    def run(rule: Rule) -> RuleOutcome:
+        entry = cache.get(rule.name)
+        if entry and entry.get("fingerprint") == fingerprints[rule.name]:
+            findings = [Finding(*item) for item in entry["findings"]]
+            return RuleOutcome(rule.name, findings, entry.get("duration_ms", 0.0), True)
+        start = time.perf_counter()
+        findings = rule.check(context)
+        duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        return RuleOutcome(rule.name, findings, duration_ms, False)
+
+    outcomes = run_pool(rules, run, jobs or default_jobs())
+
+    if any(not outcome.cached for outcome in outcomes):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(cache_file, json.dumps({
+            "version": RULES_VERSION,
+            "rules": {
+                outcome.rule: {
+                    "fingerprint": fingerprints[outcome.rule],
+                    "duration_ms": outcome.duration_ms,
+                    "findings": [list(finding) for finding in outcome.findings],
+                }
+                for outcome in outcomes
+            },
+        }, ensure_ascii=False, indent=1))
+    return outcomes
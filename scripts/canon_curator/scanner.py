@@ -0,0 +1,380 @@
+"""Inventarisatie van het normatieve stelsel.
+
+De scanner loopt de corpus-mappen af (``grondslagen/``, ``beleid/``,
+``templates/``, ``charters-agents/``, ``.github/prompts/``) en leest van
+elk Markdown-artefact alleen de kop: front-matter, titel en de
+metadata-regels daaronder::
+
+    ---
+    agent: workspace.moeder            # front-matter (prompts)
+    ---
+    # Doctrine — Tijdreferentie        # titel
+    **Versie**: 1.0.0                  # metadata-regels
+    **Status**: Actief
+    - Last updated: 2026-01-14         # lijstvorm (state, handoff)
+
+Het lezen stopt bij de eerste inhoudelijke sectie of na MAX_HEADER_LINES
+regels, zodat de kosten per bestand niet afhangen van de lengte van het
+document. Bij grote corpora (vanaf PARALLEL_MIN_FILES bestanden) wordt
+het parsen in brokken over een process pool verdeeld.
+
+Het resultaat is een ``Catalogue`` in het geheugen waaruit rapporten
+(overzicht, relaties, inconsistenties, lacunes) opgebouwd worden.
+"""
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, TypeVar
+
+from kernel.hashing import IGNORED_NAMES
+
+
+CORPUS_ROOTS = ("grondslagen", "beleid", "templates", "charters-agents", ".github/prompts")
+
+# Mappen per --scope van onderhoud-overzicht
+SCOPE_ROOTS = {
+    "doctrines": ("grondslagen", "beleid"),
+    "charters": ("charters-agents",),
+    "prompts": (".github/prompts",),
+    "all": CORPUS_ROOTS,
+}
+
+ARTIFACT_SUFFIX = ".md"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Metadata staat bovenaan; verder lezen levert niets op
+MAX_HEADER_LINES = 60
+
+# Onder dit aantal bestanden kost een process pool meer dan hij oplevert
+PARALLEL_MIN_FILES = 2000
+CHUNK_SIZE = 500
+
+# Veldnamen (kleine letters) die op hetzelfde kenmerk wijzen
+FIELD_ALIASES = {
+    "versie": "version",
+    "version": "version",
+    "datum": "date",
+    "date": "date",
+    "last updated": "date",
+    "laatst bijgewerkt": "date",
+    "created at": "date",
+    "status": "status",
+    "identifier": "identifier",
+    "agent identifier": "identifier",
+    "phase identifier": "identifier",
+    "id": "identifier",
+    "eigenaar": "owner",
+    "owner": "owner",
+    "type": "type",
+}
+
+_BOLD_FIELD = re.compile(r"^\*\*(?P<key>[^*]+?)\*\*\s*:\s*(?P<value>.*?)\s*$")
+_LIST_FIELD = re.compile(r"^[-*]\s+(?P<key>[A-Za-z][\w ()/-]{0,40}?)\s*:\s*(?P<value>.+?)\s*$")
+_FRONT_FIELD = re.compile(r"^(?P<key>[A-Za-z][\w-]*)\s*:\s*(?P<value>.*?)\s*$")
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# Patronen draaien op "\n" + tekst: een letterlijk beginteken is veel
+# sneller dan ^ in MULTILINE-modus (dat op elke positie geprobeerd wordt)
+_FENCE = re.compile(r"\n[ \t]*(?:```|~~~)")
+_HEADING = re.compile(r"\n[ \t]*(#{1,6})(?:[ \t]+([^\n]*)|[ \t]*)(?=\n|\Z)")
+_LINK = re.compile(r"\[[^\]]*\]\(\s*<?([^)\s>]+)>?\s*\)")
+# Padvermeldingen worden gevonden via hun extensie en daarna terug gelezen
+# tot het eerste teken dat niet in een pad hoort (placeholders {naam} en
+# <naam> horen er wel bij)
+_PATH_EXTENSION = re.compile(r"\.(?:md|py|ya?ml|ping)(?![\w/])")
+_PATH_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.{}<>/-")
+
+
+class ArtifactMeta(NamedTuple):
+    """Metadata van één artefact in het corpus."""
+    path: str                   # relatief POSIX-pad
+    root: str                   # corpus-map waaronder het valt
+    kind: str                   # doctrine, charter, prompt, template, beleid, grondslag
+    title: str | None
+    version: str | None
+    date: str | None            # ISO-datum (JJJJ-MM-DD) indien herkenbaar
+    status: str | None
+    identifier: str | None
+    fields: dict[str, str]      # alle kopvelden (kleine letters)
+    size: int
+    mtime_ns: int
+
+
+def _clean(value: str) -> str:
+    return value.strip().strip("`").strip()
+
+
+def parse_header(lines: Iterable[str]) -> tuple[str | None, dict[str, str]]:
+    """Lees titel en kopvelden uit de eerste regels van een document.
+
+    Returns
+    -------
+    tuple[str | None, dict[str, str]]
+        Titel (eerste kop) en velden met kleine-letter sleutels; bij
+        dubbele velden wint het eerste voorkomen
+    """
+    title: str | None = None
+    fields: dict[str, str] = {}
+    in_front_matter = False
+    for number, raw in enumerate(lines):
+        if number >= MAX_HEADER_LINES:
+            break
+        line = raw.rstrip("\n").rstrip()
+
+        if number == 0 and line == "---":
+            in_front_matter = True
+            continue
+        if in_front_matter:
+            if line == "---":
+                in_front_matter = False
+                continue
+            match = _FRONT_FIELD.match(line)
+            if match:
+                fields.setdefault(match["key"].lower(), _clean(match["value"]).strip("'\""))
+            continue
+
+        if line.startswith("#"):
+            heading = line.lstrip("#").strip()
+            if title is None:
+                title = heading
+                continue
+            # Eerste inhoudelijke sectie: einde van de kop (een statusblok niet)
+            if heading.lower() not in ("status", "metadata"):
+                break
+            continue
+
+        match = _BOLD_FIELD.match(line) or _LIST_FIELD.match(line)
+        if match:
+            fields.setdefault(match["key"].strip().lower(), _clean(match["value"]))
+    return title, fields
+
+
+def _kind_for(root: str, name: str) -> str:
+    if root == ".github/prompts":
+        return "prompt"
+    if root == "charters-agents":
+        return "charter"
+    if root == "templates":
+        return "template"
+    if root == "beleid":
+        return "beleid"
+    lowered = name.lower()
+    if "doctrine" in lowered:
+        return "doctrine"
+    if "charter" in lowered:
+        return "charter"
+    return "grondslag"
+
+
+def _normalized(fields: dict[str, str]) -> dict[str, str]:
+    normalized: dict[str, str] = {}
+    for key, value in fields.items():
+        alias = FIELD_ALIASES.get(key)
+        if alias is not None and value:
+            normalized.setdefault(alias, value)
+    return normalized
+
+
+def build_meta(
+    rel: str,
+    root: str,
+    title: str | None,
+    fields: dict[str, str],
+    size: int,
+    mtime_ns: int,
+) -> ArtifactMeta:
+    """ArtifactMeta uit een geparste kop (genormaliseerde velden)."""
+    known = _normalized(fields)
+    date_match = _ISO_DATE.search(known.get("date", ""))
+    return ArtifactMeta(
+        path=rel,
+        root=root,
+        kind=_kind_for(root, rel.rpartition("/")[2]),
+        title=title,
+        version=known.get("version"),
+        date=date_match.group(0) if date_match else None,
+        status=known.get("status"),
+        identifier=known.get("identifier"),
+        fields=fields,
+        size=size,
+        mtime_ns=mtime_ns,
+    )
+
+
+def read_artifact(path: str, rel: str, root: str) -> ArtifactMeta:
+    """Lees de kop van één artefact.
+
+    Raises
+    ------
+    OSError
+        Als het bestand niet gelezen kan worden
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        st = os.fstat(f.fileno())
+        title, fields = parse_header(f)
+    return build_meta(rel, root, title, fields, st.st_size, st.st_mtime_ns)
+
+
+def extract_outline(text: str) -> tuple[list[tuple[int, int, str]], list[tuple[int, str]]]:
+    """Koppen en uitgaande verwijzingen van een volledig document.
+
+    Verwijzingen zijn Markdown-links en padvermeldingen (``doctrine-x.md``,
+    ``scripts/moeder.py``, ``state-<workspace>.md``), zonder anker en zonder
+    externe URL's. Koppen binnen code-blokken tellen niet mee; verwijzingen
+    wel.
+
+    Returns
+    -------
+    tuple
+        ``[(regel, niveau, tekst)]`` en ``[(regel, doel)]`` (eerste
+        vermelding per doel), regels 1-based
+    """
+    # Regex over de hele tekst (in C) i.p.v. een Python-lus per regel;
+    # offsets in ``padded`` liggen één voor op die in ``text``
+    padded = "\n" + text
+
+    def line_of(offset: int) -> int:
+        return padded.count("\n", 0, offset + 1)
+
+    fences = [m.start() for m in _FENCE.finditer(padded)]
+    headings: list[tuple[int, int, str]] = []
+    for match in _HEADING.finditer(padded):
+        # Binnen een code-blok als er een oneven aantal fences aan voorafgaat
+        if bisect_right(fences, match.start()) % 2:
+            continue
+        headings.append((line_of(match.start()), len(match.group(1)), (match.group(2) or "").strip()))
+
+    found: dict[str, int] = {}
+
+    def add(target: str, offset: int) -> None:
+        target = target.split("#", 1)[0].removeprefix("./")
+        if not target or "://" in target or target.startswith(("mailto:", "//")):
+            return
+        if target not in found or offset < found[target]:
+            found[target] = offset
+
+    for match in _LINK.finditer(padded):
+        add(match.group(1), match.start())
+    for match in _PATH_EXTENSION.finditer(padded):
+        start = match.start()
+        while start > 0 and padded[start - 1] in _PATH_CHARS:
+            start -= 1
+        name = padded[start:match.start()].rpartition("/")[2]
+        # Geen naam (``.md``) of een ander bestand als extensie (``a.md.md``)
+        if name and name[-1] not in "./-" and not name.startswith("."):
+            if padded[start - 1] != ":":
+                add(padded[start:match.end()], start)
+    references = sorted((line_of(offset), target) for target, offset in found.items())
+    return headings, references
+
+
+def map_chunks(func: Callable[[list[T]], R], items: list[T], jobs: int | None = None) -> list[R]:
+    """Pas ``func`` toe op brokken van ``items``; via een process pool bij grote aantallen."""
+    workers = jobs or os.cpu_count() or 1
+    if len(items) < PARALLEL_MIN_FILES or workers < 2:
+        return [func(items)] if items else []
+    from concurrent.futures import ProcessPoolExecutor
+    chunks = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return list(pool.map(func, chunks))
+
+
+def _read_chunk(chunk: list[tuple[str, str, str]]) -> tuple[list[ArtifactMeta], list[tuple[str, str]]]:
+    """Worker: lees een brok artefacten (ook in een apart proces)."""
+    found: list[ArtifactMeta] = []
+    errors: list[tuple[str, str]] = []
+    for path, rel, root in chunk:
+        try:
+            found.append(read_artifact(path, rel, root))
+        except OSError as exc:
+            errors.append((rel, str(exc)))
+    return found, errors
+
+
+def iter_corpus(base: Path, roots: Iterable[str]) -> Iterator[tuple[str, str, str]]:
+    """(absoluut pad, relatief pad, corpus-map) van alle artefacten onder de roots."""
+    for root in roots:
+        stack = [(os.path.join(base, root), root)]
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name in IGNORED_NAMES:
+                        continue
+                    rel = f"{rel_dir}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel))
+                    elif entry.name.endswith(ARTIFACT_SUFFIX) and entry.is_file():
+                        yield entry.path, rel, root
+
+
+class Catalogue:
+    """Catalogus van artefacten in het geheugen, met afgeleide indexen."""
+
+    def __init__(
+        self,
+        artifacts: Iterable[ArtifactMeta],
+        roots: Iterable[str],
+        errors: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        self.artifacts = sorted(artifacts, key=lambda a: a.path)
+        self.roots = tuple(roots)
+        self.errors = list(errors)
+        self.by_path = {artifact.path: artifact for artifact in self.artifacts}
+
+    def __len__(self) -> int:
+        return len(self.artifacts)
+
+    def __iter__(self) -> Iterator[ArtifactMeta]:
+        return iter(self.artifacts)
+
+    def group_by(self, attribute: str) -> dict[str, list[ArtifactMeta]]:
+        """Artefacten per waarde van een attribuut (``None`` als ``"-"``)."""
+        groups: dict[str, list[ArtifactMeta]] = {}
+        for artifact in self.artifacts:
+            key = getattr(artifact, attribute) or "-"
+            groups.setdefault(key, []).append(artifact)
+        return groups
+
+    def missing(self, attribute: str) -> list[ArtifactMeta]:
+        """Artefacten zonder waarde voor een attribuut (bijv. ``version``)."""
+        return [artifact for artifact in self.artifacts if not getattr(artifact, attribute)]
+
+
+def scan_corpus(
+    base: Path,
+    roots: Iterable[str] = CORPUS_ROOTS,
+    jobs: int | None = None,
+) -> Catalogue:
+    """Inventariseer het corpus onder ``base``.
+
+    Parameters
+    ----------
+    base : Path
+        Workspace root
+    roots : Iterable[str]
+        Corpus-mappen (relatief aan ``base``); ontbrekende mappen worden
+        overgeslagen
+    jobs : int, optional
+        Aantal processen bij grote corpora (default: aantal CPU's)
+
+    Returns
+    -------
+    Catalogue
+        Alle gevonden artefacten; onleesbare bestanden staan in ``errors``
+    """
+    roots = tuple(roots)
+    artifacts: list[ArtifactMeta] = []
+    failures: list[tuple[str, str]] = []
+    for found, errors in map_chunks(_read_chunk, list(iter_corpus(base, roots)), jobs):
+        artifacts.extend(found)
+        failures.extend(errors)
+    return Catalogue(artifacts, roots, failures)
@@ -0,0 +1,238 @@
+"""Bulkvalidatie van handoffs (``valideer-handoffs``).
+
+Alle handoffs die op een glob-patroon passen worden gehasht (parallel,
+zie ``kernel.hashing.hash_files``). Resultaten worden gecachet op
+content-hash in ``.canon-curator/handoffs.json``: een ongewijzigde handoff
+wordt niet opnieuw geparst, ook niet na verplaatsen of kopiëren. De cache
+bevat alleen de revisies uit de laatste run. Alleen
+de missers worden gevalideerd, in brokken over een process pool
+(``scanner.map_chunks``).
+
+Required reads hangen van de workspace af, niet alleen van de handoff: de
+cache bewaart daarom de doelen en die worden bij elke run opnieuw opgelost
+tegen één ``PathIndex``. Elke bron wordt daarbij hooguit één keer gehasht.
+
+Uitvoer: tekst, JSON of JUnit XML (voor CI-rapportage).
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from canon_curator.handoff import (
+    SEVERITY_ERROR,
+    VALIDATION_VERSION,
+    Issue,
+    ResolvedRead,
+    parse_handoff,
+    resolve_reads,
+    validate_handoff,
+)
+from canon_curator.paths import PathIndex
+from canon_curator.scanner import map_chunks
+from kernel.hashing import IGNORED_NAMES, hash_files
+from kernel.locking import atomic_write_text
+
+
+class HandoffResult(NamedTuple):
+    """Validatieresultaat van één handoff."""
+    path: str
+    digest: str | None
+    issues: list[Issue]
+    reads: list[ResolvedRead]
+    cached: bool
+
+    @property
+    def valid(self) -> bool:
+        return not any(issue.severity == SEVERITY_ERROR for issue in self.issues)
+
+
+class SweepSummary(NamedTuple):
+    """Resultaten van een bulkvalidatie."""
+    results: list[HandoffResult]
+    duration_ms: float
+
+    @property
+    def invalid(self) -> list[HandoffResult]:
+        return [result for result in self.results if not result.valid]
+
+    @property
+    def cached(self) -> int:
+        return sum(1 for result in self.results if result.cached)
+
+
+def find_handoffs(base: Path, patterns: Iterable[str]) -> list[str]:
+    """Workspace-paden (gesorteerd, uniek) die op een van de patronen passen."""
+    found: set[str] = set()
+    for pattern in patterns:
+        for path in base.glob(pattern):
+            rel = path.relative_to(base)
+            if path.is_file() and not IGNORED_NAMES.intersection(rel.parts):
+                found.add(rel.as_posix())
+    return sorted(found)
+
+
+def _validate_chunk(chunk: list[tuple[str, str]]) -> list[tuple[str, dict[str, list]]]:
+    """Worker: valideer een brok ``(absoluut pad, relatief pad)`` (ook in een apart proces).
+
+    Levert per handoff een cache-entry: structuurbevindingen en de doelen
+    van de required reads.
+    """
+    results: list[tuple[str, dict[str, list]]] = []
+    for path, rel in chunk:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                handoff = parse_handoff(handle)
+            entry = {
+                "issues": [list(issue) for issue in validate_handoff(handoff)],
+                "reads": [list(target) for target in handoff.read_targets()],
+            }
+        except (OSError, UnicodeDecodeError) as exc:
+            entry = {"issues": [[SEVERITY_ERROR, None, f"Kan handoff niet lezen: {exc}"]], "reads": []}
+        results.append((rel, entry))
+    return results
+
+
+def _load_cache(cache_file: Path) -> dict[str, dict[str, list]]:
+    try:
+        raw = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != VALIDATION_VERSION:
+        return {}
+    return dict(raw.get("entries") or {})
+
+
+def validate_handoffs(
+    base: Path,
+    paths: list[str],
+    cache_file: Path,
+    jobs: int | None = None,
+) -> SweepSummary:
+    """Valideer handoffs; ongewijzigde inhoud komt uit de cache.
+
+    Parameters
+    ----------
+    base : Path
+        Workspace root
+    paths : list[str]
+        Handoffs, relatief aan de workspace root
+    cache_file : Path
+        Resultaten per content-hash
+    jobs : int, optional
+        Aantal workers voor hashen en valideren
+
+    Returns
+    -------
+    SweepSummary
+        Resultaten in de volgorde van ``paths``
+    """
+    start = time.perf_counter()
+    cache = _load_cache(cache_file)
+
+    absolute = {rel: base / rel for rel in paths}
+    digests: dict[str, str | None] = {}
+    unreadable: list[str] = []
+    readable = []
+    for rel, path in absolute.items():
+        (readable if path.is_file() else unreadable).append(rel)
+    hashed = hash_files([absolute[rel] for rel in readable], jobs=jobs)
+    for rel in readable:
+        digests[rel] = hashed[absolute[rel]]
+    for rel in unreadable:
+        digests[rel] = None
+
+    entries: dict[str, dict[str, list]] = {}
+    hits: set[str] = set()
+    misses: list[tuple[str, str]] = []
+    for rel in paths:
+        digest = digests[rel]
+        entry = cache.get(digest) if digest else None
+        if entry is not None:
+            entries[rel] = entry
+            hits.add(rel)
+        else:
+            misses.append((str(absolute[rel]), rel))
+
+    fresh = 0
+    for chunk in map_chunks(_validate_chunk, misses, jobs):
+        for rel, entry in chunk:
+            entries[rel] = entry
+            digest = digests[rel]
+            if digest:
+                cache[digest] = entry
+                fresh += 1
+
+    index = PathIndex.build(base)
+    results: dict[str, HandoffResult] = {}
+    for rel in paths:
+        entry = entries[rel]
+        reads, read_issues = resolve_reads((tuple(target) for target in entry["reads"]), index)
+        issues = sorted(
+            [Issue(*item) for item in entry["issues"]] + read_issues,
+            key=lambda issue: (issue.line is not None, issue.line or 0),
+        )
+        results[rel] = HandoffResult(rel, digests[rel], issues, reads, rel in hits)
+
+    # Alleen revisies die nu nog bestaan blijven bewaard
+    live = {digest for digest in digests.values() if digest}
+    if fresh or not live.issuperset(cache):
+        kept = {digest: entry for digest, entry in cache.items() if digest in live}
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(
+            cache_file,
+            json.dumps({"version": VALIDATION_VERSION, "entries": kept}, ensure_ascii=False, separators=(",", ":")),
+        )
+    duration_ms = round((time.perf_counter() - start) * 1000, 3)
+    return SweepSummary([results[rel] for rel in paths], duration_ms)
+
+
+def to_json(summary: SweepSummary) -> str:
+    """Samenvatting als JSON."""
+    return json.dumps({
+        "total": len(summary.results),
+        "invalid": len(summary.invalid),
+        "cached": summary.cached,
+        "duration_ms": summary.duration_ms,
+        "results": [
+            {
+                "path": result.path,
+                "digest": result.digest,
+                "valid": result.valid,
+                "cached": result.cached,
+                "issues": [issue._asdict() for issue in result.issues],
+                "reads": [read._asdict() for read in result.reads],
+            }
+            for result in summary.results
+        ],
+    }, indent=2, ensure_ascii=False)
+
+
+def to_junit(summary: SweepSummary) -> str:
+    """Samenvatting als JUnit XML: één testcase per handoff."""
+    from xml.etree import ElementTree
+
+    suite = ElementTree.Element("testsuite", {
+        "name": "valideer-handoffs",
+        "tests": str(len(summary.results)),
+        "failures": str(len(summary.invalid)),
+        "time": f"{summary.duration_ms / 1000:.3f}",
+    })
+    for result in summary.results:
+        case = ElementTree.SubElement(suite, "testcase", {"classname": "handoff", "name": result.path})
+        lines = [
+            f"{result.path}:{issue.line}: {issue.severity}: {issue.message}" if issue.line
+            else f"{result.path}: {issue.severity}: {issue.message}"
+            for issue in result.issues
+        ]
+        errors = [issue.message for issue in result.issues if issue.severity == SEVERITY_ERROR]
+        if errors:
+            failure = ElementTree.SubElement(case, "failure", {"message": "; ".join(errors)})
+            failure.text = "\n".join(lines)
+        elif lines:
+            ElementTree.SubElement(case, "system-out").text = "\n".join(lines)
+    root = ElementTree.Element("testsuites")
+    root.append(suite)
+    return ElementTree.tostring(root, encoding="unicode", xml_declaration=True)
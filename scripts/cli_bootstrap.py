@@ -0,0 +1,51 @@
+"""Lichtgewicht CLI-bootstrap voor de runner scripts.
+
+Runners worden in CI honderden keren per pipeline gestart, vaak voor
+``--help`` of een triviaal subcommando. Zware modules (PyYAML, sqlite3,
+concurrency, sockets) horen daarom pas geladen te worden als een
+subcommando ze werkelijk gebruikt.
+
+``lazy_import`` geeft een module-object terug dat pas bij het eerste
+attribuut-gebruik echt geïmporteerd wordt::
+
+    from cli_bootstrap import lazy_import
+
+    yaml = lazy_import("yaml")        # nog niets geladen
+    ...
+    data = yaml.safe_load(f)          # hier pas import van PyYAML
+
+Een ontbrekende module geeft direct een ImportError (de module wordt wel
+gezocht, alleen niet uitgevoerd), zodat een kapotte installatie niet pas
+midden in een run opvalt.
+
+Het startup-budget wordt bewaakt door ``startup_benchmark.py``.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Importeer ``name`` pas bij het eerste attribuut-gebruik.
+
+    Raises
+    ------
+    ImportError
+        Als de module niet gevonden kan worden
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Module niet gevonden: {name}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1 @@
+"""Dispatch package - één procesingang (canon.py) voor alle runner frontdoors"""
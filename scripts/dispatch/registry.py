@@ -0,0 +1,161 @@
+"""Plugin-registry van runner frontdoors voor de ``canon`` dispatcher.
+
+Elke runner registreert zich onder een naam met een *loader*: een functie
+die pas bij het eerste gebruik de runner laadt en zijn entrypoint
+``main(argv) -> int`` teruggeeft. Zo kost een registratie niets bij het
+opstarten; alleen de runners die in een batch voorkomen worden geladen,
+en elk maar één keer per proces.
+
+Runner scripts met een streepje in de naam (``canon-curator.py``) zijn
+geen importeerbare modules; ``script_loader`` laadt ze via ``importlib``
+onder een eigen modulenaam, zodat ze niet botsen met gelijknamige
+packages (``moeder.py`` naast ``moeder/``).
+
+Extra runners registreren zich met ``register``::
+
+    from dispatch.registry import register, script_loader
+
+    register("mijn-agent", "Omschrijving", script_loader("mijn-agent.py"))
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+Entrypoint = Callable[[list[str]], int]
+
+
+class Runner(NamedTuple):
+    """Geregistreerde runner: naam, omschrijving en lazy loader."""
+    name: str
+    description: str
+    loader: Callable[[], Entrypoint]
+
+
+_REGISTRY: dict[str, Runner] = {}
+_LOADED: dict[str, Entrypoint] = {}
+
+
+def register(name: str, description: str, loader: Callable[[], Entrypoint]) -> None:
+    """Registreer een runner.
+
+    Raises
+    ------
+    ValueError
+        Als de naam al geregistreerd is
+    """
+    if name in _REGISTRY:
+        raise ValueError(f"Runner al geregistreerd: {name}")
+    _REGISTRY[name] = Runner(name, description, loader)
+
+
+def runners() -> list[Runner]:
+    """Alle geregistreerde runners, op naam gesorteerd."""
+    return sorted(_REGISTRY.values())
+
+
+def script_loader(script: str, entrypoint: str = "main") -> Callable[[], Entrypoint]:
+    """Loader die ``scripts/<script>`` via importlib laadt.
+
+    Raises
+    ------
+    ImportError
+        (bij laden) Als het script niet bestaat of geen entrypoint heeft
+    """
+    def load() -> Entrypoint:
+        path = SCRIPTS_DIR / script
+        module_name = "_canon_runner_" + path.stem.replace("-", "_")
+        module = sys.modules.get(module_name)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None or not path.exists():
+                raise ImportError(f"Runner script niet gevonden: {script}")
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+        main = getattr(module, entrypoint, None)
+        if main is None:
+            raise ImportError(f"Runner {script} heeft geen {entrypoint}()")
+        return main
+
+    return load
+
+
+def resolve(name: str) -> Entrypoint:
+    """Entrypoint van een runner (geladen bij het eerste gebruik).
+
+    Raises
+    ------
+    KeyError
+        Als de runner niet geregistreerd is
+    """
+    entry = _LOADED.get(name)
+    if entry is None:
+        runner = _REGISTRY.get(name)
+        if runner is None:
+            raise KeyError(name)
+        entry = _LOADED[name] = runner.loader()
+    return entry
+
+
+def dispatch(name: str, argv: list[str]) -> int:
+    """Voer één operatie uit en geef de exit code.
+
+    ``SystemExit`` uit argparse (``--help``, ongeldige argumenten) wordt
+    omgezet naar een exit code, zodat een batch doorloopt. Fouten van de
+    runner zelf worden als ``ERROR:`` gemeld.
+    """
+    try:
+        entry = resolve(name)
+    except KeyError:
+        known = ", ".join(runner.name for runner in runners())
+        print(f"ERROR: Onbekende runner: {name} (bekend: {known})", file=sys.stderr)
+        return 2
+    except ImportError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    # argparse van de runner leidt zijn programmanaam af van sys.argv[0]
+    saved_argv0 = sys.argv[0] if sys.argv else ""
+    if sys.argv:
+        sys.argv[0] = f"canon {name}"
+    try:
+        return int(entry(list(argv)) or 0)
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(f"ERROR: {exc.code}", file=sys.stderr)
+        return 1
+    except Exception as exc:
+        print(f"ERROR: {name}: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if sys.argv:
+            sys.argv[0] = saved_argv0
+
+
+def register_builtin() -> None:
+    """Registreer de runners die met deze workspace meekomen."""
+    builtin = (
+        ("moeder", "moeder.py", "Workspace ordening en governance (moeder.frontdoor)"),
+        ("agent-smeder", "agent-smeder.py", "Agent-ontwerp in stappen (agent_smeder.frontdoor)"),
+        ("canon-curator", "canon-curator.py", "Onderhoud normatief stelsel (op_* operaties)"),
+        ("constitutioneel-auteur", "constitutioneel-auteur.py", "Handoff voor normatieve wijzigingen"),
+        ("python-expert", "python-expert.py", "Syntax- en structuurchecks voor Python"),
+        ("vertaler", "vertaler.py", "Vertaling-skeleton nl-en / en-nl"),
+        ("essayist", "essayist.py", "Essay-skeleton"),
+    )
+    for name, script, description in builtin:
+        if name not in _REGISTRY:
+            register(name, description, script_loader(script))
@@ -0,0 +1,47 @@
+"""Operatie-stromen voor de ``canon`` dispatcher.
+
+Een batch (bestand of stdin) bevat één operatie per regel, in shell-syntax:
+de runnernaam gevolgd door zijn argumenten::
+
+    # lege regels en commentaar worden overgeslagen
+    moeder valideer-governance --opdracht "controle" --check-only
+    canon-curator valideer-handoff --handoff-bestand handoff.md
+    python-expert check-syntax scripts/canon.py
+
+Regels worden gelezen terwijl ze binnenkomen, zodat een producent op
+stdin operaties kan blijven aanleveren aan één lopend proces.
+"""
+from __future__ import annotations
+
+import shlex
+from typing import Iterable, Iterator, NamedTuple
+
+
+class Operation(NamedTuple):
+    """Eén operatie uit een batch."""
+    line: int
+    runner: str
+    argv: list[str]
+
+    def describe(self) -> str:
+        return shlex.join([self.runner, *self.argv])
+
+
+def parse_operations(lines: Iterable[str]) -> Iterator[Operation]:
+    """Lees operaties uit een regelstroom.
+
+    Raises
+    ------
+    ValueError
+        Bij een regel met ongeldige shell-syntax (bijv. open aanhalingsteken)
+    """
+    for number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            words = shlex.split(text, comments=True)
+        except ValueError as exc:
+            raise ValueError(f"Regel {number}: {exc}") from None
+        if words:
+            yield Operation(number, words[0], words[1:])
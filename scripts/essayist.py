@@ -182,7 +182,7 @@ def _write_trace(
     return trace_path
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Essayist runner voor validatie en essaysjabloon"
     )
@@ -227,7 +227,7 @@ def main() -> int:
         help="Schrijf geen tracebestand weg",
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Validate
     validated = _validate_input(args)
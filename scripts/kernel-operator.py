@@ -6,6 +6,7 @@ human-in-the-loop gatekeeping en observability.
 
 Usage:
     python scripts/kernel-operator.py --help
+    python scripts/kernel-operator.py observe-run [--run-id <run-id>] [--detail-level summary|events|full] [--follow]
 
 Operaties:
     start-run    - Start een kernel-run met preflight en gebruikersbevestiging
@@ -16,16 +17,168 @@ Traceability:
 - Runner schrijft traces weg in temp/ voor debugging
 - Verwijst naar kernelrunner.py voor daadwerkelijke kernel-run uitvoering
 
-TODO: Implementatie in stap 4 (schrijf runner).
+TODO: start-run en cleanup implementeren in stap 4 (schrijf runner).
 """
 
+from __future__ import annotations
+
+import argparse
 import sys
-from pathlib import Path
+from collections import Counter
+from typing import Any
+
+import kernelrunner
+from kernel.journal import RECORD_EVENT, RECORD_RESULT, RECORD_RUN
+from kernel.tail import format_record
+from kernel.timing import parse_timestamp
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="kernel-operator",
+        description="Kernel Operator runner. Beheert en observeert kernel-runs.",
+    )
+
+    subparsers = parser.add_subparsers(dest="operatie", help="Operatie type", required=True)
+
+    parser_observe = subparsers.add_parser(
+        "observe-run",
+        help="Observeer status en events van een kernel-run",
+    )
+    parser_observe.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help="Run om te observeren (default: laatste run)",
+    )
+    parser_observe.add_argument(
+        "--detail-level",
+        type=str,
+        choices=["summary", "events", "full"],
+        default="summary",
+        help="Hoeveelheid detail in output (default: summary)",
+    )
+    parser_observe.add_argument(
+        "--follow",
+        action="store_true",
+        help="Volg nieuwe events live totdat de run compleet is",
+    )
+
+    subparsers.add_parser("start-run", help="Start een kernel-run (nog niet geïmplementeerd)")
+    subparsers.add_parser("cleanup", help="Voer cleanup uit (nog niet geïmplementeerd)")
+
+    return parser
+
+
+def _duration_seconds(start: str | None, end: str | None) -> str:
+    """Duur tussen twee log-timestamps, of '-' als onbekend."""
+    begin = parse_timestamp(start)
+    finish = parse_timestamp(end)
+    if begin is None or finish is None:
+        return "-"
+    return f"{(finish - begin).total_seconds():.0f}s"
+
+
+def _print_summary(
+    run_id: str,
+    header: dict[str, Any],
+    events: list[dict[str, Any]],
+    result: dict[str, Any] | None,
+) -> None:
+    """Print de samenvatting conform kernel-operator-observe-run prompt."""
+    if result is None:
+        status = "in-progress"
+    elif result.get("status") == "success":
+        status = "completed"
+    else:
+        status = "failed"
+
+    state_ref = header.get("state_ref") or {}
+    start = (header.get("timestamps") or {}).get("start")
+
+    print(f"Run: {run_id}")
+    print(f"Status: {status}")
+    print(f"Workspace: {header.get('workspace', '-')}")
+    print(f"State: {state_ref.get('path', '-')} ({state_ref.get('hash') or '-'})")
+    print(f"Created: {start or '-'}")
+    print(f"Duration: {_duration_seconds(start, result.get('end') if result else None)}")
+    print("\nEvents:")
+    counts = Counter(event.get("type", "onbekend") for event in events)
+    if counts:
+        for event_type, count in sorted(counts.items()):
+            print(f"- {event_type}: {count}")
+    else:
+        print("- (geen)")
+    print(f"\nResult: {result.get('status') if result else '-'}")
+
+
+def op_observe_run(*, run_id: str | None, detail_level: str, follow: bool) -> int:
+    """Operatie: observe-run
+
+    Leest het run-journal incrementeel (geen volledige herparse bij --follow)
+    en rapporteert status, timing en event-samenvatting.
+    """
+    if not kernelrunner.KERNEL_RUNS_DIR.exists():
+        print(f"ERROR: {kernelrunner.KERNEL_RUNS_DIR} bestaat niet", file=sys.stderr)
+        return 1
+
+    if run_id is None:
+        latest = kernelrunner.list_runs(limit=1)
+        if not latest:
+            print("WARNING: Geen runs gevonden in .kernel/runs/", file=sys.stderr)
+            return 0
+        run_id = latest[0].run_id
+
+    header: dict[str, Any] = {}
+    events: list[dict[str, Any]] = []
+    result: dict[str, Any] | None = None
+
+    try:
+        for _, kind, data in kernelrunner.tail_runs([run_id], follow=follow):
+            if kind == RECORD_RUN:
+                header = data
+            elif kind == RECORD_EVENT:
+                events.append(data)
+            elif kind == RECORD_RESULT:
+                result = data
+            if follow and detail_level != "summary":
+                print(format_record(run_id, kind, data), flush=True)
+    except FileNotFoundError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+
+    if not header:
+        print(f"ERROR: Run log corrupt of onleesbaar: {run_id}", file=sys.stderr)
+        return 1
+
+    if detail_level != "summary" and not follow:
+        for event in events:
+            print(format_record(run_id, RECORD_EVENT, event))
+        print()
+
+    _print_summary(run_id, header, events, result)
+
+    if detail_level == "full":
+        print()
+        print(kernelrunner.export_run(run_id), end="")
+    return 0
 
 
 def main() -> int:
     """Main entry point."""
-    print("ERROR: kernel-operator runner nog niet geïmplementeerd", file=sys.stderr)
+    args = build_parser().parse_args()
+
+    if args.operatie == "observe-run":
+        return op_observe_run(
+            run_id=args.run_id,
+            detail_level=args.detail_level,
+            follow=args.follow,
+        )
+
+    print(f"ERROR: kernel-operator operatie '{args.operatie}' nog niet geïmplementeerd", file=sys.stderr)
     print("TODO: Implementeer in Agent Smeder stap 4", file=sys.stderr)
     return 1
 
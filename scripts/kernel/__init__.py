@@ -0,0 +1 @@
+"""Kernel package - bouwstenen voor de runner kernel (kernelrunner.py)"""
@@ -0,0 +1,194 @@
+"""Gecomprimeerde archieflaag voor run-logs (``.kernel/archive/``).
+
+Runs buiten het hot-venster van ``.kernel/runs/`` worden per startdag
+(UTC) samengevoegd in één segment::
+
+    .kernel/archive/segment-20260115.gz    — gzip members, één per run
+    .kernel/archive/segment-20260115.idx   — JSONL: run_id, offset, length, ...
+
+Elke run is een eigen gzip member; aaneengeschakelde members vormen samen
+een geldig gzip-bestand (``zcat`` werkt), terwijl één run terug te halen
+is door alleen zijn byte-range te lezen en te decomprimeren. Offset en
+lengte staan in de run-catalogus én in het ``.idx`` bestand naast het
+segment, zodat de catalogus uit de archieven herbouwd kan worden.
+
+Toevoegen gebeurt onder een lock op het segment, met één fsync per
+segment per archiveerronde. Segmenten verlopen als geheel: zodra geen
+enkele run in de catalogus nog naar een segment verwijst, wordt het
+verwijderd. Verlopen runs in een segment dat nog in gebruik is, worden
+uit het ``.idx`` bestand geschrapt (hun bytes blijven staan tot het
+segment vervalt), zodat een herbouw van de catalogus ze niet terugbrengt.
+"""
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
+
+from kernel.locking import atomic_write_text, file_lock, lock_path_for, locked_append
+
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".gz"
+INDEX_SUFFIX = ".idx"
+COMPRESS_LEVEL = 6
+
+
+class ArchiveMember(NamedTuple):
+    """Eén te archiveren run: inhoud plus metadata voor de index."""
+    run_id: str
+    payload: bytes
+    meta: dict[str, Any]
+
+
+class ArchiveLocation(NamedTuple):
+    """Plaats van een gearchiveerde run binnen een segment."""
+    segment: Path
+    offset: int
+    length: int
+
+
+def segment_path(archive_dir: Path, started_at: float | None) -> Path:
+    """Segment voor een run, op basis van de startdag (UTC)."""
+    if started_at is None:
+        day = "00000000"
+    else:
+        day = datetime.fromtimestamp(started_at, tz=timezone.utc).strftime("%Y%m%d")
+    return archive_dir / f"{SEGMENT_PREFIX}{day}{SEGMENT_SUFFIX}"
+
+
+def index_path_for(segment: Path) -> Path:
+    """Pad naar het ``.idx`` bestand van een segment."""
+    return segment.with_suffix(INDEX_SUFFIX)
+
+
+def append_members(segment: Path, members: list[ArchiveMember]) -> list[ArchiveLocation]:
+    """Voeg runs toe aan een segment (één lock, één fsync).
+
+    Returns
+    -------
+    list[ArchiveLocation]
+        Locatie per member, in dezelfde volgorde
+    """
+    if not members:
+        return []
+    import gzip
+    segment.parent.mkdir(parents=True, exist_ok=True)
+
+    locations: list[ArchiveLocation] = []
+    index_lines: list[str] = []
+    with file_lock(segment):
+        with open(segment, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            for member in members:
+                blob = gzip.compress(member.payload, compresslevel=COMPRESS_LEVEL, mtime=0)
+                f.write(blob)
+                location = ArchiveLocation(segment, offset, len(blob))
+                locations.append(location)
+                index_lines.append(json.dumps({
+                    "run_id": member.run_id,
+                    "offset": location.offset,
+                    "length": location.length,
+                    **member.meta,
+                }, ensure_ascii=False, default=str) + "\n")
+                offset += len(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        index = index_path_for(segment)
+        index.touch(exist_ok=True)
+        locked_append(index, "".join(index_lines))
+    return locations
+
+
+def read_member(segment: Path, offset: int, length: int) -> bytes:
+    """Lees en decomprimeer precies één run uit een segment."""
+    import gzip
+    with open(segment, "rb") as f:
+        f.seek(offset)
+        blob = f.read(length)
+    if len(blob) != length:
+        raise OSError(f"Segment afgebroken: {segment} (offset {offset})")
+    return gzip.decompress(blob)
+
+
+def iter_index(segment: Path) -> Iterator[dict[str, Any]]:
+    """Lees de indexregels van een segment (laatste regel per run wint)."""
+    try:
+        with open(index_path_for(segment), encoding="utf-8") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return
+
+
+def prune_index(segment: Path, run_ids: set[str]) -> int:
+    """Schrap runs uit de index van een segment (onder de segment-lock).
+
+    Returns
+    -------
+    int
+        Aantal geschrapte indexregels
+    """
+    index = index_path_for(segment)
+    with file_lock(segment):
+        kept: list[str] = []
+        removed = 0
+        try:
+            with open(index, encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break
+                    try:
+                        run_id = json.loads(line).get("run_id")
+                    except json.JSONDecodeError:
+                        continue
+                    if run_id in run_ids:
+                        removed += 1
+                    else:
+                        kept.append(line)
+        except FileNotFoundError:
+            return 0
+        if removed:
+            atomic_write_text(index, "".join(kept))
+    return removed
+
+
+def find_in_index(archive_dir: Path, run_id: str) -> tuple[ArchiveLocation, dict[str, Any]] | None:
+    """Zoek een run in de segment-indexen (fallback zonder catalogus).
+
+    Returns
+    -------
+    tuple[ArchiveLocation, dict] or None
+        Locatie en indexregel van de run (de laatste regel wint)
+    """
+    found: tuple[ArchiveLocation, dict[str, Any]] | None = None
+    for segment in list_segments(archive_dir):
+        for entry in iter_index(segment):
+            if entry.get("run_id") != run_id:
+                continue
+            try:
+                found = ArchiveLocation(segment, int(entry["offset"]), int(entry["length"])), entry
+            except (KeyError, TypeError, ValueError):
+                continue
+    return found
+
+
+def list_segments(archive_dir: Path) -> list[Path]:
+    """Alle segmenten in het archief, oudste eerst."""
+    if not archive_dir.exists():
+        return []
+    return sorted(archive_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"))
+
+
+def remove_segment(segment: Path) -> None:
+    """Verwijder een segment met zijn index en lock."""
+    segment.unlink(missing_ok=True)
+    index_path_for(segment).unlink(missing_ok=True)
+    lock_path_for(segment).unlink(missing_ok=True)
@@ -0,0 +1,79 @@
+"""Batch-uitvoering van agent-runs voor de runner kernel.
+
+Een batch-manifest (YAML of JSON) bevat een lijst van runs::
+
+    runs:
+      - agent: moeder
+        intent: orden workspace
+        trigger: pipeline
+      - agent: canon-curator
+        intent: onderhoud overzicht
+
+Een lijst zonder ``runs:`` sleutel is ook toegestaan. ``trigger`` is
+optioneel. De kernel voert de runs uit via een begrensde thread pool en
+deelt daarbij één preflight en één state snapshot.
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, NamedTuple, TypeVar
+
+
+DEFAULT_TRIGGER = "batch"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchItem(NamedTuple):
+    """Eén run uit een batch-manifest."""
+    agent: str
+    intent: str
+    trigger: str
+
+
+def parse_manifest(data: Any) -> list[BatchItem]:
+    """Valideer een geparsed manifest en zet het om naar BatchItems.
+
+    Raises
+    ------
+    ValueError
+        Bij een ongeldig manifest
+    """
+    if isinstance(data, dict):
+        data = data.get("runs")
+    if not isinstance(data, list) or not data:
+        raise ValueError("Manifest moet een niet-lege lijst 'runs' bevatten")
+
+    items: list[BatchItem] = []
+    for index, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Run {index}: mapping met 'agent' en 'intent' verwacht")
+        agent = entry.get("agent")
+        intent = entry.get("intent")
+        if not agent or not intent:
+            raise ValueError(f"Run {index}: 'agent' en 'intent' zijn verplicht")
+        items.append(BatchItem(
+            agent=str(agent),
+            intent=str(intent),
+            trigger=str(entry.get("trigger") or DEFAULT_TRIGGER),
+        ))
+    return items
+
+
+def default_jobs() -> int:
+    """Standaard poolgrootte: aantal CPU's, begrensd op 8."""
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def run_pool(items: list[T], worker: Callable[[T], R], jobs: int) -> list[R]:
+    """Voer ``worker`` uit voor alle items met maximaal ``jobs`` threads.
+
+    Resultaten komen terug in manifest-volgorde.
+    """
+    jobs = max(1, min(jobs, len(items)))
+    if jobs == 1:
+        return [worker(item) for item in items]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="kernel-batch") as pool:
+        return list(pool.map(worker, items))
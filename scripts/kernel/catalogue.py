@@ -0,0 +1,288 @@
+"""Index van kernel-runs in SQLite (``.kernel/runs.sqlite``).
+
+De catalogus legt per run vast: run_id, agent, intent, pad, start, einde,
+laatste schrijfmoment, status, grootte en (na archivering) de plek in het
+archiefsegment. Hij wordt bijgewerkt op het
+moment dat de kernel een run start of finaliseert, zodat retentie en
+queries (``list-runs``) alleen de matchende rijen lezen en geen run-logs
+hoeven te openen.
+
+De catalogus is afgeleid, niet normatief: bij verlies of twijfel wordt hij
+met ``rebuild`` opnieuw opgebouwd uit de run-logs zelf. ``merge`` vult een
+catalogus aan zonder bestaande rijen te overschrijven, zodat een eerste
+opbouw veilig kan samenvallen met runs die op dat moment gestart worden.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, NamedTuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    agent       TEXT,
+    intent      TEXT,
+    path        TEXT NOT NULL,
+    started_at  REAL,
+    ended_at    REAL,
+    updated_at  REAL,
+    status      TEXT,
+    size        INTEGER,
+    archive     TEXT,
+    archive_offset INTEGER,
+    archive_length INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_agent ON runs (agent, started_at);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started_at);
+CREATE INDEX IF NOT EXISTS runs_updated ON runs (updated_at);
+CREATE INDEX IF NOT EXISTS runs_archive ON runs (archive);
+"""
+
+# Kolommen die later zijn toegevoegd; bestaande catalogi worden gemigreerd
+_ADDED_COLUMNS = {
+    "archive": "TEXT",
+    "archive_offset": "INTEGER",
+    "archive_length": "INTEGER",
+}
+
+_COLUMNS = (
+    "run_id, agent, intent, path, started_at, ended_at, updated_at, status, size,"
+    " archive, archive_offset, archive_length"
+)
+_PLACEHOLDERS = ", ".join("?" * len(_COLUMNS.split(",")))
+
+
+class RunEntry(NamedTuple):
+    """Eén run in de catalogus (tijden als epoch seconden)."""
+    run_id: str
+    agent: str | None
+    intent: str | None
+    path: str
+    started_at: float | None
+    ended_at: float | None
+    updated_at: float | None
+    status: str | None
+    size: int | None
+    archive: str | None = None
+    archive_offset: int | None = None
+    archive_length: int | None = None
+
+
+class RunCatalogue:
+    """Thread-safe toegang tot de run-catalogus."""
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def exists(self) -> bool:
+        """Of de catalogus al op disk staat."""
+        return self.db_path.exists()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            import sqlite3
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path, timeout=10.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+            if existing:
+                for column, column_type in _ADDED_COLUMNS.items():
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {column_type}")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record_start(
+        self,
+        *,
+        run_id: str,
+        agent: str,
+        intent: str,
+        path: Path,
+        started_at: float,
+        size: int,
+    ) -> None:
+        """Registreer een gestarte run."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO runs (" + _COLUMNS + ")"
+                    " VALUES (?, ?, ?, ?, ?, NULL, ?, NULL, ?, NULL, NULL, NULL)",
+                    (run_id, agent, intent, str(path), started_at, started_at, size),
+                )
+
+    def record_end(
+        self,
+        *,
+        run_id: str,
+        ended_at: float,
+        status: str,
+        size: int,
+    ) -> None:
+        """Registreer het resultaat van een run."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE runs SET ended_at = ?, updated_at = ?, status = ?, size = ?"
+                    " WHERE run_id = ?",
+                    (ended_at, ended_at, status, size, run_id),
+                )
+
+    def query(
+        self,
+        *,
+        agent: str | None = None,
+        status: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+    ) -> list[RunEntry]:
+        """Zoek runs, nieuwste eerst."""
+        clauses: list[str] = []
+        params: list[object] = []
+        if agent is not None:
+            clauses.append("agent = ?")
+            params.append(agent)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("started_at < ?")
+            params.append(until)
+
+        sql = "SELECT " + _COLUMNS + " FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started_at DESC, run_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [RunEntry(*row) for row in rows]
+
+    def get(self, run_id: str) -> RunEntry | None:
+        """Eén run op ID, of None."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT " + _COLUMNS + " FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return RunEntry(*row) if row else None
+
+    def archive_candidates(self, *, keep: int, cutoff: float) -> list[RunEntry]:
+        """Afgeronde hot runs buiten de ``keep`` nieuwste, ouder dan ``cutoff``."""
+        sql = (
+            "SELECT " + _COLUMNS + " FROM ("
+            "  SELECT * FROM runs ORDER BY updated_at DESC LIMIT -1 OFFSET ?"
+            ") WHERE updated_at < ? AND archive IS NULL AND status IS NOT NULL"
+            " ORDER BY started_at"
+        )
+        with self._lock:
+            rows = self._connection().execute(sql, (keep, cutoff)).fetchall()
+        return [RunEntry(*row) for row in rows]
+
+    def expired(self, *, keep: int, cutoff: float) -> list[RunEntry]:
+        """Runs buiten de ``keep`` nieuwste, laatst bijgewerkt vóór ``cutoff``."""
+        sql = (
+            "SELECT " + _COLUMNS + " FROM ("
+            "  SELECT * FROM runs ORDER BY updated_at DESC LIMIT -1 OFFSET ?"
+            ") WHERE updated_at < ?"
+        )
+        with self._lock:
+            rows = self._connection().execute(sql, (keep, cutoff)).fetchall()
+        return [RunEntry(*row) for row in rows]
+
+    def mark_archived(self, locations: Iterable[tuple[str, str, int, int]]) -> None:
+        """Registreer (run_id, segment, offset, length) van gearchiveerde runs."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "UPDATE runs SET archive = ?, archive_offset = ?, archive_length = ?"
+                    " WHERE run_id = ?",
+                    (
+                        (segment, offset, length, run_id)
+                        for run_id, segment, offset, length in locations
+                    ),
+                )
+
+    def segment_in_use(self, segment: str) -> bool:
+        """Of nog een run in de catalogus naar dit segment verwijst."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM runs WHERE archive = ? LIMIT 1", (segment,)
+            ).fetchone()
+        return row is not None
+
+    def delete(self, run_ids: Iterable[str]) -> None:
+        """Verwijder runs uit de catalogus."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM runs WHERE run_id = ?",
+                    ((run_id,) for run_id in run_ids),
+                )
+
+    def merge(self, entries: Iterable[RunEntry]) -> int:
+        """Voeg runs toe die nog niet in de catalogus staan.
+
+        Returns
+        -------
+        int
+            Aantal aangeboden runs
+        """
+        rows = list(entries)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO runs (" + _COLUMNS + ")"
+                    " VALUES (" + _PLACEHOLDERS + ")",
+                    rows,
+                )
+        return len(rows)
+
+    def rebuild(self, entries: Iterable[RunEntry]) -> int:
+        """Vervang de volledige inhoud van de catalogus.
+
+        Returns
+        -------
+        int
+            Aantal geïndexeerde runs
+        """
+        rows = list(entries)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM runs")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO runs (" + _COLUMNS + ")"
+                    " VALUES (" + _PLACEHOLDERS + ")",
+                    rows,
+                )
+        return len(rows)
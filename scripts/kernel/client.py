@@ -0,0 +1,126 @@
+"""Dunne client voor de kernel-daemon (zie kernel/daemon.py).
+
+Gebruikt alleen de standaardbibliotheek (geen PyYAML), zodat agents en
+scripts goedkoop kunnen loggen via een reeds draaiende daemon. Eén client
+houdt één verbinding open voor al zijn requests.
+
+Voorbeeld::
+
+    with KernelClient(default_socket_path(workspace_root)) as kernel:
+        run = kernel.start_run("moeder", "orden workspace")
+        kernel.log_event(run["run_id"], "state_update", {"path": "..."})
+        kernel.finalize_run(run["run_id"], True, "klaar")
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import socket
+
+
+SOCKET_ENV_VAR = "KERNEL_SOCKET"
+
+
+class KernelClientError(Exception):
+    """Daemon onbereikbaar of request gefaald."""
+    pass
+
+
+def default_socket_path(workspace_root: Path) -> Path:
+    """Socketpad: ``$KERNEL_SOCKET`` of ``<workspace>/.kernel/kernel.sock``."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    return workspace_root / ".kernel" / "kernel.sock"
+
+
+class KernelClient:
+    """Persistente verbinding met de kernel-daemon."""
+
+    def __init__(self, socket_path: Path, timeout: float = 30.0) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+
+    def __enter__(self) -> "KernelClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _connect(self) -> None:
+        import socket
+        if not hasattr(socket, "AF_UNIX"):
+            raise KernelClientError("Unix domain sockets zijn niet beschikbaar op dit platform")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as e:
+            sock.close()
+            raise KernelClientError(
+                f"Kernel-daemon niet bereikbaar op {self.socket_path}: {e}"
+            ) from e
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def close(self) -> None:
+        """Sluit de verbinding (idempotent)."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def call(self, op: str, **params: Any) -> Any:
+        """Voer één operatie uit op de daemon en geef het resultaat terug.
+
+        Raises
+        ------
+        KernelClientError
+            Bij verbindingsfouten of een foutresponse van de daemon
+        """
+        if self._sock is None:
+            self._connect()
+        assert self._sock is not None
+
+        request = json.dumps({"op": op, "params": params}, ensure_ascii=False, default=str)
+        try:
+            self._sock.sendall(request.encode("utf-8") + b"\n")
+            line = self._reader.readline()
+        except OSError as e:
+            self.close()
+            raise KernelClientError(f"Verbinding met kernel-daemon verbroken: {e}") from e
+
+        if not line:
+            self.close()
+            raise KernelClientError("Kernel-daemon sloot de verbinding")
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise KernelClientError(response.get("error", "Onbekende fout"))
+        return response.get("result")
+
+    def ping(self) -> dict[str, Any]:
+        return self.call("ping")
+
+    def start_run(self, agent_name: str, intent: str, trigger: str = "handmatig") -> dict[str, Any]:
+        return self.call("start-run", agent_name=agent_name, intent=intent, trigger=trigger)
+
+    def log_event(self, run_id: str, event_type: str, details: dict[str, Any] | None = None) -> int:
+        return self.log_events(run_id, [{"type": event_type, **(details or {})}])
+
+    def log_events(self, run_id: str, events: list[dict[str, Any]]) -> int:
+        return self.call("log-events", run_id=run_id, events=events)
+
+    def finalize_run(self, run_id: str, success: bool, message: str) -> None:
+        self.call("finalize-run", run_id=run_id, success=success, message=message)
+
+    def shutdown(self) -> None:
+        self.call("shutdown")
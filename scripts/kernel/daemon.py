@@ -0,0 +1,132 @@
+"""Langlevende kernel-daemon op een Unix domain socket.
+
+Protocol: newline-delimited JSON over één persistente verbinding.
+
+- Request:  ``{"op": "<operatie>", "params": {...}}``
+- Response: ``{"ok": true, "result": ...}`` of ``{"ok": false, "error": "..."}``
+
+De daemon kent zelf geen kernel-logica: de aanroeper (kernelrunner.py)
+registreert operaties als functies ``params -> result``. Eén verbinding kan
+onbeperkt veel requests afhandelen, zodat een client per event alleen een
+socket round-trip betaalt in plaats van een nieuw Python-proces.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+Operation = Callable[[dict[str, Any]], Any]
+
+SHUTDOWN_OP = "shutdown"
+
+
+class DaemonError(Exception):
+    """Daemon kan niet gestart worden."""
+    pass
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Verwerkt requests van één client-verbinding, regel voor regel."""
+
+    server: "KernelServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(
+                json.dumps(response, ensure_ascii=False, default=str).encode("utf-8")
+                + b"\n"
+            )
+            self.wfile.flush()
+            if self.server.stop_requested.is_set():
+                # Pas stoppen nu het antwoord op ``shutdown`` verstuurd is
+                self.server.shutdown()
+                return
+
+
+class KernelServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server met een registry van operaties."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, operations: dict[str, Operation]) -> None:
+        self.socket_path = socket_path
+        self.operations = dict(operations)
+        self.stop_requested = threading.Event()
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def dispatch(self, line: bytes) -> dict[str, Any]:
+        """Voer één request uit en bouw het response-object."""
+        try:
+            request = json.loads(line)
+            op = request["op"]
+            params = request.get("params") or {}
+        except (ValueError, KeyError, TypeError) as e:
+            return {"ok": False, "error": f"Ongeldig request: {e}"}
+
+        if op == SHUTDOWN_OP:
+            # De handler stopt de server nadat dit antwoord geschreven is
+            self.stop_requested.set()
+            return {"ok": True, "result": "shutdown"}
+
+        operation = self.operations.get(op)
+        if operation is None:
+            return {"ok": False, "error": f"Onbekende operatie: {op}"}
+
+        try:
+            return {"ok": True, "result": operation(params)}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    """Ruim een verweesde socket op; weiger als er al een daemon luistert."""
+    if not socket_path.exists():
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+
+    raise DaemonError(f"Er draait al een kernel-daemon op {socket_path}")
+
+
+def serve(socket_path: Path, operations: dict[str, Operation]) -> None:
+    """Start de daemon en blokkeer tot een ``shutdown`` request of Ctrl+C.
+
+    Raises
+    ------
+    DaemonError
+        Als Unix sockets niet beschikbaar zijn of de socket al in gebruik is
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Unix domain sockets zijn niet beschikbaar op dit platform")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    _claim_socket_path(socket_path)
+
+    server = KernelServer(socket_path, operations)
+    try:
+        os.chmod(socket_path, 0o600)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,265 @@
+"""Afhankelijkheidsbewuste uitvoering van handoff-ketens (DAG).
+
+Een DAG-manifest (YAML of JSON) beschrijft handoffs met hun afhankelijkheden::
+
+    nodes:
+      - id: boundary
+        agent: moeder
+        intent: zet agent boundary
+      - id: charter
+        agent: agent-smeder
+        intent: schrijf charter
+        needs: [boundary]
+      - id: review
+        agent: canon-curator
+        intent: valideer handoff
+        needs: [charter]
+
+De scheduler start elke node zodra al zijn ``needs`` geslaagd zijn, en voert
+onafhankelijke takken parallel uit (begrensd door ``jobs``). Faalt een node,
+dan worden alle nodes die er (transitief) van afhangen overgeslagen.
+Na afloop bepaalt ``critical_path`` de langste keten van gemeten duur: de
+ondergrens voor de wall-clock tijd van de hele DAG.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterable, NamedTuple, TypeVar
+
+
+DEFAULT_TRIGGER = "dag"
+
+STATUS_SUCCESS = "success"
+STATUS_FAILURE = "failure"
+STATUS_SKIPPED = "skipped"
+
+R = TypeVar("R")
+
+
+class DagNode(NamedTuple):
+    """Eén handoff in de DAG."""
+    id: str
+    agent: str
+    intent: str
+    trigger: str
+    needs: tuple[str, ...]
+
+
+class NodeOutcome(NamedTuple):
+    """Uitkomst en timing van één node (seconden t.o.v. DAG-start)."""
+    node: DagNode
+    status: str
+    result: Any
+    start: float | None
+    end: float | None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+
+def parse_dag(data: Any) -> list[DagNode]:
+    """Valideer een geparsed manifest en geef de nodes in topologische volgorde.
+
+    Raises
+    ------
+    ValueError
+        Bij ontbrekende velden, dubbele IDs, onbekende afhankelijkheden
+        of een cyclus
+    """
+    if isinstance(data, dict):
+        data = data.get("nodes")
+    if not isinstance(data, list) or not data:
+        raise ValueError("Manifest moet een niet-lege lijst 'nodes' bevatten")
+
+    nodes: dict[str, DagNode] = {}
+    for index, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Node {index}: mapping met 'id', 'agent' en 'intent' verwacht")
+        node_id = entry.get("id")
+        agent = entry.get("agent")
+        intent = entry.get("intent")
+        if not node_id or not agent or not intent:
+            raise ValueError(f"Node {index}: 'id', 'agent' en 'intent' zijn verplicht")
+        if str(node_id) in nodes:
+            raise ValueError(f"Node {index}: dubbele id '{node_id}'")
+        needs = entry.get("needs") or []
+        if isinstance(needs, str):
+            needs = [needs]
+        nodes[str(node_id)] = DagNode(
+            id=str(node_id),
+            agent=str(agent),
+            intent=str(intent),
+            trigger=str(entry.get("trigger") or DEFAULT_TRIGGER),
+            needs=tuple(str(n) for n in needs),
+        )
+
+    for node in nodes.values():
+        for need in node.needs:
+            if need not in nodes:
+                raise ValueError(f"Node '{node.id}': onbekende afhankelijkheid '{need}'")
+
+    return _topological_order(nodes)
+
+
+def _topological_order(nodes: dict[str, DagNode]) -> list[DagNode]:
+    """Kahn's algoritme; stabiel in manifest-volgorde."""
+    indegree = {node_id: len(node.needs) for node_id, node in nodes.items()}
+    dependents = _dependents(nodes.values())
+    ready = [node_id for node_id, degree in indegree.items() if degree == 0]
+    order: list[DagNode] = []
+
+    while ready:
+        node_id = ready.pop(0)
+        order.append(nodes[node_id])
+        for dependent in dependents[node_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    if len(order) != len(nodes):
+        cyclic = sorted(node_id for node_id, degree in indegree.items() if degree > 0)
+        raise ValueError(f"Cyclus in afhankelijkheden: {', '.join(cyclic)}")
+    return order
+
+
+def _dependents(nodes: Iterable[DagNode]) -> dict[str, list[str]]:
+    """Omgekeerde adjacency: per node de nodes die ervan afhangen."""
+    nodes = list(nodes)
+    dependents: dict[str, list[str]] = {node.id: [] for node in nodes}
+    for node in nodes:
+        for need in node.needs:
+            dependents[need].append(node.id)
+    return dependents
+
+
+def execute_dag(
+    nodes: list[DagNode],
+    worker: Callable[[DagNode], R],
+    is_success: Callable[[R], bool],
+    jobs: int,
+    on_start: Callable[[DagNode, float], None] | None = None,
+    on_finish: Callable[[NodeOutcome], None] | None = None,
+) -> dict[str, NodeOutcome]:
+    """Voer de DAG uit: elke node start zodra zijn afhankelijkheden klaar zijn.
+
+    Parameters
+    ----------
+    nodes : list[DagNode]
+        Nodes in topologische volgorde (zie ``parse_dag``)
+    worker : callable
+        Voert één node uit
+    is_success : callable
+        Bepaalt of het resultaat van de worker geslaagd is
+    jobs : int
+        Maximaal aantal gelijktijdig lopende nodes
+    on_start, on_finish : callable, optional
+        Hooks voor logging; ``on_finish`` wordt ook voor overgeslagen nodes
+        aangeroepen
+
+    Returns
+    -------
+    dict[str, NodeOutcome]
+        Uitkomst per node-id
+    """
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+    by_id = {node.id: node for node in nodes}
+    dependents = _dependents(nodes)
+    remaining = {node.id: len(node.needs) for node in nodes}
+    outcomes: dict[str, NodeOutcome] = {}
+    origin = time.perf_counter()
+
+    def _finish(outcome: NodeOutcome) -> None:
+        outcomes[outcome.node.id] = outcome
+        if on_finish is not None:
+            on_finish(outcome)
+
+    def _skip(node_id: str) -> None:
+        # Sla node en alle (transitieve) afhankelijken over
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            if current in outcomes:
+                continue
+            _finish(NodeOutcome(by_id[current], STATUS_SKIPPED, None, None, None))
+            stack.extend(dependents[current])
+
+    def _run(node: DagNode) -> NodeOutcome:
+        start = time.perf_counter() - origin
+        if on_start is not None:
+            on_start(node, start)
+        try:
+            result = worker(node)
+        except Exception as e:
+            return NodeOutcome(
+                node, STATUS_FAILURE, None, start, time.perf_counter() - origin,
+                error=f"{type(e).__name__}: {e}",
+            )
+        status = STATUS_SUCCESS if is_success(result) else STATUS_FAILURE
+        return NodeOutcome(node, status, result, start, time.perf_counter() - origin)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="kernel-dag") as pool:
+        running: dict[Future[NodeOutcome], str] = {}
+        for node in nodes:
+            if remaining[node.id] == 0:
+                running[pool.submit(_run, node)] = node.id
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                outcome = future.result()
+                _finish(outcome)
+                for dependent in dependents[outcome.node.id]:
+                    if outcome.status != STATUS_SUCCESS:
+                        _skip(dependent)
+                        continue
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and dependent not in outcomes:
+                        running[pool.submit(_run, by_id[dependent])] = dependent
+
+    return outcomes
+
+
+def critical_path(
+    nodes: list[DagNode],
+    outcomes: dict[str, NodeOutcome],
+) -> tuple[list[str], float]:
+    """Langste keten (som van gemeten duur) door de DAG.
+
+    Parameters
+    ----------
+    nodes : list[DagNode]
+        Nodes in topologische volgorde
+    outcomes : dict[str, NodeOutcome]
+        Uitkomsten uit ``execute_dag``
+
+    Returns
+    -------
+    tuple[list[str], float]
+        Node-ids op het kritieke pad en de totale duur in seconden
+    """
+    best: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+
+    for node in nodes:
+        duration = outcomes[node.id].duration if node.id in outcomes else 0.0
+        parent = max(node.needs, key=lambda n: best[n], default=None)
+        best[node.id] = duration + (best[parent] if parent is not None else 0.0)
+        previous[node.id] = parent
+
+    if not best:
+        return [], 0.0
+
+    tail: str | None = max(best, key=lambda n: best[n])
+    length = best[tail]
+    path: list[str] = []
+    while tail is not None:
+        path.append(tail)
+        tail = previous[tail]
+    path.reverse()
+    return path, length
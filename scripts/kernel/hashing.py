@@ -0,0 +1,170 @@
+"""Gedeelde hash-primitieven: bestanden, bytes en Merkle-digests van mappen.
+
+SHA-256 is het canonieke algoritme (traceability in run-logs). Waar de
+optionele pakketten ``blake3`` of ``xxhash`` geïnstalleerd zijn, gebruikt de
+corpus-snapshot (een interne wijzigingsdetector) ze via ``fast_algorithm``;
+ze zijn nooit verplicht.
+
+Bestanden worden niet in kleine stukjes via een Python-lus gelezen: kleine
+bestanden in één ``read``, grote bestanden via ``mmap`` zodat de hashfunctie
+de volledige buffer in C (zonder GIL) verwerkt.
+
+Een Merkle-digest over een map combineert per map de gesorteerde
+(naam, digest)-paren van zijn kinderen tot één wortel-digest, onafhankelijk
+van de volgorde waarin bestanden gehasht zijn.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+try:
+    import blake3  # type: ignore[import-not-found]
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    import xxhash  # type: ignore[import-not-found]
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
+
+ALGORITHM_SHA256 = "sha256"
+ALGORITHM_BLAKE3 = "blake3"
+ALGORITHM_XXH3 = "xxh3_128"
+
+# Bestanden tot deze grootte in één read; daarboven via mmap
+SMALL_FILE_LIMIT = 1 << 20
+
+# Onder dit totaal kost een thread pool meer dan hij oplevert
+PARALLEL_MIN_BYTES = 8 << 20
+
+# Mappen en bestanden die nooit in een corpus-digest meetellen
+IGNORED_NAMES = frozenset({".git", "__pycache__", ".DS_Store"})
+
+
+def available_algorithms() -> list[str]:
+    """Beschikbare algoritmen, canonieke eerst."""
+    algorithms = [ALGORITHM_SHA256]
+    if blake3 is not None:
+        algorithms.append(ALGORITHM_BLAKE3)
+    if xxhash is not None:
+        algorithms.append(ALGORITHM_XXH3)
+    return algorithms
+
+
+def fast_algorithm() -> str:
+    """Snelste beschikbare algoritme (valt terug op SHA-256)."""
+    return available_algorithms()[-1]
+
+
+def new_hasher(algorithm: str = ALGORITHM_SHA256) -> Any:
+    """Nieuw hash-object met ``update``/``hexdigest``.
+
+    Raises
+    ------
+    ValueError
+        Als het algoritme niet beschikbaar is
+    """
+    if algorithm == ALGORITHM_SHA256:
+        return hashlib.sha256()
+    if algorithm == ALGORITHM_BLAKE3 and blake3 is not None:
+        return blake3.blake3()
+    if algorithm == ALGORITHM_XXH3 and xxhash is not None:
+        return xxhash.xxh3_128()
+    raise ValueError(f"Hash-algoritme niet beschikbaar: {algorithm}")
+
+
+def hash_bytes(data: bytes, algorithm: str = ALGORITHM_SHA256) -> str:
+    """Hex digest van een buffer."""
+    hasher = new_hasher(algorithm)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def hash_file(path: Path, algorithm: str = ALGORITHM_SHA256) -> str:
+    """Hex digest van een bestand.
+
+    Raises
+    ------
+    OSError
+        Als het bestand niet gelezen kan worden
+    """
+    hasher = new_hasher(algorithm)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= SMALL_FILE_LIMIT:
+            hasher.update(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                hasher.update(view)
+    return hasher.hexdigest()
+
+
+def hash_files(
+    paths: Iterable[Path],
+    algorithm: str = ALGORITHM_SHA256,
+    jobs: int | None = None,
+) -> dict[Path, str]:
+    """Hash een reeks bestanden; parallel bij grote volumes (hashlib geeft de GIL vrij)."""
+    paths = list(paths)
+    if len(paths) < 2 or sum(path.stat().st_size for path in paths) < PARALLEL_MIN_BYTES:
+        return {path: hash_file(path, algorithm) for path in paths}
+    from concurrent.futures import ThreadPoolExecutor
+    workers = jobs or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kernel-hash") as pool:
+        digests = pool.map(lambda p: hash_file(p, algorithm), paths)
+        return dict(zip(paths, digests))
+
+
+class MerkleDigest(NamedTuple):
+    """Merkle-digest van een verzameling bestanden.
+
+    ``files`` is gesleuteld op POSIX-paden relatief aan de basis.
+    """
+    root: str
+    files: dict[str, str]
+    algorithm: str
+
+
+def merkle_from_files(
+    files: dict[str, str],
+    algorithm: str = ALGORITHM_SHA256,
+) -> MerkleDigest:
+    """Bouw de Merkle-boom op uit (relatief pad -> bestandsdigest).
+
+    Elke mapdigest is de hash over de gesorteerde regels
+    ``<type> <naam>\\0<digest>\\n`` van zijn directe kinderen, met type
+    ``f`` (bestand) of ``d`` (map).
+    """
+    children: dict[str, dict[str, tuple[str, str]]] = {"": {}}
+    for rel, digest in files.items():
+        parent, _, name = rel.rpartition("/")
+        siblings = children.get(parent)
+        if siblings is None:
+            siblings = children[parent] = {}
+            # Nieuwe map: koppel hem (en ontbrekende voorouders) aan zijn ouder
+            child = parent
+            while True:
+                grandparent, _, dirname = child.rpartition("/")
+                known = grandparent in children
+                children.setdefault(grandparent, {})[dirname] = ("d", child)
+                if known:
+                    break
+                child = grandparent
+        siblings[name] = ("f", digest)
+
+    dirs: dict[str, str] = {}
+    # Diepste mappen eerst, zodat kinddigests klaar zijn voor hun ouder
+    for directory in sorted(children, key=lambda d: d.count("/") + bool(d), reverse=True):
+        hasher = new_hasher(algorithm)
+        for name, (kind, ref) in sorted(children[directory].items()):
+            digest = ref if kind == "f" else dirs[ref]
+            hasher.update(f"{kind} {name}\0{digest}\n".encode("utf-8"))
+        dirs[directory] = hasher.hexdigest()
+
+    return MerkleDigest(root=dirs[""], files=dict(files), algorithm=algorithm)
+
@@ -0,0 +1,165 @@
+"""Append-only run journal voor de runner kernel.
+
+Elke run krijgt één JSONL-bestand in ``.kernel/runs/``. Iedere regel is
+precies één record:
+
+- ``{"kind": "run", "data": {...}}``    — header (run_id, workspace, state_ref, start)
+- ``{"kind": "event", "data": {...}}``  — één run-event (handoff, state_update, ...)
+- ``{"kind": "result", "data": {...}}`` — eindresultaat (end, status, message)
+- ``{"kind": "timing", "data": {...}}`` — gemeten fasen van de run (spans)
+
+Een event loggen kost één regel toevoegen: het journal wordt nooit opnieuw
+gelezen of herschreven. Toevoegen gebeurt onder een exclusieve lock, zodat
+parallelle schrijvers in dezelfde run geen regels door elkaar schrijven;
+``append_records`` schrijft een batch events onder één lock. Het YAML
+run-log uit de runner-doctrine wordt alleen op verzoek uit het journal
+afgeleid (``materialize_run_log``).
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from kernel.locking import locked_append
+
+
+JOURNAL_SUFFIX = ".jsonl"
+
+RECORD_RUN = "run"
+RECORD_EVENT = "event"
+RECORD_RESULT = "result"
+RECORD_TIMING = "timing"
+
+
+def journal_path(runs_dir: Path, run_id: str) -> Path:
+    """Pad naar het journal van een run."""
+    return runs_dir / f"{run_id}{JOURNAL_SUFFIX}"
+
+
+def _encode(kind: str, data: dict[str, Any]) -> str:
+    return json.dumps({"kind": kind, "data": data}, ensure_ascii=False, default=str) + "\n"
+
+
+def create_journal(path: Path, header: dict[str, Any]) -> None:
+    """Maak een nieuw journal aan met de run-header als eerste regel.
+
+    Raises
+    ------
+    FileExistsError
+        Als er al een journal voor deze run bestaat
+    """
+    with open(path, "x", encoding="utf-8") as f:
+        f.write(_encode(RECORD_RUN, header))
+
+
+def append_record(path: Path, kind: str, data: dict[str, Any]) -> None:
+    """Voeg één record toe aan het einde van een bestaand journal."""
+    locked_append(path, _encode(kind, data))
+
+
+def append_records(path: Path, records: Iterable[tuple[str, dict[str, Any]]]) -> int:
+    """Voeg een batch records toe onder één lock en in één schrijfactie.
+
+    Returns
+    -------
+    int
+        Aantal weggeschreven records
+    """
+    lines = [_encode(kind, data) for kind, data in records]
+    if lines:
+        locked_append(path, "".join(lines))
+    return len(lines)
+
+
+def iter_records(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Lees alle records uit een journal, in schrijfvolgorde.
+
+    Een onvolledige laatste regel (bijv. na een crash tijdens schrijven)
+    wordt overgeslagen in plaats van het hele journal onleesbaar te maken.
+    """
+    with open(path, encoding="utf-8") as f:
+        yield from parse_records(f)
+
+
+def parse_records(lines: Iterable[str]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Decodeer journal-regels (bijv. uit een gearchiveerd segment)."""
+    for line in lines:
+        if not line.endswith("\n"):
+            break
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        yield record.get("kind", ""), record.get("data", {})
+
+
+def read_result(path: Path) -> dict[str, Any] | None:
+    """Lees alleen het laatste result-record van een journal (None: nog lopend)."""
+    return _read_last(path, RECORD_RESULT)
+
+
+def read_timing(path: Path) -> dict[str, Any] | None:
+    """Lees alleen het laatste timing-record van een journal.
+
+    Event-regels worden niet geparsed; alleen regels die met het
+    timing-prefix beginnen worden gedecodeerd.
+    """
+    return _read_last(path, RECORD_TIMING)
+
+
+def _read_last(path: Path, kind: str) -> dict[str, Any] | None:
+    prefix = '{"kind": "' + kind + '"'
+    result: dict[str, Any] | None = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(prefix) and line.endswith("\n"):
+                try:
+                    result = json.loads(line).get("data")
+                except json.JSONDecodeError:
+                    continue
+    return result
+
+
+def materialize_run_log(path: Path) -> dict[str, Any]:
+    """Bouw het volledige run-log (YAML-vorm) op uit een journal.
+
+    Returns
+    -------
+    dict
+        Run-log met dezelfde structuur als de klassieke ``<run_id>.yaml``
+    """
+    return build_run_log(iter_records(path))
+
+
+def build_run_log(records: Iterable[tuple[str, dict[str, Any]]]) -> dict[str, Any]:
+    """Bouw het run-log op uit reeds gelezen records."""
+    run_log: dict[str, Any] = {}
+    events: list[dict[str, Any]] = []
+    result: dict[str, Any] | None = None
+    timing: dict[str, Any] | None = None
+
+    for kind, data in records:
+        if kind == RECORD_RUN:
+            run_log = dict(data)
+        elif kind == RECORD_EVENT:
+            events.append(data)
+        elif kind == RECORD_RESULT:
+            result = data
+        elif kind == RECORD_TIMING:
+            timing = data
+
+    timestamps = dict(run_log.get("timestamps") or {})
+    timestamps.setdefault("start", None)
+    timestamps["end"] = result.get("end") if result else None
+
+    run_log["timestamps"] = timestamps
+    run_log["events"] = events
+    run_log["result"] = (
+        {"status": result.get("status"), "message": result.get("message")}
+        if result
+        else None
+    )
+    if timing is not None:
+        run_log["timing"] = timing
+    return run_log
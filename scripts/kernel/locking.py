@@ -0,0 +1,110 @@
+"""Advisory file locking en crash-atomische schrijfacties voor run-logs.
+
+- ``file_lock``: exclusieve advisory lock op een sidecar ``<bestand>.lock``
+  (nodig wanneer het doelbestand via rename wordt vervangen).
+- ``locked_append``: voegt tekst toe aan een bestand onder een lock op dat
+  bestand zelf; meerdere regels worden in één schrijfactie weggeschreven.
+- ``atomic_write_text``: schrijft via een tijdelijk bestand + fsync + rename,
+  zodat een crash nooit een half geschreven bestand achterlaat.
+
+Op POSIX wordt ``fcntl.flock`` gebruikt, op Windows ``msvcrt.locking``.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+LOCK_SUFFIX = ".lock"
+
+
+def _lock_fd(f: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_fd(f: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def lock_path_for(path: Path) -> Path:
+    """Pad naar het sidecar lock-bestand van een bestand."""
+    return path.with_name(path.name + LOCK_SUFFIX)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Houd een exclusieve advisory lock vast voor ``path``.
+
+    De lock staat op een sidecar-bestand, zodat ``path`` zelf tijdens de
+    lock atomisch vervangen mag worden.
+    """
+    with open(lock_path_for(path), "a+b") as f:
+        _lock_fd(f)
+        try:
+            yield
+        finally:
+            _unlock_fd(f)
+
+
+def locked_append(path: Path, text: str) -> None:
+    """Voeg ``text`` toe aan ``path`` onder een exclusieve lock.
+
+    Als het bestand eindigt op een onvolledige regel (crash tijdens een
+    eerdere schrijfactie), wordt die eerst afgesloten zodat nieuwe regels
+    er niet aan vastgeplakt worden.
+
+    Raises
+    ------
+    FileNotFoundError
+        Als ``path`` niet bestaat
+    """
+    data = text.encode("utf-8")
+    with open(path, "r+b") as f:
+        _lock_fd(f)
+        try:
+            end = f.seek(0, os.SEEK_END)
+            if end > 0:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+                f.seek(0, os.SEEK_END)
+            f.write(data)
+            f.flush()
+        finally:
+            _unlock_fd(f)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Schrijf ``text`` crash-atomisch naar ``path`` (temp-bestand + rename)."""
+    import tempfile
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,83 @@
+"""Run-ID allocatie voor de runner kernel.
+
+Format: ``run-YYYYMMDD-HHMMSS-ffffff-<pid>-<seq>``
+
+- Tijdstempel in UTC met microseconden, zodat IDs lexicografisch op
+  starttijd sorteren (ook tussen zomer- en wintertijd).
+- ``pid`` (6 hex) onderscheidt processen die in dezelfde microseconde starten.
+- ``seq`` (4 hex) onderscheidt IDs binnen één proces in dezelfde microseconde.
+
+Binnen een proces zijn IDs strikt monotoon oplopend, ook als de systeemklok
+terugspringt. Het legacy format ``run-YYYYMMDD-HHMMSS`` blijft geldig voor
+bestaande logs, maar staat in lokale tijd: naast nieuwe IDs sorteert het
+daardoor niet betrouwbaar op starttijd (afwijking gelijk aan de UTC-offset
+van de host). Sorteer runs op tijd via de catalogus, niet op ID.
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+
+RUN_ID_PATTERN = re.compile(
+    r"^run-\d{8}-\d{6}(?:-\d{6}-[0-9a-f]{6}-[0-9a-f]{4})?$"
+)
+
+_MAX_SEQ = 0xFFFF
+
+
+class RunIdAllocator:
+    """Thread-safe, monotone allocator van run-IDs binnen één proces."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._last_us = 0
+        self._seq = 0
+
+    def next_id(self) -> str:
+        """Geef een nieuw, uniek run-ID."""
+        with self._lock:
+            pid = os.getpid()
+            if pid != self._pid:
+                # Na fork: eigen reeks voor het kindproces
+                self._pid = pid
+                self._last_us = 0
+                self._seq = 0
+
+            now_us = time.time_ns() // 1000
+            if now_us > self._last_us:
+                self._last_us = now_us
+                self._seq = 0
+            elif self._seq < _MAX_SEQ:
+                self._seq += 1
+            else:
+                self._last_us += 1
+                self._seq = 0
+
+            return format_run_id(self._last_us, self._pid, self._seq)
+
+
+def format_run_id(epoch_us: int, pid: int, seq: int) -> str:
+    """Formatteer de componenten van een run-ID."""
+    moment = datetime.fromtimestamp(epoch_us // 1_000_000, tz=timezone.utc)
+    return (
+        f"{moment.strftime('run-%Y%m%d-%H%M%S')}"
+        f"-{epoch_us % 1_000_000:06d}-{pid & 0xFFFFFF:06x}-{seq:04x}"
+    )
+
+
+def is_valid_run_id(run_id: str) -> bool:
+    """Controleer of een string een geldig (nieuw of legacy) run-ID is."""
+    return RUN_ID_PATTERN.match(run_id) is not None
+
+
+_default_allocator = RunIdAllocator()
+
+
+def allocate_run_id() -> str:
+    """Geef een nieuw run-ID uit de proces-brede allocator."""
+    return _default_allocator.next_id()
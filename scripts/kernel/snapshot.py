@@ -0,0 +1,192 @@
+"""Persistente Merkle-snapshot van het normatieve corpus.
+
+De snapshot (``.kernel/corpus-snapshot.json``) legt per document vast:
+mtime_ns, grootte en digest, plus de Merkle-wortel over het geheel. Bij
+elke preflight wordt het corpus opnieuw ge-stat (``os.scandir``, geen
+inhoud); alleen documenten waarvan mtime of grootte afwijkt worden
+opnieuw gehasht. Het verschil met de vorige snapshot levert precies de
+toegevoegde, gewijzigde en verwijderde documenten op.
+
+Zoals in ``statecache`` geldt de "racy clean" regel: een document dat
+binnen RACY_WINDOW_NS van de scan gewijzigd is, krijgt geen betrouwbare
+signatuur en wordt bij de volgende scan opnieuw gehasht.
+
+Laden, scannen en opslaan gebeuren onder een lock op de snapshot, zodat
+gelijktijdige runs een wijziging precies één keer rapporteren.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable, NamedTuple
+
+from kernel.hashing import (
+    IGNORED_NAMES,
+    MerkleDigest,
+    fast_algorithm,
+    hash_files,
+    merkle_from_files,
+)
+from kernel.locking import atomic_write_text, file_lock
+from kernel.statecache import RACY_WINDOW_NS
+
+
+SNAPSHOT_VERSION = 1
+
+
+class CorpusChanges(NamedTuple):
+    """Verschil tussen twee corpus-snapshots (relatieve POSIX-paden)."""
+    added: tuple[str, ...]
+    modified: tuple[str, ...]
+    removed: tuple[str, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        return tuple(sorted(self.added + self.modified + self.removed))
+
+
+class CorpusScan(NamedTuple):
+    """Resultaat van een incrementele scan."""
+    digest: MerkleDigest
+    changes: CorpusChanges
+    baseline: bool
+    rehashed: int
+
+
+def _stat_tree(base: Path, roots: Iterable[str]) -> dict[str, tuple[int, int]]:
+    """(mtime_ns, size) per bestand onder de roots, via os.scandir."""
+    # Strings i.p.v. Path-objecten: dit is de hot loop bij duizenden documenten
+    found: dict[str, tuple[int, int]] = {}
+    stack = [(os.path.join(base, root), root) for root in roots]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in IGNORED_NAMES:
+                    continue
+                rel = f"{rel_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel))
+                elif entry.is_file():
+                    st = entry.stat()
+                    found[rel] = (st.st_mtime_ns, st.st_size)
+    return found
+
+
+class CorpusSnapshot:
+    """Incrementele Merkle-snapshot, persistent in één JSON-bestand."""
+
+    def __init__(
+        self,
+        snapshot_file: Path,
+        base: Path,
+        roots: Iterable[str],
+        algorithm: str | None = None,
+    ) -> None:
+        self.snapshot_file = snapshot_file
+        self.base = base
+        self.roots = tuple(roots)
+        # Geen SHA-256 nodig voor wijzigingsdetectie: snelste beschikbare
+        self.algorithm = algorithm or fast_algorithm()
+
+    def _load(self) -> dict[str, dict[str, Any]] | None:
+        try:
+            raw = json.loads(self.snapshot_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(raw, dict)
+            or raw.get("version") != SNAPSHOT_VERSION
+            or raw.get("algorithm") != self.algorithm
+            or raw.get("roots") != list(self.roots)
+        ):
+            return None
+        return dict(raw.get("files") or {})
+
+    def _save(self, files: dict[str, dict[str, Any]], root: str) -> None:
+        atomic_write_text(
+            self.snapshot_file,
+            json.dumps({
+                "version": SNAPSHOT_VERSION,
+                "algorithm": self.algorithm,
+                "roots": list(self.roots),
+                "root": root,
+                "files": files,
+            }, separators=(",", ":")),
+        )
+
+    def scan(self, *, update: bool = True) -> CorpusScan:
+        """Vergelijk het corpus met de vorige snapshot.
+
+        Parameters
+        ----------
+        update : bool
+            Sla de nieuwe snapshot op (False: alleen rapporteren)
+
+        Returns
+        -------
+        CorpusScan
+            Merkle-digest, wijzigingen en aantal opnieuw gehashte documenten;
+            ``baseline`` is True als er nog geen (bruikbare) snapshot was
+
+        Raises
+        ------
+        OSError
+            Als een gewijzigd document niet gelezen kan worden
+        """
+        self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.snapshot_file):
+            previous = self._load()
+            current = _stat_tree(self.base, self.roots)
+            known = previous or {}
+
+            stale = {
+                rel for rel, (mtime_ns, size) in current.items()
+                if rel not in known
+                or known[rel].get("mtime_ns") != mtime_ns
+                or known[rel].get("size") != size
+            }
+            fresh = hash_files([self.base / rel for rel in sorted(stale)], self.algorithm)
+
+            racy_after = time.time_ns() - RACY_WINDOW_NS
+            files: dict[str, dict[str, Any]] = {}
+            digests: dict[str, str] = {}
+            added: list[str] = []
+            modified: list[str] = []
+            for rel, (mtime_ns, size) in current.items():
+                if rel in known and rel not in stale:
+                    digest = known[rel]["digest"]
+                else:
+                    digest = fresh[self.base / rel]
+                    if rel not in known:
+                        added.append(rel)
+                    elif known[rel].get("digest") != digest:
+                        modified.append(rel)
+                digests[rel] = digest
+                files[rel] = {
+                    # Racy: geen signatuur, zodat de volgende scan opnieuw hasht
+                    "mtime_ns": mtime_ns if mtime_ns < racy_after else None,
+                    "size": size,
+                    "digest": digest,
+                }
+            removed = sorted(set(known) - set(current))
+
+            digest = merkle_from_files(digests, self.algorithm)
+            if update and (previous is None or stale or removed):
+                self._save(files, digest.root)
+
+        return CorpusScan(
+            digest=digest,
+            changes=CorpusChanges(tuple(sorted(added)), tuple(sorted(modified)), tuple(removed)),
+            baseline=previous is None,
+            rehashed=len(stale),
+        )
@@ -0,0 +1,94 @@
+"""Gememoiseerde state-gegevens, gesleuteld op bestandssignatuur.
+
+Een state file wordt geïdentificeerd door (pad, mtime_ns, size, inode).
+Zolang die signatuur gelijk blijft, worden de afgeleide gegevens (workspace
+naam, versie, hash) uit de cache gehaald in plaats van het bestand opnieuw
+te parsen en te hashen.
+
+De cache leeft op twee niveaus:
+- in het proces (dict), voor herhaalde aanroepen binnen één run of daemon;
+- op disk (``.kernel/state-cache.json``), voor back-to-back runs.
+
+Bestanden die zeer recent gewijzigd zijn worden niet gecachet: binnen
+hetzelfde mtime-tijdvenster kan een tweede wijziging met gelijke grootte
+anders onopgemerkt blijven (vergelijk git's "racy clean" regel).
+"""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from kernel.locking import atomic_write_text
+
+
+CACHE_VERSION = 1
+
+# Wijzigingen jonger dan dit venster worden niet gecachet
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def file_signature(path: Path) -> dict[str, Any] | None:
+    """Signatuur van een bestand, of None als het niet bestaat."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {
+        "path": str(path.resolve()),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "inode": st.st_ino,
+    }
+
+
+class StateCache:
+    """Cache van afgeleide state-gegevens per bestandssignatuur."""
+
+    def __init__(self, cache_file: Path) -> None:
+        self.cache_file = cache_file
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                raw = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                if raw.get("version") == CACHE_VERSION:
+                    self._entries = dict(raw.get("entries") or {})
+                else:
+                    self._entries = {}
+            except (OSError, ValueError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+    def lookup(self, signature: dict[str, Any]) -> dict[str, Any] | None:
+        """Geef gecachete gegevens terug als de signatuur exact overeenkomt."""
+        entry = self._load().get(signature["path"])
+        if entry is None or entry.get("signature") != signature:
+            return None
+        return entry.get("data")
+
+    def store(self, signature: dict[str, Any], data: dict[str, Any]) -> None:
+        """Sla gegevens op bij een signatuur (in geheugen en op disk).
+
+        Racy entries (mtime binnen RACY_WINDOW_NS van nu) worden overgeslagen.
+        """
+        if time.time_ns() - signature["mtime_ns"] < RACY_WINDOW_NS:
+            return
+
+        entries = self._load()
+        entries[signature["path"]] = {"signature": signature, "data": data}
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(
+                self.cache_file,
+                json.dumps(
+                    {"version": CACHE_VERSION, "entries": entries},
+                    indent=2,
+                    default=str,
+                ),
+            )
+        except OSError:
+            pass  # Cache is optioneel; in-memory entry blijft geldig
@@ -0,0 +1,251 @@
+"""Live volgen van run-journals (tail -f voor kernel-runs).
+
+Een ``JournalFollower`` onthoudt per journal de leespositie en leest bij
+elke aanroep alleen de nieuw toegevoegde bytes; het journal wordt nooit
+opnieuw volledig geparsed. Een onvolledige laatste regel blijft gebufferd
+tot hij is afgeschreven.
+
+Wachten op nieuwe data gebeurt met inotify (Linux, via ctypes) zodat een
+operator veel runs tegelijk kan volgen zonder CPU te verbruiken. Waar
+inotify niet beschikbaar is, valt de watcher terug op polling van
+bestandsgrootte en mtime.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from kernel.journal import RECORD_RESULT, RECORD_RUN, RECORD_TIMING, read_result
+from kernel.timing import span_totals
+
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Na het result schrijft de kernel nog een timing-record; zo lang wordt
+# daarop gewacht voordat het volgen stopt
+FINAL_DRAIN_TIMEOUT = 0.5
+
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVE_SELF = 0x00000800
+_IN_DELETE_SELF = 0x00000400
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+# sizeof(struct inotify_event) zonder naam: int wd; uint32 mask, cookie, len
+_EVENT_HEADER_SIZE = 16
+
+
+class JournalFollower:
+    """Leest nieuwe records uit één journal vanaf de laatste positie."""
+
+    def __init__(self, path: Path, from_start: bool = True) -> None:
+        self.path = path
+        self.offset = 0 if from_start else path.stat().st_size
+        # Vanaf het eind gelezen: een al afgeronde run levert geen result meer
+        self.finished = not from_start and read_result(path) is not None
+        self.timed = self.finished
+        self._buffer = b""
+
+    def read_new(self) -> list[tuple[str, dict[str, Any]]]:
+        """Lees alle records die sinds de vorige aanroep zijn toegevoegd."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            self.finished = True
+            return []
+
+        if not chunk:
+            return []
+        self.offset += len(chunk)
+
+        data = self._buffer + chunk
+        lines = data.split(b"\n")
+        self._buffer = lines.pop()
+
+        records: list[tuple[str, dict[str, Any]]] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # afgebroken regel na een crash
+            kind = record.get("kind", "")
+            records.append((kind, record.get("data", {})))
+            if kind == RECORD_RESULT:
+                self.finished = True
+            elif kind == RECORD_TIMING:
+                self.timed = True
+        return records
+
+
+class _PollingWatcher:
+    """Fallback: detecteer wijzigingen via (size, mtime_ns)."""
+
+    def __init__(self, paths: list[Path], interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.interval = interval
+        self._signatures = {path: self._signature(path) for path in paths}
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int] | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def wait(self, timeout: float | None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = False
+            for path, previous in self._signatures.items():
+                current = self._signature(path)
+                if current != previous:
+                    self._signatures[path] = current
+                    changed = True
+            if changed:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.interval)
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Linux inotify watcher op een set journals (één file descriptor)."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        import ctypes
+        import ctypes.util
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OSError("inotify niet beschikbaar")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gefaald")
+        self._fd = fd
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVE_SELF | _IN_DELETE_SELF
+        for path in paths:
+            wd = libc.inotify_add_watch(fd, os.fsencode(path), mask)
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch gefaald: {path}")
+
+    def wait(self, timeout: float | None) -> bool:
+        import select
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        # Events leegmaken; de follower bepaalt zelf wat er nieuw is
+        while True:
+            try:
+                data = os.read(self._fd, 64 * _EVENT_HEADER_SIZE + 4096)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(paths: list[Path]) -> _InotifyWatcher | _PollingWatcher:
+    """inotify waar mogelijk, anders polling."""
+    try:
+        return _InotifyWatcher(paths)
+    except (OSError, AttributeError):
+        return _PollingWatcher(paths)
+
+
+def follow_journals(
+    paths: list[Path],
+    *,
+    follow: bool = True,
+    from_start: bool = True,
+    idle_timeout: float | None = None,
+) -> Iterator[tuple[Path, str, dict[str, Any]]]:
+    """Stream records uit één of meer journals.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        Te volgen journals
+    follow : bool
+        Blijf wachten op nieuwe records tot elk journal een result heeft
+    from_start : bool
+        Begin bij het begin van elk journal (anders alleen nieuwe records)
+    idle_timeout : float, optional
+        Stop na zoveel seconden zonder nieuwe records
+
+    Yields
+    ------
+    tuple[Path, str, dict]
+        (journal, record-kind, record-data)
+    """
+    followers = [JournalFollower(path, from_start=from_start) for path in paths]
+
+    if not follow:
+        for follower in followers:
+            for kind, data in follower.read_new():
+                yield follower.path, kind, data
+        return
+
+    # Watcher vóór de eerste leesronde, zodat tussentijdse writes niet wegvallen
+    watcher = make_watcher(paths)
+    try:
+        for follower in followers:
+            for kind, data in follower.read_new():
+                yield follower.path, kind, data
+
+        while not all(f.finished for f in followers):
+            if not watcher.wait(idle_timeout):
+                return
+            for follower in followers:
+                if follower.finished:
+                    continue
+                for kind, data in follower.read_new():
+                    yield follower.path, kind, data
+
+        # Laatste ronde: het timing-record volgt pas na het result
+        deadline = time.monotonic() + FINAL_DRAIN_TIMEOUT
+        pending = [f for f in followers if not f.timed]
+        while pending:
+            for follower in pending:
+                for kind, data in follower.read_new():
+                    yield follower.path, kind, data
+            pending = [f for f in pending if not f.timed]
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0 or not watcher.wait(remaining):
+                break
+    finally:
+        watcher.close()
+
+
+def format_record(run_id: str, kind: str, data: dict[str, Any]) -> str:
+    """Eén regel console-uitvoer voor een journal record."""
+    if kind == RECORD_RESULT:
+        return f"[{run_id}] {data.get('end', '-')} result {data.get('status')}: {data.get('message', '')}"
+    if kind == RECORD_RUN:
+        start = (data.get("timestamps") or {}).get("start", "-")
+        return f"[{run_id}] {start} run gestart (workspace: {data.get('workspace', '-')})"
+    if kind == RECORD_TIMING:
+        totals = span_totals(data.get("spans") or [])
+        phases = ", ".join(f"{name}={ms:.3f}ms" for name, ms in totals.items())
+        return f"[{run_id}] timing {phases}"
+
+    details = ", ".join(
+        f"{key}={value}"
+        for key, value in data.items()
+        if key not in ("type", "timestamp")
+    )
+    return f"[{run_id}] {data.get('timestamp', '-')} {data.get('type', kind)} {details}".rstrip()
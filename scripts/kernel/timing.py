@@ -0,0 +1,153 @@
+"""Timing-instrumentatie en tijdstempels voor kernel-runs.
+
+Tijdstempels in run-logs dragen de werkelijke UTC-offset van de machine
+(``2026-01-15 14:03:12 +0100``) in plaats van een vaste "CET"-aanduiding;
+oudere logs met "CET" blijven leesbaar en worden als lokale tijd geïnterpreteerd.
+
+Een ``SpanRecorder`` meet fasen van een run met een monotone klok
+(``time.perf_counter_ns``), onafhankelijk van klokverzettingen. De actieve
+recorder staat in een context-variabele, zodat diep gelegen code (state
+laden, hashen) met ``span("hash")`` kan meten zonder dat de recorder door
+elke aanroep heen gegeven hoeft te worden. Zonder actieve recorder is
+``span`` een no-op.
+
+``summarize`` aggregeert gemeten duur tot p50/p95/p99 per groep.
+"""
+from __future__ import annotations
+
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from time import perf_counter_ns
+from typing import Any, Iterable, Iterator
+
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S %z"
+_LEGACY_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+PHASE_PREFLIGHT = "preflight"
+PHASE_STATE_LOAD = "state_load"
+PHASE_HASH = "hash"
+PHASE_LOG_WRITE = "log_write"
+PHASE_AGENT = "agent_execution"
+PHASE_FINALIZE = "finalize"
+
+PERCENTILES = (50, 95, 99)
+
+_active: ContextVar[SpanRecorder | None] = ContextVar("kernel_span_recorder", default=None)
+
+
+def format_timestamp(moment: datetime | None = None) -> str:
+    """Tijdstempel voor run-logs, met de werkelijke UTC-offset."""
+    if moment is None:
+        moment = datetime.now()
+    return moment.astimezone().strftime(TIMESTAMP_FORMAT)
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Lees een run-log tijdstempel (nieuw formaat of legacy "CET")."""
+    if not value:
+        return None
+    text = str(value)
+    try:
+        return datetime.strptime(text, TIMESTAMP_FORMAT)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(text[:19], _LEGACY_TIMESTAMP_FORMAT).astimezone()
+    except ValueError:
+        return None
+
+
+class SpanRecorder:
+    """Verzamelt spans (naam, start, duur) van één run."""
+
+    def __init__(self) -> None:
+        self._origin = perf_counter_ns()
+        self.spans: list[dict[str, Any]] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Meet de duur van het blok onder ``name``."""
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = perf_counter_ns()
+            self.spans.append({
+                "name": name,
+                "start_ms": round((start - self._origin) / 1e6, 3),
+                "duration_ms": round((end - start) / 1e6, 3),
+            })
+
+    @contextmanager
+    def activate(self) -> Iterator[SpanRecorder]:
+        """Maak deze recorder actief voor ``span()`` in de huidige context."""
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Meet het blok in de actieve recorder (no-op zonder recorder)."""
+    recorder = _active.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.span(name):
+        yield
+
+
+def span_totals(spans: Iterable[dict[str, Any]]) -> dict[str, float]:
+    """Totale duur per fase (ms) uit opgeslagen spans."""
+    totals: dict[str, float] = {}
+    for entry in spans:
+        name = entry.get("name")
+        duration = entry.get("duration_ms")
+        if name is None or duration is None:
+            continue
+        totals[name] = totals.get(name, 0.0) + float(duration)
+    return totals
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentiel met lineaire interpolatie (waarden moeten gesorteerd zijn)."""
+    if not sorted_values:
+        return math.nan
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(samples: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    """Aantal, p50/p95/p99 en maximum per groep.
+
+    Parameters
+    ----------
+    samples : dict[str, list[float]]
+        Gemeten duur (ms) per groep (bijv. fase of agent/fase)
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        Per groep: ``n``, ``p50``, ``p95``, ``p99`` en ``max``
+    """
+    summary: dict[str, dict[str, float]] = {}
+    for key, values in samples.items():
+        ordered = sorted(values)
+        if not ordered:
+            continue
+        stats: dict[str, float] = {"n": len(ordered)}
+        for pct in PERCENTILES:
+            stats[f"p{pct}"] = percentile(ordered, pct)
+        stats["max"] = ordered[-1]
+        summary[key] = stats
+    return summary
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Kernel Client — dunne CLI voor een draaiende kernel-daemon.
+
+Stuurt operaties naar ``kernelrunner.py serve`` via de Unix domain socket.
+Importeert geen PyYAML en voert zelf geen preflight uit; de daemon houdt
+state en open run-journals in geheugen.
+
+Usage:
+    python scripts/kernelclient.py ping
+    python scripts/kernelclient.py start-run <agent-naam> <intent> [--trigger <reden>]
+    python scripts/kernelclient.py log-events <run-id> [--input <events.jsonl>]
+    python scripts/kernelclient.py finalize-run <run-id> --status success|failure [--message <tekst>]
+    python scripts/kernelclient.py shutdown
+
+Socket: ``--socket``, anders $KERNEL_SOCKET, anders .kernel/kernel.sock.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from kernel.client import KernelClient, KernelClientError, default_socket_path
+
+
+WORKSPACE_ROOT = Path(__file__).parent.parent
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="kernelclient",
+        description="Dunne client voor de kernel-daemon (kernelrunner.py serve)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Pad naar de daemon-socket",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("ping", help="Controleer of de daemon bereikbaar is")
+
+    start_parser = subparsers.add_parser("start-run", help="Start een agent-run via de daemon")
+    start_parser.add_argument("agent_name", help="Naam van de agent om te starten")
+    start_parser.add_argument("intent", help="Korte beschrijving van de intent")
+    start_parser.add_argument("--trigger", default="handmatig", help="Reden voor de run (default: handmatig)")
+
+    events_parser = subparsers.add_parser("log-events", help="Log een batch events (JSON per regel)")
+    events_parser.add_argument("run_id", help="Run identifier")
+    events_parser.add_argument("--input", default="-", help="JSONL bestand met events (default: stdin)")
+
+    finalize_parser = subparsers.add_parser("finalize-run", help="Finaliseer een run met resultaat")
+    finalize_parser.add_argument("run_id", help="Run identifier")
+    finalize_parser.add_argument("--status", choices=["success", "failure"], required=True, help="Eindstatus")
+    finalize_parser.add_argument("--message", default="", help="Resultaat boodschap")
+
+    subparsers.add_parser("shutdown", help="Stop de daemon")
+
+    return parser
+
+
+def main() -> int:
+    """Main entry point."""
+    args = build_parser().parse_args()
+    socket_path = args.socket or default_socket_path(WORKSPACE_ROOT)
+
+    try:
+        with KernelClient(socket_path) as kernel:
+            if args.command == "ping":
+                print(f"OK: {json.dumps(kernel.ping())}")
+            elif args.command == "start-run":
+                result = kernel.start_run(args.agent_name, args.intent, args.trigger)
+                if not result["success"]:
+                    print(f"ERROR: {result['message']}", file=sys.stderr)
+                    return 1
+                print(f"OK: {result['message']}")
+                print(f"Run ID: {result['run_id']}")
+            elif args.command == "log-events":
+                source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+                with source:
+                    events = [json.loads(line) for line in source if line.strip()]
+                logged = kernel.log_events(args.run_id, events)
+                print(f"OK: {logged} event(s) gelogd in {args.run_id}")
+            elif args.command == "finalize-run":
+                kernel.finalize_run(args.run_id, args.status == "success", args.message)
+                print(f"OK: Run {args.run_id} gefinaliseerd")
+            elif args.command == "shutdown":
+                kernel.shutdown()
+                print("OK: Kernel-daemon stopt")
+    except (KernelClientError, OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,14 +8,26 @@ neemt geen inhoudelijke beslissingen.
 Verantwoordelijkheden:
 - Preflight checks uitvoeren
 - State lezen en schrijven (pointers, geen inhoud)
-- Agent-runs starten
-- Handoffs en run-events loggen
+- Agent-runs starten (los, als batch, of als DAG van afhankelijke handoffs)
+- Handoffs en run-events loggen (append-only journal)
 - State bijwerken na afloop
-- Run-log retentie
+- Run-log retentie: hot runs, gecomprimeerd archief, verval (via de run-catalogus)
+- Daemon-modus: state, ping-status en open journals in geheugen
+- Timing per fase vastleggen en aggregeren (``stats``)
 
 Usage:
     python scripts/kernelrunner.py start-run <agent-naam> <intent>
-    python scripts/kernelrunner.py cleanup-logs
+    python scripts/kernelrunner.py start-batch <manifest.yaml> [--jobs N]
+    python scripts/kernelrunner.py start-dag <manifest.yaml> [--jobs N]
+    python scripts/kernelrunner.py log-events <run-id> [--input <events.jsonl>]
+    python scripts/kernelrunner.py tail [<run-id> ...] [--no-follow] [--new-only]
+    python scripts/kernelrunner.py export-run <run-id> [--output <pad>]
+    python scripts/kernelrunner.py list-runs [--agent X] [--status failure] [--since 2026-01-15]
+    python scripts/kernelrunner.py corpus-status [--update]
+    python scripts/kernelrunner.py stats [--agent X] [--since 2026-01-15] [--json]
+    python scripts/kernelrunner.py reindex-runs
+    python scripts/kernelrunner.py cleanup-logs   (archiveert en ruimt op)
+    python scripts/kernelrunner.py serve [--socket <pad>]
 
 Canonieke principes:
     Agents besluiten.
@@ -30,23 +42,82 @@ Conform:
 from __future__ import annotations
 
 import argparse
-import hashlib
+import json
+import os
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
 
-import yaml
+from cli_bootstrap import lazy_import
+
+# Pas geladen als een subcommando ze gebruikt (snelle startup, o.a. --help)
+sqlite3 = lazy_import("sqlite3")
+yaml = lazy_import("yaml")
+
+from kernel.journal import (
+    JOURNAL_SUFFIX,
+    RECORD_EVENT,
+    RECORD_RESULT,
+    RECORD_TIMING,
+    append_record,
+    append_records,
+    create_journal,
+    journal_path,
+    build_run_log,
+    materialize_run_log,
+    parse_records,
+    read_timing,
+)
+from kernel.locking import atomic_write_text, file_lock, lock_path_for
+from kernel.runids import allocate_run_id, is_valid_run_id
+from kernel.statecache import StateCache, file_signature
+from kernel.timing import (
+    PHASE_AGENT,
+    PHASE_FINALIZE,
+    PHASE_HASH,
+    PHASE_LOG_WRITE,
+    PHASE_PREFLIGHT,
+    PHASE_STATE_LOAD,
+    SpanRecorder,
+    format_timestamp,
+    parse_timestamp,
+    span,
+    span_totals,
+    summarize,
+)
+
+if TYPE_CHECKING:
+    # Catalogus, snapshot en hashing worden pas geladen door de subcommando's
+    # die ze gebruiken (hashlib alleen al kost enkele ms per start)
+    from kernel.catalogue import RunCatalogue, RunEntry
+    from kernel.snapshot import CorpusChanges, CorpusScan, CorpusSnapshot
 
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
 STATE_FILE = WORKSPACE_ROOT / "state" / "standards.current.yaml"
 KERNEL_RUNS_DIR = WORKSPACE_ROOT / ".kernel" / "runs"
+KERNEL_BATCHES_DIR = WORKSPACE_ROOT / ".kernel" / "batches"
 NORMATIEF_STELSEL_PING = WORKSPACE_ROOT / "normatief-stelsel.ping"
+NORMATIEF_CORPUS_DIRS = ("grondslagen", "beleid", "charters-agents")
+STATE_CACHE_FILE = WORKSPACE_ROOT / ".kernel" / "state-cache.json"
+CORPUS_SNAPSHOT_FILE = WORKSPACE_ROOT / ".kernel" / "corpus-snapshot.json"
+KERNEL_CATALOGUE_FILE = WORKSPACE_ROOT / ".kernel" / "runs.sqlite"
+KERNEL_ARCHIVE_DIR = WORKSPACE_ROOT / ".kernel" / "archive"
+
+# Maximaal aantal pogingen om een vrij run-ID te claimen
+MAX_RUN_ID_ATTEMPTS = 16
 
 # Retentie configuratie
+# Hot: de 20 nieuwste runs en alles jonger dan 7 dagen blijft in .kernel/runs/;
+# oudere runs gaan gecomprimeerd naar .kernel/archive/ en vervallen daar na
+# 30 dagen (de bewaartermijn van failure-runs, doctrine runner-discipline
+# §9.2), ongeacht hun status
 MAX_RUNS_TO_KEEP = 20
 MAX_RUN_AGE_DAYS = 7
+MAX_ARCHIVED_RUN_AGE_DAYS = 30
 
 
 class StateData(NamedTuple):
@@ -55,6 +126,8 @@ class StateData(NamedTuple):
     current_version: str
     state_file_path: Path
     state_hash: str | None
+    corpus_digest: str | None = None
+    corpus_changes: CorpusChanges | None = None
 
 
 class RunResult(NamedTuple):
@@ -65,14 +138,59 @@ class RunResult(NamedTuple):
     log_path: Path
 
 
+class BatchResult(NamedTuple):
+    """Resultaat van een batch agent-runs."""
+    success: bool
+    message: str
+    batch_id: str
+    summary_path: Path
+    runs: list[RunResult]
+
+
+class CleanupResult(NamedTuple):
+    """Resultaat van een retentie-ronde."""
+    archived: int
+    deleted: int
+
+
 class PreflightError(Exception):
     """Preflight check gefaald."""
     pass
 
 
+_state_cache = StateCache(STATE_CACHE_FILE)
+_lazy_singletons: dict[str, Any] = {}
+_lazy_lock = threading.Lock()
+
+
+def _run_catalogue() -> RunCatalogue:
+    """De run-catalogus van deze workspace (bij eerste gebruik aangemaakt)."""
+    with _lazy_lock:
+        catalogue = _lazy_singletons.get("catalogue")
+        if catalogue is None:
+            from kernel.catalogue import RunCatalogue
+            catalogue = _lazy_singletons["catalogue"] = RunCatalogue(KERNEL_CATALOGUE_FILE)
+        return catalogue
+
+
+def _corpus_snapshot() -> CorpusSnapshot:
+    """De corpus-snapshot van deze workspace (bij eerste gebruik aangemaakt)."""
+    with _lazy_lock:
+        snapshot = _lazy_singletons.get("snapshot")
+        if snapshot is None:
+            from kernel.snapshot import CorpusSnapshot
+            snapshot = _lazy_singletons["snapshot"] = CorpusSnapshot(
+                CORPUS_SNAPSHOT_FILE, WORKSPACE_ROOT, NORMATIEF_CORPUS_DIRS
+            )
+        return snapshot
+
+
 def load_state() -> StateData:
     """Lees de actieve workspace state.
     
+    Resultaten worden gecachet op (pad, mtime_ns, size, inode) van de state
+    file; een ongewijzigde state wordt niet opnieuw geparsed of gehasht.
+    
     Returns
     -------
     StateData
@@ -83,9 +201,19 @@ def load_state() -> StateData:
     PreflightError
         Als state niet gelezen kan worden
     """
-    if not STATE_FILE.exists():
+    signature = file_signature(STATE_FILE)
+    if signature is None:
         raise PreflightError(f"State file niet gevonden: {STATE_FILE}")
     
+    cached = _state_cache.lookup(signature)
+    if cached is not None:
+        return StateData(
+            workspace_name=cached["workspace_name"],
+            current_version=cached["current_version"],
+            state_file_path=STATE_FILE,
+            state_hash=cached["state_hash"],
+        )
+    
     try:
         with open(STATE_FILE, encoding="utf-8") as f:
             data = yaml.safe_load(f)
@@ -97,7 +225,14 @@ def load_state() -> StateData:
         current_version = data.get("version", "unknown")
         
         # Optioneel: hash van state file voor traceability
-        state_hash = _compute_file_hash(STATE_FILE)
+        with span(PHASE_HASH):
+            state_hash = _compute_file_hash(STATE_FILE)
+        
+        _state_cache.store(signature, {
+            "workspace_name": workspace_name,
+            "current_version": current_version,
+            "state_hash": state_hash,
+        })
         
         return StateData(
             workspace_name=workspace_name,
@@ -112,13 +247,20 @@ def load_state() -> StateData:
         raise PreflightError(f"Fout bij lezen state: {e}") from e
 
 
-def preflight() -> None:
+def preflight() -> StateData:
     """Voer preflight checks uit.
     
     Controleert:
     - Bestaat de state file?
     - Is de normatief-stelsel ping aanwezig?
     - Is de state leesbaar (YAML parsebaar)?
+    - Is het normatieve corpus leesbaar (Merkle-fingerprint)? Welke
+      documenten zijn gewijzigd sinds de vorige run?
+    
+    Returns
+    -------
+    StateData
+        De gevalideerde state, zodat aanroepers niet opnieuw hoeven te laden
     
     Raises
     ------
@@ -137,36 +279,92 @@ def preflight() -> None:
     
     # Check 3: State is leesbaar (implicitly checked in load_state)
     try:
-        load_state()
+        with span(PHASE_STATE_LOAD):
+            state = load_state()
     except PreflightError:
         raise
     except Exception as e:
         raise PreflightError(f"State validatie gefaald: {e}") from e
+    
+    # Check 4: Normatief corpus fingerprint
+    return with_corpus_digest(state)
+
+
+def fingerprint_corpus(update: bool = True) -> CorpusScan:
+    """Merkle-digest over het normatieve corpus (NORMATIEF_CORPUS_DIRS).
+    
+    Vergelijkt met de snapshot van de vorige run; alleen documenten met
+    gewijzigde mtime of grootte worden opnieuw gehasht.
+    
+    Parameters
+    ----------
+    update : bool
+        Leg de nieuwe snapshot vast (False: alleen rapporteren)
+    
+    Returns
+    -------
+    CorpusScan
+        Merkle-digest plus de gewijzigde documenten sinds de vorige snapshot
+        
+    Raises
+    ------
+    OSError
+        Als een bestand in het corpus niet gelezen kan worden
+    """
+    with span(PHASE_HASH):
+        return _corpus_snapshot().scan(update=update)
+
+
+def with_corpus_digest(state: StateData) -> StateData:
+    """Voorzie een state van de actuele corpus-fingerprint en wijzigingen.
+    
+    Raises
+    ------
+    PreflightError
+        Als het corpus niet gelezen kan worden
+    """
+    try:
+        corpus = fingerprint_corpus()
+    except OSError as e:
+        raise PreflightError(f"Normatief corpus niet leesbaar: {e}") from e
+    return state._replace(
+        corpus_digest=corpus.digest.root,
+        corpus_changes=None if corpus.baseline else corpus.changes,
+    )
 
 
 def generate_run_id() -> str:
     """Genereer unieke run-ID.
     
-    Format: run-YYYYMMDD-HHMMSS
+    Format: run-YYYYMMDD-HHMMSS-ffffff-<pid>-<seq> (UTC, sorteerbaar)
+    
+    IDs zijn monotoon binnen een proces en botsingsvrij tussen processen
+    die gelijktijdig starten (zie kernel/runids.py).
     
     Returns
     -------
     str
         Unieke run identifier
     """
-    now = datetime.now()
-    return now.strftime("run-%Y%m%d-%H%M%S")
+    return allocate_run_id()
 
 
-def start_run(agent_name: str, intent: str, trigger: str) -> RunResult:
+def start_run(
+    agent_name: str,
+    intent: str,
+    trigger: str,
+    state: StateData | None = None,
+    parent_id: str | None = None,
+) -> RunResult:
     """Start een agent-run met logging.
     
     Voert uit:
-    - Preflight checks
+    - Preflight checks (overgeslagen als een gevalideerde state is meegegeven)
     - Run-ID generatie
     - Run-log aanmaken
     - Agent-run starten (v1: placeholder)
     - Resultaat vastleggen
+    - Timing per fase vastleggen (timing-record in het journal)
     
     Parameters
     ----------
@@ -176,37 +374,39 @@ def start_run(agent_name: str, intent: str, trigger: str) -> RunResult:
         Korte beschrijving van de intent
     trigger : str
         Reden voor de run
+    state : StateData, optional
+        Reeds gevalideerde state (bijv. uit de daemon-cache of een batch)
+    parent_id : str, optional
+        Batch of DAG-run waarbinnen deze run valt
         
     Returns
     -------
     RunResult
         Resultaat van de run met success status
     """
-    # Preflight checks
-    try:
-        preflight()
-        state = load_state()
-    except PreflightError as e:
-        return RunResult(
-            success=False,
-            message=f"Preflight gefaald: {e}",
-            run_id="",
-            log_path=Path(),
-        )
+    recorder = SpanRecorder()
     
-    # Genereer run-ID
-    run_id = generate_run_id()
+    # Preflight checks
+    if state is None:
+        try:
+            with recorder.activate(), recorder.span(PHASE_PREFLIGHT):
+                state = preflight()
+        except PreflightError as e:
+            return RunResult(
+                success=False,
+                message=f"Preflight gefaald: {e}",
+                run_id="",
+                log_path=Path(),
+            )
     
     # Setup logging
     KERNEL_RUNS_DIR.mkdir(parents=True, exist_ok=True)
-    log_path = KERNEL_RUNS_DIR / f"{run_id}.yaml"
     
     # Start timestamp
     start_time = datetime.now()
     
-    # Initieer run log
-    run_log: dict[str, Any] = {
-        "run_id": run_id,
+    # Initieer run journal (header; events en result volgen als losse regels)
+    run_header: dict[str, Any] = {
         "recorded_by": "runner-kernel",
         "workspace": state.workspace_name,
         "state_ref": {
@@ -214,12 +414,28 @@ def start_run(agent_name: str, intent: str, trigger: str) -> RunResult:
             "hash": state.state_hash,
         },
         "timestamps": {
-            "start": start_time.strftime("%Y-%m-%d %H:%M:%S CET"),
-            "end": None,
+            "start": format_timestamp(start_time),
         },
-        "events": [],
-        "result": None,
     }
+    if state.corpus_digest is not None:
+        run_header["corpus_ref"] = {
+            "roots": list(NORMATIEF_CORPUS_DIRS),
+            "algorithm": _corpus_snapshot().algorithm,
+            "digest": state.corpus_digest,
+        }
+    if parent_id is not None:
+        run_header["parent_id"] = parent_id
+    try:
+        with recorder.span(PHASE_LOG_WRITE):
+            run_id, log_path = _claim_run_journal(run_header)
+            _index_run_start(run_id, agent_name, intent, log_path, start_time)
+    except FileExistsError as e:
+        return RunResult(
+            success=False,
+            message=f"Geen vrij run-ID gevonden: {e}",
+            run_id="",
+            log_path=Path(),
+        )
     
     # Log handoff event
     handoff_event = {
@@ -228,34 +444,52 @@ def start_run(agent_name: str, intent: str, trigger: str) -> RunResult:
         "to": agent_name,
         "intent": intent,
         "trigger": trigger,
-        "timestamp": start_time.strftime("%Y-%m-%d %H:%M:%S CET"),
+        "timestamp": format_timestamp(start_time),
     }
-    run_log["events"].append(handoff_event)
+    with recorder.span(PHASE_LOG_WRITE):
+        append_record(log_path, RECORD_EVENT, handoff_event)
+        if state.corpus_changes:
+            append_record(log_path, RECORD_EVENT, {
+                "type": "corpus_changed",
+                "added": list(state.corpus_changes.added),
+                "modified": list(state.corpus_changes.modified),
+                "removed": list(state.corpus_changes.removed),
+                "timestamp": format_timestamp(start_time),
+            })
     
     # Agent-run (v1: placeholder)
     # TODO: Hier wordt in toekomstige versies de agent daadwerkelijk aangeroepen
     # Voor v1: handmatige bevestiging of Copilot-interventie verwacht
-    print(f"\n{'='*60}")
-    print("AGENT RUN PLACEHOLDER (v1)")
-    print(f"{'='*60}")
-    print(f"Agent     : {agent_name}")
-    print(f"Intent    : {intent}")
-    print(f"Trigger   : {trigger}")
-    print(f"Run ID    : {run_id}")
-    print(f"\nDe runner kernel orkestreert, maar automatiseert inhoud nog niet.")
-    print(f"Voer handmatig de agent-actie uit via Copilot of CLI.")
-    print(f"{'='*60}\n")
+    # Eén print-aanroep, zodat parallelle runs (batch) niet door elkaar printen
+    with recorder.span(PHASE_AGENT):
+        print(
+            f"\n{'='*60}\n"
+            "AGENT RUN PLACEHOLDER (v1)\n"
+            f"{'='*60}\n"
+            f"Agent     : {agent_name}\n"
+            f"Intent    : {intent}\n"
+            f"Trigger   : {trigger}\n"
+            f"Run ID    : {run_id}\n"
+            "\nDe runner kernel orkestreert, maar automatiseert inhoud nog niet.\n"
+            "Voer handmatig de agent-actie uit via Copilot of CLI.\n"
+            f"{'='*60}\n"
+        )
     
     # Voor v1: markeer als success (agent-run is "gestart")
-    end_time = datetime.now()
-    run_log["timestamps"]["end"] = end_time.strftime("%Y-%m-%d %H:%M:%S CET")
-    run_log["result"] = {
-        "status": "success",
-        "message": "Agent-run placeholder voltooid (v1)",
-    }
+    with recorder.span(PHASE_FINALIZE):
+        end_time = datetime.now()
+        append_record(log_path, RECORD_RESULT, {
+            "end": format_timestamp(end_time),
+            "status": "success",
+            "message": "Agent-run placeholder voltooid (v1)",
+        })
+        _index_run_end(run_id, log_path, end_time, "success")
     
-    # Schrijf run log
-    _write_run_log(log_path, run_log)
+    # Timing als laatste regel: bevat ook de finalize-fase zelf
+    append_record(log_path, RECORD_TIMING, {
+        "agent": agent_name,
+        "spans": recorder.spans,
+    })
     
     return RunResult(
         success=True,
@@ -265,6 +499,285 @@ def start_run(agent_name: str, intent: str, trigger: str) -> RunResult:
     )
 
 
+def start_batch(manifest_path: Path, jobs: int | None = None) -> BatchResult:
+    """Start een batch agent-runs uit een manifest.
+    
+    Eén preflight en één state snapshot gelden voor alle runs. De runs
+    worden uitgevoerd via een begrensde thread pool; elke run krijgt zijn
+    eigen run-log, de batch krijgt een samenvatting in .kernel/batches/.
+    
+    Parameters
+    ----------
+    manifest_path : Path
+        YAML of JSON manifest met (agent, intent, trigger) per run
+    jobs : int, optional
+        Maximaal aantal gelijktijdige runs (default: aantal CPU's, max 8)
+        
+    Returns
+    -------
+    BatchResult
+        Resultaat van de batch, met per run een RunResult
+    """
+    from kernel.batch import BatchItem, default_jobs, parse_manifest, run_pool
+    
+    try:
+        items = parse_manifest(_load_manifest(manifest_path))
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        return BatchResult(
+            success=False,
+            message=f"Manifest ongeldig: {e}",
+            batch_id="",
+            summary_path=Path(),
+            runs=[],
+        )
+    
+    try:
+        state = preflight()
+    except PreflightError as e:
+        return BatchResult(
+            success=False,
+            message=f"Preflight gefaald: {e}",
+            batch_id="",
+            summary_path=Path(),
+            runs=[],
+        )
+    
+    batch_id = "batch-" + generate_run_id().removeprefix("run-")
+    jobs = jobs or default_jobs()
+    start_time = datetime.now()
+    durations: dict[int, float] = {}
+    
+    def _run_item(indexed: tuple[int, BatchItem]) -> RunResult:
+        index, item = indexed
+        started = time.perf_counter()
+        result = start_run(
+            agent_name=item.agent,
+            intent=item.intent,
+            trigger=item.trigger,
+            state=state,
+            parent_id=batch_id,
+        )
+        durations[index] = time.perf_counter() - started
+        return result
+    
+    results = run_pool(list(enumerate(items)), _run_item, jobs)
+    end_time = datetime.now()
+    
+    failures = sum(1 for r in results if not r.success)
+    summary: dict[str, Any] = {
+        "batch_id": batch_id,
+        "recorded_by": "runner-kernel",
+        "manifest": str(manifest_path),
+        "workspace": state.workspace_name,
+        "state_ref": {
+            "path": str(state.state_file_path.relative_to(WORKSPACE_ROOT)),
+            "hash": state.state_hash,
+        },
+        "jobs": jobs,
+        "timestamps": {
+            "start": format_timestamp(start_time),
+            "end": format_timestamp(end_time),
+        },
+        "runs": [
+            {
+                "agent": item.agent,
+                "intent": item.intent,
+                "trigger": item.trigger,
+                "run_id": result.run_id,
+                "status": "success" if result.success else "failure",
+                "message": result.message,
+                "duration_ms": round(durations.get(index, 0.0) * 1000, 3),
+            }
+            for index, (item, result) in enumerate(zip(items, results))
+        ],
+        "result": {
+            "status": "success" if failures == 0 else "failure",
+            "total": len(results),
+            "failed": failures,
+        },
+    }
+    
+    KERNEL_BATCHES_DIR.mkdir(parents=True, exist_ok=True)
+    summary_path = KERNEL_BATCHES_DIR / f"{batch_id}.yaml"
+    _write_run_log(summary_path, summary)
+    
+    return BatchResult(
+        success=failures == 0,
+        message=f"{len(results) - failures}/{len(results)} run(s) gestart",
+        batch_id=batch_id,
+        summary_path=summary_path,
+        runs=results,
+    )
+
+
+def start_dag(manifest_path: Path, jobs: int | None = None) -> RunResult:
+    """Voer een DAG van afhankelijke handoffs uit.
+    
+    Elke node wordt gestart zodra de nodes in zijn ``needs`` geslaagd zijn;
+    onafhankelijke takken lopen parallel. De DAG krijgt een eigen run-log
+    met per node een handoff-event (incl. afhankelijkheden), een
+    node_result-event met timings, en een dag_summary met het kritieke pad.
+    Elke node krijgt daarnaast een eigen run-log (parent_id = DAG run-ID).
+    
+    Parameters
+    ----------
+    manifest_path : Path
+        YAML of JSON manifest met nodes (id, agent, intent, trigger, needs)
+    jobs : int, optional
+        Maximaal aantal gelijktijdige nodes (default: aantal CPU's, max 8)
+        
+    Returns
+    -------
+    RunResult
+        Resultaat van de DAG-run
+    """
+    from kernel.batch import default_jobs
+    from kernel.dag import (
+        STATUS_FAILURE,
+        STATUS_SKIPPED,
+        DagNode,
+        NodeOutcome,
+        critical_path,
+        execute_dag,
+        parse_dag,
+    )
+    
+    try:
+        nodes = parse_dag(_load_manifest(manifest_path))
+        state = preflight()
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        return RunResult(
+            success=False,
+            message=f"Manifest ongeldig: {e}",
+            run_id="",
+            log_path=Path(),
+        )
+    except PreflightError as e:
+        return RunResult(
+            success=False,
+            message=f"Preflight gefaald: {e}",
+            run_id="",
+            log_path=Path(),
+        )
+    
+    KERNEL_RUNS_DIR.mkdir(parents=True, exist_ok=True)
+    start_time = datetime.now()
+    origin = time.perf_counter()
+    
+    try:
+        run_id, log_path = _claim_run_journal({
+            "recorded_by": "runner-kernel",
+            "mode": "dag",
+            "manifest": str(manifest_path),
+            "workspace": state.workspace_name,
+            "state_ref": {
+                "path": str(state.state_file_path.relative_to(WORKSPACE_ROOT)),
+                "hash": state.state_hash,
+            },
+            "timestamps": {
+                "start": format_timestamp(start_time),
+            },
+        })
+    except FileExistsError as e:
+        return RunResult(
+            success=False,
+            message=f"Geen vrij run-ID gevonden: {e}",
+            run_id="",
+            log_path=Path(),
+        )
+    _index_run_start(run_id, "runner-kernel", f"dag: {manifest_path.name}", log_path, start_time)
+    
+    agents = {node.id: node.agent for node in nodes}
+    
+    def _on_start(node: DagNode, offset: float) -> None:
+        append_record(log_path, RECORD_EVENT, {
+            "type": "handoff",
+            "id": node.id,
+            "from": ", ".join(agents[n] for n in node.needs) or "runner-kernel",
+            "to": node.agent,
+            "intent": node.intent,
+            "trigger": node.trigger,
+            "depends_on": list(node.needs),
+            "timestamp": format_timestamp(),
+            "start_ms": round(offset * 1000, 3),
+        })
+    
+    def _on_finish(outcome: NodeOutcome) -> None:
+        event: dict[str, Any] = {
+            "type": "node_result",
+            "id": outcome.node.id,
+            "to": outcome.node.agent,
+            "status": outcome.status,
+            "timestamp": format_timestamp(),
+        }
+        if outcome.result is not None:
+            event["run_id"] = outcome.result.run_id
+            event["message"] = outcome.result.message
+        if outcome.error is not None:
+            event["message"] = outcome.error
+        if outcome.start is not None and outcome.end is not None:
+            event["start_ms"] = round(outcome.start * 1000, 3)
+            event["end_ms"] = round(outcome.end * 1000, 3)
+            event["duration_ms"] = round(outcome.duration * 1000, 3)
+        append_record(log_path, RECORD_EVENT, event)
+    
+    def _run_node(node: DagNode) -> RunResult:
+        return start_run(
+            agent_name=node.agent,
+            intent=node.intent,
+            trigger=node.trigger,
+            state=state,
+            parent_id=run_id,
+        )
+    
+    outcomes = execute_dag(
+        nodes,
+        _run_node,
+        lambda result: result.success,
+        jobs or default_jobs(),
+        on_start=_on_start,
+        on_finish=_on_finish,
+    )
+    
+    wall_clock = time.perf_counter() - origin
+    path, path_length = critical_path(nodes, outcomes)
+    failed = sum(1 for o in outcomes.values() if o.status == STATUS_FAILURE)
+    skipped = sum(1 for o in outcomes.values() if o.status == STATUS_SKIPPED)
+    
+    append_record(log_path, RECORD_EVENT, {
+        "type": "dag_summary",
+        "nodes": len(nodes),
+        "failed": failed,
+        "skipped": skipped,
+        "wall_clock_ms": round(wall_clock * 1000, 3),
+        "sum_ms": round(sum(o.duration for o in outcomes.values()) * 1000, 3),
+        "critical_path": path,
+        "critical_path_ms": round(path_length * 1000, 3),
+        "timestamp": format_timestamp(),
+    })
+    
+    success = failed == 0 and skipped == 0
+    message = (
+        f"{len(nodes) - failed - skipped}/{len(nodes)} node(s) geslaagd"
+        f", {failed} gefaald, {skipped} overgeslagen"
+    )
+    end_time = datetime.now()
+    status = "success" if success else "failure"
+    append_record(log_path, RECORD_RESULT, {
+        "end": format_timestamp(end_time),
+        "status": status,
+        "message": message,
+    })
+    _index_run_end(run_id, log_path, end_time, status)
+    
+    return RunResult(
+        success=success,
+        message=message,
+        run_id=run_id,
+        log_path=log_path,
+    )
+
+
 def log_event(
     run_id: str,
     event_type: str,
@@ -281,28 +794,83 @@ def log_event(
     details : dict
         Event details
     """
-    log_path = KERNEL_RUNS_DIR / f"{run_id}.yaml"
+    log_events(run_id, [(event_type, details)])
+
+
+def log_events(
+    run_id: str,
+    events: list[tuple[str, dict[str, Any]]],
+) -> int:
+    """Log een batch events in een bestaande run onder één lock.
     
-    if not log_path.exists():
-        print(f"WARNING: Run log niet gevonden: {log_path}", file=sys.stderr)
-        return
+    Alle events krijgen hetzelfde tijdstip en worden in één schrijfactie
+    aan het journal toegevoegd. Parallelle schrijvers in dezelfde run
+    verliezen zo geen events en schrijven geen regels door elkaar.
+    
+    Parameters
+    ----------
+    run_id : str
+        Run identifier
+    events : list[tuple[str, dict]]
+        Lijst van (event_type, details)
+        
+    Returns
+    -------
+    int
+        Aantal gelogde events; -1 als de run niet bestaat of het journal
+        niet beschreven kon worden
+    """
+    log_path = _find_run_log(run_id)
+    
+    if log_path is None:
+        print(f"ERROR: Run log niet gevonden: {run_id}", file=sys.stderr)
+        return -1
     
     try:
+        return _append_events(log_path, events)
+    except Exception as e:
+        print(f"ERROR: Fout bij loggen event: {e}", file=sys.stderr)
+        return -1
+
+
+def _append_events(
+    log_path: Path,
+    events: list[tuple[str, dict[str, Any]]],
+) -> int:
+    """Schrijf events naar een gevonden run-log (journal of legacy YAML).
+    
+    Parameters
+    ----------
+    log_path : Path
+        Pad naar het run-log
+    events : list[tuple[str, dict]]
+        Lijst van (event_type, details)
+        
+    Returns
+    -------
+    int
+        Aantal gelogde events
+    """
+    timestamp = format_timestamp()
+    records = [
+        {"type": event_type, "timestamp": timestamp, **details}
+        for event_type, details in events
+    ]
+    
+    if log_path.suffix == JOURNAL_SUFFIX:
+        return append_records(
+            log_path, ((RECORD_EVENT, record) for record in records)
+        )
+    
+    # Legacy YAML run-log: read-modify-write onder lock
+    with file_lock(log_path):
         with open(log_path, encoding="utf-8") as f:
             run_log = yaml.safe_load(f)
         
-        event = {
-            "type": event_type,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S CET"),
-            **details,
-        }
-        
-        run_log["events"].append(event)
+        run_log["events"].extend(records)
         
         _write_run_log(log_path, run_log)
-        
-    except Exception as e:
-        print(f"ERROR: Fout bij loggen event: {e}", file=sys.stderr)
+    return len(records)
 
 
 def finalize_run(run_id: str, success: bool, message: str) -> None:
@@ -317,129 +885,826 @@ def finalize_run(run_id: str, success: bool, message: str) -> None:
     message : str
         Resultaat boodschap
     """
-    log_path = KERNEL_RUNS_DIR / f"{run_id}.yaml"
+    log_path = _find_run_log(run_id)
     
-    if not log_path.exists():
-        print(f"ERROR: Run log niet gevonden: {log_path}", file=sys.stderr)
+    if log_path is None:
+        print(f"ERROR: Run log niet gevonden: {run_id}", file=sys.stderr)
         return
     
     try:
-        with open(log_path, encoding="utf-8") as f:
-            run_log = yaml.safe_load(f)
+        end_time = datetime.now()
+        end = format_timestamp(end_time)
+        status = "success" if success else "failure"
         
-        run_log["timestamps"]["end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S CET")
-        run_log["result"] = {
-            "status": "success" if success else "failure",
-            "message": message,
-        }
+        if log_path.suffix == JOURNAL_SUFFIX:
+            append_record(log_path, RECORD_RESULT, {
+                "end": end,
+                "status": status,
+                "message": message,
+            })
+        else:
+            # Legacy YAML run-log: read-modify-write onder lock
+            with file_lock(log_path):
+                with open(log_path, encoding="utf-8") as f:
+                    run_log = yaml.safe_load(f)
+                
+                run_log["timestamps"]["end"] = end
+                run_log["result"] = {
+                    "status": status,
+                    "message": message,
+                }
+                
+                _write_run_log(log_path, run_log)
         
-        _write_run_log(log_path, run_log)
+        _index_run_end(run_id, log_path, end_time, status)
         
     except Exception as e:
         print(f"ERROR: Fout bij finaliseren run: {e}", file=sys.stderr)
 
 
-def cleanup_logs() -> int:
-    """Ruim oude run logs op conform retentie-beleid.
+def tail_runs(
+    run_ids: list[str],
+    *,
+    follow: bool = True,
+    from_start: bool = True,
+    idle_timeout: float | None = None,
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Stream records van één of meer runs terwijl ze geschreven worden.
     
-    Retentie:
-    - Maximaal 20 runs bewaren
-    - Maximaal 7 dagen oud
-    - Failure-runs mogen langer bewaard blijven
+    Alleen nieuw toegevoegde regels worden gelezen; wachten gebeurt via
+    inotify (of polling als fallback). Volgen stopt zodra elke run een
+    resultaat heeft, of na ``idle_timeout`` seconden zonder nieuwe records.
     
-    Returns
-    -------
-    int
-        Aantal verwijderde logs
+    Parameters
+    ----------
+    run_ids : list[str]
+        Te volgen runs (journals)
+    follow : bool
+        Blijf volgen tot de runs afgerond zijn
+    from_start : bool
+        Toon ook de records die al in het journal staan
+    idle_timeout : float, optional
+        Stop na zoveel seconden zonder nieuwe records
+        
+    Yields
+    ------
+    tuple[str, str, dict]
+        (run_id, record-kind, record-data)
+        
+    Raises
+    ------
+    FileNotFoundError
+        Als een run niet bestaat of geen journal heeft
     """
-    if not KERNEL_RUNS_DIR.exists():
-        return 0
-    
-    run_logs = sorted(KERNEL_RUNS_DIR.glob("run-*.yaml"))
-    
-    if not run_logs:
-        return 0
-    
-    cutoff_date = datetime.now() - timedelta(days=MAX_RUN_AGE_DAYS)
-    logs_to_delete: list[Path] = []
+    from kernel.tail import follow_journals
     
-    # Sorteer op aanmaaktijd (nieuwste eerst)
-    run_logs_with_time = [
-        (log, log.stat().st_mtime) for log in run_logs
-    ]
-    run_logs_with_time.sort(key=lambda x: x[1], reverse=True)
+    paths: dict[Path, str] = {}
+    archived: list[tuple[str, bytes]] = []
+    for run_id in run_ids:
+        log_path = _find_run_log(run_id)
+        if log_path is None:
+            # Gearchiveerde runs zijn afgerond: eenmalig uitlezen volstaat
+            found = _read_archived_run(run_id)
+            if found is not None and found[0] == JOURNAL_SUFFIX:
+                archived.append((run_id, found[1]))
+                continue
+        if log_path is None or log_path.suffix != JOURNAL_SUFFIX:
+            raise FileNotFoundError(f"Run journal niet gevonden: {run_id}")
+        paths[log_path] = run_id
     
-    for i, (log_path, mtime) in enumerate(run_logs_with_time):
-        # Bewaar de nieuwste MAX_RUNS_TO_KEEP runs
-        if i < MAX_RUNS_TO_KEEP:
-            continue
-        
-        # Check age
-        log_date = datetime.fromtimestamp(mtime)
-        if log_date < cutoff_date:
-            # Check of het een failure-run is
-            try:
-                with open(log_path, encoding="utf-8") as f:
-                    log_data = yaml.safe_load(f)
-                
-                result = log_data.get("result", {})
-                if result.get("status") == "failure":
-                    # Bewaar failure-runs langer
-                    continue
-            except Exception:
-                pass  # Bij fout: toch verwijderen
-            
-            logs_to_delete.append(log_path)
-    
-    # Verwijder logs
-    for log_path in logs_to_delete:
-        try:
-            log_path.unlink()
-        except Exception as e:
-            print(f"WARNING: Kon log niet verwijderen: {log_path} ({e})", file=sys.stderr)
+    for run_id, payload in archived:
+        lines = payload.decode("utf-8").splitlines(keepends=True)
+        for kind, data in parse_records(lines):
+            yield run_id, kind, data
     
-    return len(logs_to_delete)
+    for log_path, kind, data in follow_journals(
+        list(paths),
+        follow=follow,
+        from_start=from_start,
+        idle_timeout=idle_timeout,
+    ):
+        yield paths[log_path], kind, data
 
 
-def _compute_file_hash(file_path: Path) -> str:
-    """Bereken SHA256 hash van een bestand.
+def export_run(run_id: str, output: Path | None = None) -> str:
+    """Exporteer een run als YAML run-log.
+    
+    Het YAML-document wordt alleen op verzoek uit het journal opgebouwd;
+    tijdens de run wordt uitsluitend naar het journal geschreven.
     
     Parameters
     ----------
-    file_path : Path
-        Pad naar bestand
+    run_id : str
+        Run identifier
+    output : Path, optional
+        Doelbestand; zonder output wordt alleen de YAML teruggegeven
         
     Returns
     -------
     str
-        Hex digest van SHA256 hash
+        YAML weergave van het run-log
+        
+    Raises
+    ------
+    FileNotFoundError
+        Als de run niet gevonden wordt
     """
-    sha256 = hashlib.sha256()
-    try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
-    except Exception:
-        return ""
-
-
-def _write_run_log(log_path: Path, log_data: dict[str, Any]) -> None:
-    """Schrijf run log atomisch naar disk.
+    log_path = _find_run_log(run_id)
     
-    Parameters
+    if log_path is not None:
+        if log_path.suffix == JOURNAL_SUFFIX:
+            run_log = materialize_run_log(log_path)
+        else:
+            with open(log_path, encoding="utf-8") as f:
+                run_log = yaml.safe_load(f)
+    else:
+        archived = _read_archived_run(run_id)
+        if archived is None:
+            raise FileNotFoundError(f"Run log niet gevonden: {run_id}")
+        suffix, payload = archived
+        text = payload.decode("utf-8")
+        if suffix == JOURNAL_SUFFIX:
+            run_log = build_run_log(parse_records(text.splitlines(keepends=True)))
+        else:
+            run_log = yaml.safe_load(text)
+    
+    if output is not None:
+        _write_run_log(output, run_log)
+    
+    return yaml.dump(run_log, default_flow_style=False, allow_unicode=True)
+
+
+def cleanup_logs() -> CleanupResult:
+    """Pas het retentie-beleid toe: archiveer oude runs en ruim verlopen runs op.
+    
+    Retentie:
+    - Hot (``.kernel/runs/``): de 20 nieuwste runs en alles jonger dan 7 dagen
+    - Archief (``.kernel/archive/``): oudere afgeronde runs, gecomprimeerd per
+      startdag, per run op te vragen via ``export-run``
+    - Verval: alle runs (ook failure-runs) na 30 dagen
+    
+    Kandidaten komen uit de run-catalogus; alleen te archiveren logs worden
+    gelezen. Ontbreekt de catalogus, dan wordt hij eerst eenmalig opgebouwd.
+    
+    Returns
+    -------
+    CleanupResult
+        Aantal gearchiveerde en verwijderde runs
+    """
+    if not KERNEL_RUNS_DIR.exists():
+        return CleanupResult(archived=0, deleted=0)
+    
+    if not _run_catalogue().exists():
+        _bootstrap_catalogue()
+    
+    now = datetime.now()
+    deleted = _expire_runs(now)
+    archived = _archive_runs(now)
+    return CleanupResult(archived=archived, deleted=deleted)
+
+
+def _expire_runs(now: datetime) -> int:
+    """Verwijder runs (hot of gearchiveerd) voorbij hun bewaartermijn."""
+    from kernel.archive import prune_index, remove_segment
+    
+    expired = _run_catalogue().expired(
+        keep=MAX_RUNS_TO_KEEP,
+        cutoff=(now - timedelta(days=MAX_ARCHIVED_RUN_AGE_DAYS)).timestamp(),
+    )
+    
+    deleted: list[str] = []
+    segments: dict[str, set[str]] = {}
+    for entry in expired:
+        if entry.archive is not None:
+            segments.setdefault(entry.archive, set()).add(entry.run_id)
+            deleted.append(entry.run_id)
+            continue
+        # Verwijder hot log (inclusief eventuele sidecar lock)
+        log_path = Path(entry.path)
+        try:
+            log_path.unlink(missing_ok=True)
+            lock_path_for(log_path).unlink(missing_ok=True)
+            deleted.append(entry.run_id)
+        except Exception as e:
+            print(f"WARNING: Kon log niet verwijderen: {log_path} ({e})", file=sys.stderr)
+    
+    _run_catalogue().delete(deleted)
+    
+    # Segmenten verlopen als geheel, zodra geen run er meer naar verwijst;
+    # anders gaan de verlopen runs uit de index, zodat reindex-runs ze niet
+    # terugbrengt
+    for segment, run_ids in sorted(segments.items()):
+        try:
+            if _run_catalogue().segment_in_use(segment):
+                prune_index(Path(segment), run_ids)
+            else:
+                remove_segment(Path(segment))
+        except OSError as e:
+            print(f"WARNING: Kon segment niet opschonen: {segment} ({e})", file=sys.stderr)
+    
+    return len(deleted)
+
+
+def _archive_runs(now: datetime) -> int:
+    """Verplaats afgeronde runs buiten het hot-venster naar archiefsegmenten."""
+    from kernel.archive import ArchiveMember, append_members, segment_path
+    
+    candidates = _run_catalogue().archive_candidates(
+        keep=MAX_RUNS_TO_KEEP,
+        cutoff=(now - timedelta(days=MAX_RUN_AGE_DAYS)).timestamp(),
+    )
+    
+    by_segment: dict[Path, list[RunEntry]] = {}
+    for entry in candidates:
+        segment = segment_path(KERNEL_ARCHIVE_DIR, entry.started_at)
+        by_segment.setdefault(segment, []).append(entry)
+    
+    archived = 0
+    for segment, entries in by_segment.items():
+        members: list[ArchiveMember] = []
+        for entry in entries:
+            log_path = Path(entry.path)
+            try:
+                payload = log_path.read_bytes()
+            except OSError as e:
+                print(f"WARNING: Kon log niet archiveren: {log_path} ({e})", file=sys.stderr)
+                continue
+            meta = entry._asdict()
+            for key in ("run_id", "archive", "archive_offset", "archive_length"):
+                meta.pop(key)
+            members.append(ArchiveMember(entry.run_id, payload, meta))
+        
+        try:
+            locations = append_members(segment, members)
+        except OSError as e:
+            print(f"WARNING: Kon segment niet schrijven: {segment} ({e})", file=sys.stderr)
+            continue
+        
+        # Eerst de catalogus bijwerken, dan pas de hot logs weghalen
+        _run_catalogue().mark_archived(
+            (member.run_id, str(loc.segment), loc.offset, loc.length)
+            for member, loc in zip(members, locations)
+        )
+        for member in members:
+            log_path = Path(member.meta["path"])
+            log_path.unlink(missing_ok=True)
+            lock_path_for(log_path).unlink(missing_ok=True)
+        archived += len(members)
+    
+    return archived
+
+
+def _read_archived_run(run_id: str) -> tuple[str, bytes] | None:
+    """Haal één gearchiveerde run op zonder het hele segment te decomprimeren.
+    
+    De locatie komt uit de catalogus; ontbreekt de catalogus of kent hij
+    de run niet, dan wordt de run in de segment-indexen gezocht.
+    
+    Returns
+    -------
+    tuple[str, bytes] or None
+        (oorspronkelijke suffix, inhoud van het run-log)
+    """
+    from kernel.archive import find_in_index, read_member
+    
+    if not is_valid_run_id(run_id):
+        return None
+    
+    entry = _run_catalogue().get(run_id) if _run_catalogue().exists() else None
+    if entry is not None:
+        if entry.archive is None:
+            return None
+        payload = read_member(Path(entry.archive), entry.archive_offset, entry.archive_length)
+        return Path(entry.path).suffix, payload
+    
+    found = find_in_index(KERNEL_ARCHIVE_DIR, run_id)
+    if found is None:
+        return None
+    location, record = found
+    payload = read_member(location.segment, location.offset, location.length)
+    return Path(str(record.get("path", ""))).suffix or JOURNAL_SUFFIX, payload
+
+
+def list_runs(
+    *,
+    agent: str | None = None,
+    status: str | None = None,
+    since: datetime | None = None,
+    limit: int | None = None,
+) -> list[RunEntry]:
+    """Zoek runs in de run-catalogus (nieuwste eerst).
+    
+    Parameters
+    ----------
+    agent : str, optional
+        Alleen runs van deze agent
+    status : str, optional
+        Alleen runs met deze status ("success", "failure")
+    since : datetime, optional
+        Alleen runs gestart op of na dit moment
+    limit : int, optional
+        Maximaal aantal resultaten
+        
+    Returns
+    -------
+    list[RunEntry]
+        Gevonden runs
+    """
+    if not _run_catalogue().exists() and KERNEL_RUNS_DIR.exists():
+        _bootstrap_catalogue()
+    
+    return _run_catalogue().query(
+        agent=agent,
+        status=status,
+        since=since.timestamp() if since else None,
+        limit=limit,
+    )
+
+
+def run_stats(
+    *,
+    agent: str | None = None,
+    since: datetime | None = None,
+    limit: int | None = None,
+) -> dict[str, Any]:
+    """Aggregeer de timing-records van opgeslagen runs.
+    
+    Alleen de timing-regel van elk journal wordt gedecodeerd; de selectie
+    van runs komt uit de run-catalogus.
+    
+    Parameters
+    ----------
+    agent : str, optional
+        Alleen runs van deze agent
+    since : datetime, optional
+        Alleen runs gestart op of na dit moment
+    limit : int, optional
+        Alleen de laatste N runs
+        
+    Returns
+    -------
+    dict
+        ``runs`` (aantal runs met timing), ``phases`` (p50/p95/p99 per fase)
+        en ``agents`` (p50/p95/p99 per agent en fase, in ms)
+    """
+    from kernel.archive import read_member
+    
+    per_phase: dict[str, list[float]] = {}
+    per_agent: dict[str, list[float]] = {}
+    measured = 0
+    
+    for entry in list_runs(agent=agent, since=since, limit=limit):
+        log_path = Path(entry.path)
+        if log_path.suffix != JOURNAL_SUFFIX:
+            continue
+        try:
+            if entry.archive is None:
+                timing = read_timing(log_path)
+            else:
+                payload = read_member(
+                    Path(entry.archive), entry.archive_offset, entry.archive_length
+                )
+                lines = payload.decode("utf-8").splitlines(keepends=True)
+                timing = next(
+                    (data for kind, data in parse_records(lines) if kind == RECORD_TIMING),
+                    None,
+                )
+        except OSError:
+            continue
+        if not timing:
+            continue
+        
+        spans = timing.get("spans") or []
+        totals = span_totals(spans)
+        totals["total"] = max(
+            (s.get("start_ms", 0.0) + s.get("duration_ms", 0.0) for s in spans),
+            default=0.0,
+        )
+        run_agent = entry.agent or timing.get("agent") or "-"
+        measured += 1
+        for phase, duration in totals.items():
+            per_phase.setdefault(phase, []).append(duration)
+            per_agent.setdefault(f"{run_agent}/{phase}", []).append(duration)
+    
+    return {
+        "runs": measured,
+        "phases": summarize(per_phase),
+        "agents": summarize(per_agent),
+    }
+
+
+def reindex_runs() -> int:
+    """Bouw de run-catalogus opnieuw op uit alle run-logs.
+    
+    Dit is de enige operatie die alle logs opent; normaal houdt de kernel
+    de catalogus bij tijdens start en finalisatie van runs.
+    
+    Returns
+    -------
+    int
+        Aantal geïndexeerde runs
+    """
+    return _run_catalogue().rebuild(_scan_run_logs())
+
+
+def _bootstrap_catalogue() -> None:
+    """Vul een nieuwe catalogus met bestaande logs, zonder rijen te overschrijven.
+    
+    Anders dan reindex_runs is dit veilig terwijl andere threads of
+    processen runs starten en registreren.
+    """
+    _run_catalogue().merge(_scan_run_logs())
+
+
+def _scan_run_logs() -> list[RunEntry]:
+    """Lees catalogusregels uit alle run-logs en archiefindexen op disk.
+    
+    Staat een run zowel in het archief als hot (onderbroken archivering),
+    dan wint het hot log; de volgende cleanup archiveert hem opnieuw.
+    """
+    entries = _scan_archive_indexes()
+    if KERNEL_RUNS_DIR.exists():
+        run_logs = list(KERNEL_RUNS_DIR.glob(f"run-*{JOURNAL_SUFFIX}"))
+        run_logs += list(KERNEL_RUNS_DIR.glob("run-*.yaml"))
+        for log_path in run_logs:
+            try:
+                entry = _catalogue_entry_from_log(log_path)
+            except Exception as e:
+                print(f"WARNING: Kon log niet indexeren: {log_path} ({e})", file=sys.stderr)
+                continue
+            entries[entry.run_id] = entry
+    return list(entries.values())
+
+
+def _scan_archive_indexes() -> dict[str, RunEntry]:
+    """Catalogusregels van gearchiveerde runs, uit de segment-indexen."""
+    from kernel.archive import iter_index, list_segments
+    from kernel.catalogue import RunEntry
+    
+    entries: dict[str, RunEntry] = {}
+    for segment in list_segments(KERNEL_ARCHIVE_DIR):
+        for record in iter_index(segment):
+            try:
+                entries[record["run_id"]] = RunEntry(
+                    run_id=record["run_id"],
+                    agent=record.get("agent"),
+                    intent=record.get("intent"),
+                    path=record["path"],
+                    started_at=record.get("started_at"),
+                    ended_at=record.get("ended_at"),
+                    updated_at=record.get("updated_at"),
+                    status=record.get("status"),
+                    size=record.get("size"),
+                    archive=str(segment),
+                    archive_offset=int(record["offset"]),
+                    archive_length=int(record["length"]),
+                )
+            except (KeyError, TypeError, ValueError):
+                print(f"WARNING: Ongeldige indexregel in {segment}", file=sys.stderr)
+    return entries
+
+
+def _catalogue_entry_from_log(log_path: Path) -> RunEntry:
+    """Lees de catalogusvelden uit een run-log (journal of legacy YAML).
+    
+    Parameters
+    ----------
+    log_path : Path
+        Pad naar het run-log
+        
+    Returns
+    -------
+    RunEntry
+        Catalogusregel voor deze run
+    """
+    from kernel.catalogue import RunEntry
+    
+    st = log_path.stat()
+    
+    if log_path.suffix == JOURNAL_SUFFIX:
+        run_log = materialize_run_log(log_path)
+    else:
+        with open(log_path, encoding="utf-8") as f:
+            run_log = yaml.safe_load(f) or {}
+    
+    timestamps = run_log.get("timestamps") or {}
+    result = run_log.get("result") or {}
+    handoff = next(
+        (e for e in run_log.get("events") or [] if e.get("type") == "handoff"),
+        {},
+    )
+    
+    return RunEntry(
+        run_id=run_log.get("run_id") or log_path.stem,
+        agent=handoff.get("to"),
+        intent=handoff.get("intent"),
+        path=str(log_path),
+        started_at=_parse_log_timestamp(timestamps.get("start")),
+        ended_at=_parse_log_timestamp(timestamps.get("end")),
+        updated_at=st.st_mtime,
+        status=result.get("status"),
+        size=st.st_size,
+    )
+
+
+def _parse_log_timestamp(value: Any) -> float | None:
+    """Vertaal een log-timestamp ("YYYY-MM-DD HH:MM:SS +0100") naar epoch."""
+    moment = parse_timestamp(value)
+    return moment.timestamp() if moment is not None else None
+
+
+def _index_run_start(
+    run_id: str,
+    agent_name: str,
+    intent: str,
+    log_path: Path,
+    start_time: datetime,
+) -> None:
+    """Registreer een gestarte run in de catalogus (fouten zijn niet fataal).
+    
+    Bij de eerste run zonder catalogus worden eerst de bestaande logs
+    geïndexeerd, zodat oudere runs niet uit beeld raken.
+    """
+    try:
+        if not _run_catalogue().exists():
+            _bootstrap_catalogue()
+        _run_catalogue().record_start(
+            run_id=run_id,
+            agent=agent_name,
+            intent=intent,
+            path=log_path,
+            started_at=start_time.timestamp(),
+            size=log_path.stat().st_size,
+        )
+    except (sqlite3.Error, OSError) as e:
+        print(f"WARNING: Run-catalogus niet bijgewerkt: {e}", file=sys.stderr)
+
+
+def _index_run_end(
+    run_id: str,
+    log_path: Path,
+    end_time: datetime,
+    status: str,
+) -> None:
+    """Registreer het resultaat van een run in de catalogus."""
+    try:
+        _run_catalogue().record_end(
+            run_id=run_id,
+            ended_at=end_time.timestamp(),
+            status=status,
+            size=log_path.stat().st_size,
+        )
+    except (sqlite3.Error, OSError) as e:
+        print(f"WARNING: Run-catalogus niet bijgewerkt: {e}", file=sys.stderr)
+
+
+def _claim_run_journal(run_header: dict[str, Any]) -> tuple[str, Path]:
+    """Reserveer een run-ID door exclusief het journal aan te maken.
+    
+    Het exclusief aanmaken van het journal is de definitieve claim: bestaat
+    het bestand al (bijv. door een ander proces), dan wordt een nieuw ID
+    gegenereerd. Een bestaande run wordt zo nooit overschreven.
+    
+    Parameters
+    ----------
+    run_header : dict
+        Run header zonder run_id
+        
+    Returns
+    -------
+    tuple[str, Path]
+        Geclaimd run-ID en pad naar het journal
+        
+    Raises
+    ------
+    FileExistsError
+        Als na MAX_RUN_ID_ATTEMPTS pogingen geen vrij ID gevonden is
+    """
+    last_error: FileExistsError | None = None
+    for _ in range(MAX_RUN_ID_ATTEMPTS):
+        run_id = generate_run_id()
+        log_path = journal_path(KERNEL_RUNS_DIR, run_id)
+        try:
+            create_journal(log_path, {"run_id": run_id, **run_header})
+        except FileExistsError as e:
+            last_error = e
+            continue
+        return run_id, log_path
+    raise FileExistsError(str(last_error))
+
+
+def _find_run_log(run_id: str) -> Path | None:
+    """Zoek het log van een run: journal eerst, daarna legacy YAML.
+    
+    Parameters
+    ----------
+    run_id : str
+        Run identifier
+        
+    Returns
+    -------
+    Path or None
+        Pad naar het run-log, of None als de run niet bestaat
+    """
+    if not is_valid_run_id(run_id):
+        return None
+    
+    for candidate in (
+        journal_path(KERNEL_RUNS_DIR, run_id),
+        KERNEL_RUNS_DIR / f"{run_id}.yaml",
+    ):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _compute_file_hash(file_path: Path) -> str:
+    """Bereken SHA256 hash van een bestand.
+    
+    Parameters
+    ----------
+    file_path : Path
+        Pad naar bestand
+        
+    Returns
+    -------
+    str
+        Hex digest van SHA256 hash, of "" als het bestand niet leesbaar is
+    """
+    from kernel.hashing import hash_file
+    
+    try:
+        return hash_file(file_path)
+    except OSError:
+        return ""
+
+
+def _write_run_log(log_path: Path, log_data: dict[str, Any]) -> None:
+    """Schrijf run log atomisch naar disk.
+    
+    Schrijft naar een tijdelijk bestand in dezelfde map en vervangt het
+    doel via rename; een crash laat nooit een half geschreven log achter.
+    Gelijktijdige read-modify-write moet de aanroeper afschermen met
+    ``file_lock``.
+    
+    Parameters
     ----------
     log_path : Path
         Pad naar log bestand
     log_data : dict
         Log data om weg te schrijven
     """
-    log_path.write_text(
+    atomic_write_text(
+        log_path,
         yaml.dump(log_data, default_flow_style=False, allow_unicode=True),
-        encoding="utf-8",
     )
 
 
+def _stat_signature(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) van een bestand, of None als het ontbreekt."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class KernelDaemon:
+    """In-memory kernel-context voor ``serve``.
+    
+    Houdt de gevalideerde state, de ping-status en de journals van open
+    runs vast. Preflight wordt alleen opnieuw uitgevoerd als de state file
+    of de normatief-stelsel ping op disk gewijzigd is; de corpus-fingerprint
+    wordt per run ververst.
+    """
+    
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: StateData | None = None
+        self._signature: tuple[Any, Any] | None = None
+        self.journals: dict[str, Path] = {}
+    
+    def state(self) -> StateData:
+        """Gevalideerde state; herberekend na wijziging van state of ping.
+        
+        Raises
+        ------
+        PreflightError
+            Bij gefaalde preflight check
+        """
+        signature = (
+            _stat_signature(STATE_FILE),
+            _stat_signature(NORMATIEF_STELSEL_PING),
+        )
+        with self._lock:
+            if self._state is None or signature != self._signature:
+                self._state = None
+                self._state = preflight()
+                self._signature = signature
+                return self._state
+            self._state = with_corpus_digest(self._state)
+            return self._state
+    
+    def operations(self) -> dict[str, Any]:
+        """Registry van daemon-operaties (naam -> functie(params))."""
+        return {
+            "ping": self.op_ping,
+            "start-run": self.op_start_run,
+            "log-events": self.op_log_events,
+            "finalize-run": self.op_finalize_run,
+        }
+    
+    def op_ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "workspace": self._state.workspace_name if self._state else None,
+            "open_runs": len(self.journals),
+        }
+    
+    def op_start_run(self, params: dict[str, Any]) -> dict[str, Any]:
+        try:
+            state = self.state()
+        except PreflightError as e:
+            return {"success": False, "message": f"Preflight gefaald: {e}", "run_id": ""}
+        
+        result = start_run(
+            agent_name=params["agent_name"],
+            intent=params["intent"],
+            trigger=params.get("trigger", "handmatig"),
+            state=state,
+        )
+        if result.success:
+            self.journals[result.run_id] = result.log_path
+        return {
+            "success": result.success,
+            "message": result.message,
+            "run_id": result.run_id,
+            "log_path": str(result.log_path),
+        }
+    
+    def op_log_events(self, params: dict[str, Any]) -> int:
+        run_id = params["run_id"]
+        events: list[tuple[str, dict[str, Any]]] = []
+        for event in params.get("events") or []:
+            details = dict(event)
+            events.append((str(details.pop("type")), details))
+        
+        log_path = self.journals.get(run_id) or _find_run_log(run_id)
+        if log_path is None:
+            raise FileNotFoundError(f"Run log niet gevonden: {run_id}")
+        self.journals[run_id] = log_path
+        return _append_events(log_path, events)
+    
+    def op_finalize_run(self, params: dict[str, Any]) -> None:
+        run_id = params["run_id"]
+        if (self.journals.get(run_id) or _find_run_log(run_id)) is None:
+            raise FileNotFoundError(f"Run log niet gevonden: {run_id}")
+        finalize_run(run_id, bool(params["success"]), params.get("message", ""))
+        self.journals.pop(run_id, None)
+
+
+def _load_manifest(manifest_path: Path) -> Any:
+    """Lees een batch- of DAG-manifest (YAML of JSON)."""
+    with open(manifest_path, encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _read_event_lines(source: str) -> list[tuple[str, dict[str, Any]]]:
+    """Lees events (één JSON object per regel) uit een bestand of stdin.
+    
+    Parameters
+    ----------
+    source : str
+        Pad naar JSONL bestand, of "-" voor stdin
+        
+    Returns
+    -------
+    list[tuple[str, dict]]
+        Lijst van (event_type, details)
+        
+    Raises
+    ------
+    ValueError
+        Bij een regel zonder geldig JSON object of zonder 'type' veld
+    """
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+    
+    events: list[tuple[str, dict[str, Any]]] = []
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict) or "type" not in record:
+            raise ValueError(f"regel {line_no}: JSON object met 'type' verwacht")
+        details = dict(record)
+        event_type = str(details.pop("type"))
+        events.append((event_type, details))
+    return events
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse CLI argumenten.
     
@@ -479,12 +1744,190 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         help="Reden voor de run (default: handmatig)",
     )
     
+    # start-batch commando
+    batch_parser = subparsers.add_parser(
+        "start-batch",
+        help="Start een batch agent-runs uit een manifest (gedeelde preflight)",
+    )
+    batch_parser.add_argument(
+        "manifest",
+        type=Path,
+        help="YAML of JSON manifest met runs (agent, intent, trigger)",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximaal aantal gelijktijdige runs (default: aantal CPU's, max 8)",
+    )
+    
+    # start-dag commando
+    dag_parser = subparsers.add_parser(
+        "start-dag",
+        help="Voer een DAG van afhankelijke handoffs uit (parallelle takken)",
+    )
+    dag_parser.add_argument(
+        "manifest",
+        type=Path,
+        help="YAML of JSON manifest met nodes (id, agent, intent, needs)",
+    )
+    dag_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximaal aantal gelijktijdige nodes (default: aantal CPU's, max 8)",
+    )
+    
+    # log-events commando
+    events_parser = subparsers.add_parser(
+        "log-events",
+        help="Log een batch events (JSON per regel) in een bestaande run",
+    )
+    events_parser.add_argument(
+        "run_id",
+        help="Run identifier",
+    )
+    events_parser.add_argument(
+        "--input",
+        default="-",
+        help="JSONL bestand met events, elk met een 'type' veld (default: stdin)",
+    )
+    
+    # tail commando
+    tail_parser = subparsers.add_parser(
+        "tail",
+        help="Volg de events van één of meer runs live",
+    )
+    tail_parser.add_argument(
+        "run_ids",
+        nargs="*",
+        help="Run identifiers (default: laatst gestarte run)",
+    )
+    tail_parser.add_argument(
+        "--no-follow",
+        action="store_true",
+        help="Toon bestaande events en stop direct",
+    )
+    tail_parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Toon alleen events die na het starten van tail binnenkomen",
+    )
+    tail_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Stop na zoveel seconden zonder nieuwe events",
+    )
+    
+    # export-run commando
+    export_parser = subparsers.add_parser(
+        "export-run",
+        help="Exporteer het journal van een run als YAML run-log",
+    )
+    export_parser.add_argument(
+        "run_id",
+        help="Run identifier (bijv. run-20260115-083600-123456-00a1b2-0000)",
+    )
+    export_parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Schrijf YAML naar dit bestand (default: stdout)",
+    )
+    
     # cleanup-logs commando
     subparsers.add_parser(
         "cleanup-logs",
         help="Ruim oude run logs op conform retentie-beleid",
     )
     
+    # list-runs commando
+    list_parser = subparsers.add_parser(
+        "list-runs",
+        help="Zoek runs in de run-catalogus",
+    )
+    list_parser.add_argument(
+        "--agent",
+        default=None,
+        help="Alleen runs van deze agent",
+    )
+    list_parser.add_argument(
+        "--status",
+        choices=["success", "failure"],
+        default=None,
+        help="Alleen runs met deze status",
+    )
+    list_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Alleen runs gestart vanaf dit moment (bijv. 2026-01-15 of '2026-01-15 09:30')",
+    )
+    list_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximaal aantal resultaten",
+    )
+    
+    # corpus-status commando
+    corpus_parser = subparsers.add_parser(
+        "corpus-status",
+        help="Toon normatieve documenten gewijzigd sinds de vorige run",
+    )
+    corpus_parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Leg de huidige stand vast als nieuwe snapshot",
+    )
+    
+    # stats commando
+    stats_parser = subparsers.add_parser(
+        "stats",
+        help="Toon p50/p95/p99 per fase en per agent over opgeslagen runs",
+    )
+    stats_parser.add_argument(
+        "--agent",
+        default=None,
+        help="Alleen runs van deze agent",
+    )
+    stats_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Alleen runs gestart vanaf dit moment",
+    )
+    stats_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Alleen de laatste N runs",
+    )
+    stats_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Uitvoer als JSON",
+    )
+    
+    # reindex-runs commando
+    subparsers.add_parser(
+        "reindex-runs",
+        help="Bouw de run-catalogus opnieuw op uit alle run-logs",
+    )
+    
+    # serve commando
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Start de kernel als daemon op een Unix domain socket",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Pad naar de socket (default: $KERNEL_SOCKET of .kernel/kernel.sock)",
+    )
+    
     return parser.parse_args(argv)
 
 
@@ -511,9 +1954,178 @@ def main() -> int:
             print(f"\nERROR: {result.message}", file=sys.stderr)
             return 1
     
+    elif args.command == "start-batch":
+        batch = start_batch(args.manifest, jobs=args.jobs)
+        
+        if not batch.batch_id:
+            print(f"\nERROR: {batch.message}", file=sys.stderr)
+            return 1
+        
+        for run in batch.runs:
+            status = "OK   " if run.success else "ERROR"
+            print(f"{status} {run.run_id or '-'}  {run.message}")
+        print(f"\n{'OK' if batch.success else 'ERROR'}: {batch.message}")
+        print(f"Batch ID: {batch.batch_id}")
+        print(f"Summary : {batch.summary_path.relative_to(WORKSPACE_ROOT)}")
+        return 0 if batch.success else 1
+    
+    elif args.command == "start-dag":
+        result = start_dag(args.manifest, jobs=args.jobs)
+        
+        if not result.run_id:
+            print(f"\nERROR: {result.message}", file=sys.stderr)
+            return 1
+        
+        print(f"\n{'OK' if result.success else 'ERROR'}: {result.message}")
+        print(f"Run ID: {result.run_id}")
+        print(f"Log   : {result.log_path.relative_to(WORKSPACE_ROOT)}")
+        return 0 if result.success else 1
+    
+    elif args.command == "log-events":
+        try:
+            events = _read_event_lines(args.input)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Events niet leesbaar: {e}", file=sys.stderr)
+            return 1
+        
+        logged = log_events(args.run_id, events)
+        if logged != len(events):
+            return 1
+        print(f"OK: {logged} event(s) gelogd in {args.run_id}")
+        return 0
+    
+    elif args.command == "tail":
+        from kernel.tail import format_record
+        
+        run_ids = args.run_ids
+        if not run_ids:
+            latest = list_runs(limit=1)
+            if not latest:
+                print("ERROR: Geen runs gevonden", file=sys.stderr)
+                return 1
+            run_ids = [latest[0].run_id]
+        
+        try:
+            for run_id, kind, data in tail_runs(
+                run_ids,
+                follow=not args.no_follow,
+                from_start=not args.new_only,
+                idle_timeout=args.idle_timeout,
+            ):
+                print(format_record(run_id, kind, data), flush=True)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        except KeyboardInterrupt:
+            pass
+        return 0
+    
+    elif args.command == "export-run":
+        try:
+            content = export_run(args.run_id, output=args.output)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        
+        if args.output is None:
+            print(content, end="")
+        else:
+            print(f"OK: Run log geëxporteerd naar {args.output}")
+        return 0
+    
     elif args.command == "cleanup-logs":
-        deleted_count = cleanup_logs()
-        print(f"OK: {deleted_count} log(s) verwijderd")
+        cleanup = cleanup_logs()
+        print(f"OK: {cleanup.archived} run(s) gearchiveerd, {cleanup.deleted} run(s) verwijderd")
+        return 0
+    
+    elif args.command == "list-runs":
+        entries = list_runs(
+            agent=args.agent,
+            status=args.status,
+            since=args.since,
+            limit=args.limit,
+        )
+        for entry in entries:
+            started = (
+                datetime.fromtimestamp(entry.started_at).strftime("%Y-%m-%d %H:%M:%S")
+                if entry.started_at
+                else "-"
+            )
+            print(
+                f"{entry.run_id}  {entry.agent or '-':<24}  "
+                f"{entry.status or 'open':<8}  {started}  {entry.size or 0}B"
+            )
+        print(f"OK: {len(entries)} run(s) gevonden")
+        return 0
+    
+    elif args.command == "corpus-status":
+        started = time.perf_counter()
+        try:
+            scan = fingerprint_corpus(update=args.update)
+        except OSError as e:
+            print(f"ERROR: Normatief corpus niet leesbaar: {e}", file=sys.stderr)
+            return 1
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        print(f"Corpus : {', '.join(NORMATIEF_CORPUS_DIRS)}")
+        print(f"Digest : {scan.digest.root}")
+        print(f"Bestanden: {len(scan.digest.files)} (opnieuw gehasht: {scan.rehashed})")
+        if scan.baseline:
+            print("Nog geen snapshot; huidige stand is de basislijn")
+            print("OK: basislijn vastgesteld" if args.update else "OK: geen basislijn")
+            return 0
+        for label, paths in (
+            ("toegevoegd", scan.changes.added),
+            ("gewijzigd", scan.changes.modified),
+            ("verwijderd", scan.changes.removed),
+        ):
+            for path in paths:
+                print(f"  {label:<10} {path}")
+        print(f"OK: {len(scan.changes.paths)} wijziging(en) in {elapsed_ms:.1f} ms")
+        return 0
+    
+    elif args.command == "stats":
+        stats = run_stats(agent=args.agent, since=args.since, limit=args.limit)
+        if args.json:
+            print(json.dumps(stats, indent=2))
+            return 0
+        
+        for title, key in (("Per fase", "phases"), ("Per agent", "agents")):
+            print(f"{title} (ms):")
+            print(f"  {'':<40} {'n':>6} {'p50':>10} {'p95':>10} {'p99':>10}")
+            for name, row in sorted(stats[key].items()):
+                print(
+                    f"  {name:<40} {row['n']:>6} {row['p50']:>10.3f} "
+                    f"{row['p95']:>10.3f} {row['p99']:>10.3f}"
+                )
+            print()
+        print(f"OK: {stats['runs']} run(s) met timing")
+        return 0
+    
+    elif args.command == "reindex-runs":
+        indexed = reindex_runs()
+        print(f"OK: {indexed} run(s) geïndexeerd")
+        return 0
+    
+    elif args.command == "serve":
+        from kernel.client import default_socket_path
+        from kernel.daemon import DaemonError, serve
+        
+        socket_path = args.socket or default_socket_path(WORKSPACE_ROOT)
+        daemon = KernelDaemon()
+        try:
+            daemon.state()
+        except PreflightError as e:
+            print(f"ERROR: Preflight gefaald: {e}", file=sys.stderr)
+            return 1
+        
+        print(f"Kernel-daemon start op {socket_path}", flush=True)
+        try:
+            serve(socket_path, daemon.operations())
+        except DaemonError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        print("OK: Kernel-daemon gestopt")
         return 0
     
     else:
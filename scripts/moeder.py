@@ -31,8 +31,8 @@ from moeder.frontdoor import run_frontdoor
 WORKSPACE_ROOT = Path(__file__).parent.parent
 
 
-def main() -> int:
-    result = run_frontdoor(workspace_root=WORKSPACE_ROOT)
+def main(argv: list[str] | None = None) -> int:
+    result = run_frontdoor(workspace_root=WORKSPACE_ROOT, argv=argv)
 
     if result.success:
         print(f"OK: {result.message}")
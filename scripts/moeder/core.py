@@ -129,18 +129,18 @@ def op_orden_workspace(
     check_only: bool,
     scope: str | None,
 ) -> OperationResult:
-        """Operatie: orden-workspace
-    
-        Ordent workspace structuur, naamgeving en markdown.
-        Scope opties: structure, names, markdown, docs-resultaten, github-prompts.
+    """Operatie: orden-workspace
+
+    Ordent workspace structuur, naamgeving en markdown.
+    Scope opties: structure, names, markdown, docs-resultaten, github-prompts.
 
-        Bij alle acties waarbij bestanden worden verplaatst, hanteert Moeder
-        **single source of truth**:
+    Bij alle acties waarbij bestanden worden verplaatst, hanteert Moeder
+    **single source of truth**:
 
-        - bestanden worden daadwerkelijk **verplaatst** (bijvoorbeeld met `git mv`);
-        - er blijven geen kopieën van hetzelfde bronbestand achter op de oude
-            locatie of in andere workspaces.
-        """
+    - bestanden worden daadwerkelijk **verplaatst** (bijvoorbeeld met `git mv`);
+    - er blijven geen kopieën van hetzelfde bronbestand achter op de oude
+        locatie of in andere workspaces.
+    """
     _policy_gate_workspace_paths(workspace_root)
     _policy_gate_governance_exists(workspace_root)
     
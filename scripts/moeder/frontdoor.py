@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from moeder.core import PolicyError, execute_operation
-
 
 @dataclass(frozen=True)
 class FrontdoorResult:
@@ -120,9 +118,11 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def run_frontdoor(*, workspace_root: Path) -> FrontdoorResult:
+def run_frontdoor(*, workspace_root: Path, argv: list[str] | None = None) -> FrontdoorResult:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    # Core pas na het parsen laden: --help en parse-fouten blijven snel
+    from moeder.core import PolicyError, execute_operation
 
     operation: str = args.operation
     opdracht: str = args.opdracht
@@ -26,12 +26,15 @@ Traceability:
 from __future__ import annotations
 
 import argparse
-import ast
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import NamedTuple
 
+from cli_bootstrap import lazy_import
+
+ast = lazy_import("ast")
+
 
 WORKSPACE_ROOT = Path(__file__).parent.parent
 
@@ -265,10 +268,10 @@ Input parameters:
         )
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point voor de runner."""
     try:
-        args = parse_args()
+        args = parse_args(argv)
     except SystemExit as e:
         return e.code if isinstance(e.code, int) else 1
     
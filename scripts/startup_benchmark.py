@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Startup Benchmark voor de runner scripts
+
+Meet per runner de opstarttijd van ``<runner> --help`` met
+``python -X importtime`` en bewaakt een budget. Bedoeld voor CI: de
+runners worden daar per pipeline honderden keren gestart, dus een zware
+top-level import kost direct merkbaar tijd.
+
+Usage:
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --budget-ms 80 --top 5
+    python scripts/startup_benchmark.py kernelrunner.py moeder.py
+
+Per runner wordt het beste van ``--repeat`` metingen genomen (ruis van de
+eerste start, page cache). Gerapporteerd worden:
+- wall: totale procesduur inclusief interpreter-start
+- imports: cumulatieve importtijd van de modules die het script laadt
+- de duurste top-level imports, om regressies snel te herleiden
+
+Het budget geldt voor ``imports``: de interpreter-start zelf en het
+compileren van het script (dat, anders dan modules, niet in
+``__pycache__`` belandt) vallen buiten de invloed van de runner.
+
+Exit code 1 als een runner boven het budget uitkomt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+
+SCRIPTS_DIR = Path(__file__).parent
+
+RUNNERS = (
+    "kernelrunner.py",
+    "canon-curator.py",
+    "moeder.py",
+    "agent-smeder.py",
+    "python-expert.py",
+    "canon.py",
+)
+
+# Ruim boven de gemeten 30-50 ms, zodat een drukke CI-runner geen vals
+# alarm geeft; verschuivingen in de top-imports zijn de fijnere signalen
+DEFAULT_BUDGET_MS = 80.0
+DEFAULT_REPEAT = 5
+
+# Modules die de interpreter zelf al laadt; die tellen niet mee
+_INTERPRETER_MODULES = frozenset({
+    "_frozen_importlib", "_imp", "_thread", "_warnings", "_weakref", "_io",
+    "marshal", "posix", "_frozen_importlib_external", "time", "zipimport",
+    "_codecs", "codecs", "encodings.aliases", "encodings", "encodings.utf_8",
+    "_signal", "_abc", "abc", "io", "__main__", "_stat", "stat",
+    "_collections_abc", "genericpath", "posixpath", "os.path", "os",
+    "_sitebuiltins", "_distutils_hack", "site", "sitecustomize", "usercustomize",
+})
+
+
+class StartupMeasurement(NamedTuple):
+    """Beste meting van één runner."""
+    runner: str
+    wall_ms: float
+    import_ms: float
+    top_imports: list[tuple[str, float]]
+
+
+def _parse_importtime(stderr: str) -> tuple[float, list[tuple[str, float]]]:
+    """Cumulatieve importtijd en top-level imports uit ``-X importtime``.
+
+    Regels hebben de vorm ``import time: self | cumulative | <indent>module``;
+    alleen regels zonder inspringing zijn top-level imports.
+    """
+    total_us = 0
+    top: list[tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # kopregel
+        name = parts[2]
+        if name.startswith("  ") or name.strip() in _INTERPRETER_MODULES:
+            continue
+        total_us += cumulative_us
+        top.append((name.strip(), cumulative_us / 1000))
+    top.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000, top
+
+
+def measure(runner: str, repeat: int = DEFAULT_REPEAT) -> StartupMeasurement:
+    """Meet ``<runner> --help`` en geef de snelste van ``repeat`` runs.
+
+    Raises
+    ------
+    RuntimeError
+        Als de runner met een fout eindigt
+    """
+    script = SCRIPTS_DIR / runner
+    best: StartupMeasurement | None = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", str(script), "--help"],
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"{runner} --help faalde (exit {proc.returncode}): {proc.stderr.strip()[-500:]}"
+            )
+        import_ms, top = _parse_importtime(proc.stderr)
+        if best is None or import_ms < best.import_ms:
+            best = StartupMeasurement(runner, wall_ms, import_ms, top)
+    assert best is not None
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Meet de opstarttijd van de runners (--help) en bewaak een budget"
+    )
+    parser.add_argument(
+        "runners",
+        nargs="*",
+        default=list(RUNNERS),
+        help="Runner scripts (default: alle runners)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"Maximale importtijd per runner in ms (default: {DEFAULT_BUDGET_MS:g})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Aantal metingen per runner; de snelste telt (default: {DEFAULT_REPEAT})",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=3,
+        help="Aantal duurste top-level imports per runner (default: 3)",
+    )
+    args = parser.parse_args(argv)
+
+    over_budget: list[str] = []
+    print(f"{'runner':<20} {'wall':>9} {'imports':>9}  status")
+    for runner in args.runners:
+        try:
+            result = measure(runner, args.repeat)
+        except (OSError, RuntimeError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        status = "ok"
+        if result.import_ms > args.budget_ms:
+            status = "OVER BUDGET"
+            over_budget.append(runner)
+        print(f"{runner:<20} {result.wall_ms:>7.1f}ms {result.import_ms:>7.1f}ms  {status}")
+        for name, ms in result.top_imports[: args.top]:
+            print(f"{'':<20} {'':>9} {ms:>7.1f}ms    {name}")
+
+    if over_budget:
+        print(
+            f"ERROR: {len(over_budget)} runner(s) boven budget van {args.budget_ms:g}ms: "
+            + ", ".join(over_budget),
+            file=sys.stderr,
+        )
+        return 1
+    print(f"OK: alle runners binnen budget van {args.budget_ms:g}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -203,7 +203,7 @@ def _write_trace(
     return trace_path
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Vertaler runner: validatie en vertaling-skeleton creatie"
     )
@@ -249,7 +249,7 @@ def main() -> int:
         help="Schrijf geen trace artefact weg",
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     workspace_root = Path(__file__).parent.parent.resolve()
     